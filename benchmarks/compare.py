@@ -0,0 +1,50 @@
+"""
+Compares two result files of `benchmarks.domain_benchmark`.
+
+Prints the time per operation of both runs for every size and operation
+they have in common, and the ratio of the new time to the base time, so a
+ratio above 1 is a slowdown.
+
+Run from the repository root:
+
+    python -m benchmarks.compare base.json new.json [--threshold 1.2]
+"""
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict[tuple[int, str], float]:
+    """Reads the time per operation of every size and operation of a result file."""
+    with open(path, encoding="utf-8") as file:
+        report = json.load(file)
+    return {
+        (result["size"], result["operation"]): result["per_op_us"]
+        for result in report["results"]
+    }
+
+
+def main() -> None:
+    """Prints the comparison and exits with 1 if an operation slowed down beyond the threshold."""
+    parser = argparse.ArgumentParser(description="Compares two benchmark result files.")
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="fail when the ratio of an operation exceeds this value")
+    args = parser.parse_args()
+
+    base, new = load(args.base), load(args.new)
+    regressed = False
+    print(f"{'size':>9} {'operation':<24} {'base us':>12} {'new us':>12} {'ratio':>7}")
+    for key in sorted(base.keys() & new.keys()):
+        ratio = new[key] / base[key] if base[key] > 0 else float("inf")
+        marker = ""
+        if args.threshold is not None and ratio > args.threshold:
+            regressed, marker = True, "  !"
+        print(f"{key[0]:>9} {key[1]:<24} {base[key]:12.2f} {new[key]:12.2f} {ratio:7.2f}{marker}")
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Generates reproducible synthetic contacts, notes and command lines for the
+benchmarks.
+
+The data is drawn from a seeded random generator, so two runs with the same
+seed and size build exactly the same contact book and notes. Names are made
+of random syllables followed by a sequence number, so they are unique but
+still share trigrams the way real names do; notes use a small vocabulary of
+words and tags, so text and tag searches match a realistic share of them.
+"""
+import random
+from itertools import accumulate
+from dataclasses import dataclass
+
+from src.domain.contact.birthday import Birthday
+from src.domain.contact.contact import Contact
+from src.domain.contact.email import Email
+from src.domain.contact.name import Name
+from src.domain.contact.phone import Phone
+from src.domain.note.content import Content
+from src.domain.note.note import Note
+from src.domain.note.tags import Tags
+from src.domain.note.topic import Topic
+
+SYLLABLES = ["an", "bel", "cor", "da", "el", "fin", "gor", "ha", "is", "jo",
+             "ka", "lin", "mar", "no", "ol", "pe", "ra", "sam", "tu", "vi"]
+DOMAINS = ["example.com", "mail.org", "corp.net", "school.edu", "post.io", "inbox.dev"]
+WORDS = ["meeting", "budget", "travel", "book", "idea", "call", "report", "garden",
+         "recipe", "project", "invoice", "holiday", "review", "music", "doctor", "plan",
+         "shopping", "birthday", "deadline", "draft", "release", "bug", "design", "lunch"]
+VOCABULARY_SIZE = 5_000
+TAGS = ["work", "home", "ideas", "todo", "travel", "books", "health", "money",
+        "family", "urgent", "later", "music"]
+
+
+@dataclass(frozen=True)
+class ContactRecord:
+    """The raw values of one generated contact."""
+    name: str
+    phones: tuple[str, ...]
+    email: str
+    birthday: str
+
+    def build(self) -> Contact:
+        """Builds the contact from the raw values."""
+        contact = Contact(Name(self.name))
+        for phone in self.phones:
+            contact.phones.add(Phone(phone))
+        contact.emails.add(Email(self.email))
+        contact.add_birthday(Birthday(self.birthday))
+        return contact
+
+
+@dataclass(frozen=True)
+class NoteRecord:
+    """The raw values of one generated note."""
+    topic: str
+    content: str
+    tags: str
+
+    def build(self) -> Note:
+        """Builds the note from the raw values."""
+        return Note(Topic(self.topic), Content(self.content), Tags.from_string(self.tags))
+
+
+class DataGenerator:
+    """A seeded generator of contacts, notes, search templates and command lines."""
+
+    def __init__(self, seed: int = 0):
+        self.__rng = random.Random(seed)
+        vocabulary = dict.fromkeys(WORDS)
+        while len(vocabulary) < VOCABULARY_SIZE:
+            vocabulary["".join(self.__rng.choice(SYLLABLES) for _ in range(3))] = None
+        self.__vocabulary = list(vocabulary)
+        ranks = range(1, len(self.__vocabulary) + 1)
+        self.__cum_weights = list(accumulate(1 / rank for rank in ranks))
+
+    def contacts(self, count: int) -> list[ContactRecord]:
+        """Generates the given number of contacts with unique names."""
+        rng = self.__rng
+        records = []
+        for number in range(count):
+            name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+            phones = tuple(f"{rng.randrange(10 ** 9, 10 ** 10)}" for _ in range(rng.randint(1, 2)))
+            email = f"{name.lower()}{number}@{rng.choice(DOMAINS)}"
+            birthday = (f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}."
+                        f"{rng.randint(1950, 2010)}")
+            records.append(ContactRecord(f"{name} {number}", phones, email, birthday))
+        return records
+
+    def notes(self, count: int) -> list[NoteRecord]:
+        """Generates the given number of notes with unique topics."""
+        rng = self.__rng
+        records = []
+        for number in range(count):
+            words = rng.choices(self.__vocabulary, cum_weights=self.__cum_weights,
+                                k=rng.randint(5, 30))
+            content = " ".join(words)
+            tags = ",".join(rng.sample(TAGS, rng.randint(1, 3)))
+            records.append(NoteRecord(f"{rng.choice(WORDS)} {number}", content, tags))
+        return records
+
+    def name_templates(self, contacts: list[ContactRecord], count: int) -> list[str]:
+        """Picks substrings of the names of random contacts."""
+        templates = []
+        for record in self.__rng.choices(contacts, k=count):
+            start = self.__rng.randrange(0, max(1, len(record.name) - 4))
+            templates.append(record.name[start:start + 4])
+        return templates
+
+    def phone_templates(self, contacts: list[ContactRecord], count: int) -> list[str]:
+        """Picks six-digit substrings of the phone numbers of random contacts."""
+        templates = []
+        for record in self.__rng.choices(contacts, k=count):
+            phone = self.__rng.choice(record.phones)
+            start = self.__rng.randrange(0, len(phone) - 6)
+            templates.append(phone[start:start + 6])
+        return templates
+
+    def words(self, count: int) -> list[str]:
+        """Picks words of the note vocabulary, all of them equally likely."""
+        return self.__rng.choices(self.__vocabulary, k=count)
+
+    def tags(self, count: int) -> list[str]:
+        """Picks random tags of the note vocabulary."""
+        return self.__rng.choices(TAGS, k=count)
+
+    def sample(self, items: list, count: int) -> list:
+        """Picks random items, with repetition."""
+        return self.__rng.choices(items, k=count)
+
+    def distinct_sample(self, items: list, count: int) -> list:
+        """
+        Picks distinct random items from the whole list in random order, the
+        last one always among them, so removals hit the head, the middle and
+        the tail alike.
+        """
+        count = min(count, len(items))
+        if count == 0:
+            return []
+        positions = self.__rng.sample(range(len(items) - 1), count - 1)
+        positions.append(len(items) - 1)
+        self.__rng.shuffle(positions)
+        return [items[position] for position in positions]
+
+    def command_lines(self, notes: list[NoteRecord], count: int) -> list[str]:
+        """Generates add-note command lines with quoted contents."""
+        return [
+            f"add-note '{record.topic}' '{record.content}' --tags {record.tags}"
+            for record in self.sample(notes, count)
+        ]
@@ -0,0 +1,208 @@
+"""
+Times the operations of the domain layer on synthetic data of growing size.
+
+For every size the suite builds a contact book and notes from the seeded
+`DataGenerator` and times adding, finding and deleting contacts, the name,
+phone and email searches, adding and deleting notes, the tag and text
+searches of the notes, and parsing command lines. Each operation is timed
+over a fixed number of queries, so the time per operation stays comparable
+between sizes.
+
+The results are written as JSON, together with the Python version, the
+platform and the git commit, so runs can be compared with
+`benchmarks.compare`.
+
+Run from the repository root:
+
+    python -m benchmarks.domain_benchmark [--sizes 10000,100000,1000000] [--output results.json]
+"""
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from benchmarks.data_generator import DataGenerator
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.email_search_template import EmailSearchTemplate
+from src.domain.contact.name import Name
+from src.domain.contact.name_search_template import NameSearchTemplate
+from src.domain.contact.phone_number_search_template import PhoneNumberSearchTemplate
+from src.domain.note.notes import Notes
+from src.domain.note.tag import Tag
+from src.domain.note.topic import Topic
+from src.parser.parser import parse
+
+DEFAULT_SIZES = [10_000]
+QUERIES = 1_000
+
+
+def timed(results: list[dict[str, Any]], size: int, operation: str, count: int,
+          operation_fn: Callable[[], Any]) -> Any:
+    """
+    Runs the operation once and appends its timing to the results.
+
+    The garbage collector is disabled while the operation runs, so a
+    collection triggered by earlier allocations does not distort it.
+
+    :param results: The list of results to append to.
+    :param size: The number of contacts and notes of the run.
+    :param operation: The name of the operation.
+    :param count: How many operations `operation_fn` performs.
+    :param operation_fn: The function that performs the operations.
+    :return: What `operation_fn` returned.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter_ns()
+        value = operation_fn()
+        elapsed = time.perf_counter_ns() - started
+    finally:
+        gc.enable()
+    results.append({
+        "size": size,
+        "operation": operation,
+        "count": count,
+        "total_s": elapsed / 1e9,
+        "per_op_us": elapsed / count / 1000,
+    })
+    return value
+
+
+def run_contacts(results: list[dict[str, Any]], size: int, generator: DataGenerator,
+                 queries: int) -> None:
+    """Times the operations of the contact book."""
+    records = generator.contacts(size)
+    contacts = [record.build() for record in records]
+
+    def add() -> ContactBook:
+        contact_book = ContactBook()
+        for contact in contacts:
+            contact_book.add(contact)
+        return contact_book
+
+    contact_book = timed(results, size, "contact.add", size, add)
+
+    names = [Name(record.name) for record in generator.sample(records, queries)]
+    timed(results, size, "contact.find", queries,
+          lambda: [contact_book.find(name) for name in names])
+
+    name_templates = [NameSearchTemplate(value)
+                      for value in generator.name_templates(records, queries)]
+    timed(results, size, "contact.find_by_name", queries,
+          lambda: [contact_book.find_by_name(template) for template in name_templates])
+
+    phone_templates = [PhoneNumberSearchTemplate(value)
+                       for value in generator.phone_templates(records, queries)]
+    timed(results, size, "contact.find_by_phone", queries,
+          lambda: [contact_book.find_by_phone(template) for template in phone_templates])
+
+    email_templates = [EmailSearchTemplate(record.email)
+                       for record in generator.sample(records, queries)]
+    timed(results, size, "contact.find_by_email", queries,
+          lambda: [contact_book.find_by_email(template) for template in email_templates])
+
+    deleted = [Name(record.name) for record in generator.distinct_sample(records, queries)]
+    timed(results, size, "contact.delete", len(deleted),
+          lambda: [contact_book.delete(name) for name in deleted])
+
+
+def run_notes(results: list[dict[str, Any]], size: int, generator: DataGenerator,
+              queries: int) -> None:
+    """Times the operations of the notes and the parser."""
+    records = generator.notes(size)
+    built = [record.build() for record in records]
+
+    def add() -> Notes:
+        notes = Notes()
+        for note in built:
+            notes.add(note)
+        return notes
+
+    notes = timed(results, size, "note.add", size, add)
+
+    topics = [Topic(record.topic) for record in generator.sample(records, queries)]
+    timed(results, size, "note.find", queries,
+          lambda: [notes.find(topic) for topic in topics])
+
+    tags = [[Tag(tag)] for tag in generator.tags(queries)]
+    timed(results, size, "note.find_by_tags", queries,
+          lambda: [notes.find_by_tags(tag) for tag in tags])
+
+    words = generator.words(queries)
+    timed(results, size, "note.find_by_text", queries,
+          lambda: [notes.find_by_text(word, limit=10) for word in words])
+
+    deleted = [Topic(record.topic) for record in generator.distinct_sample(records, queries)]
+    timed(results, size, "note.delete", len(deleted),
+          lambda: [notes.remove(topic) for topic in deleted])
+
+    lines = generator.command_lines(records, queries)
+    timed(results, size, "parser.parse", queries,
+          lambda: [parse(line) for line in lines])
+
+
+def git_commit() -> str | None:
+    """Returns the commit of the working tree, or None outside a git checkout."""
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                   capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def run(sizes: list[int], seed: int, queries: int) -> dict[str, Any]:
+    """
+    Runs the suite for every size.
+
+    :return: The environment of the run and one result per size and operation.
+    """
+    results: list[dict[str, Any]] = []
+    for size in sizes:
+        run_contacts(results, size, DataGenerator(seed), queries)
+        run_notes(results, size, DataGenerator(seed), queries)
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "seed": seed,
+            "queries": queries,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Runs the benchmark and writes the results."""
+    parser = argparse.ArgumentParser(description="Benchmarks the domain layer on synthetic data.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated numbers of contacts and notes, "
+                             "for example 10000,100000,1000000")
+    parser.add_argument("--queries", type=int, default=QUERIES,
+                        help="the number of queries per operation")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the data generator")
+    parser.add_argument("--output", help="the JSON file to write, the standard output by default")
+    args = parser.parse_args()
+
+    report = run([int(size) for size in args.sizes.split(",")], args.seed, args.queries)
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output is None:
+        sys.stdout.write(text)
+        return
+    with open(args.output, "w", encoding="utf-8") as file:
+        file.write(text)
+    for result in report["results"]:
+        print(f"{result['size']:>9} {result['operation']:<24} {result['per_op_us']:12.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Measures the contention of the reader-writer lock used for command dispatch.
+
+Reader threads look contacts up by name and by phone number, while one writer
+thread adds contacts, with the work guarded either by `ReadWriteLock` (reads
+shared, writes exclusive) or by a single `threading.Lock` (everything
+exclusive). Every reader also waits briefly inside the lock, standing for
+the I/O of a server request, so the effect of letting readers in together
+shows even with the GIL.
+
+Run from the repository root:
+
+    python -m benchmarks.lock_benchmark
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, ContextManager
+
+from src.domain.contact.contact import Contact
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.domain.contact.name_search_template import NameSearchTemplate
+from src.domain.contact.phone import Phone
+from src.domain.contact.phone_number_search_template import PhoneNumberSearchTemplate
+from src.util.read_write_lock import ReadWriteLock
+
+CONTACTS = 10_000
+READERS = 8
+DURATION = 2.0
+READ_PAUSE = 0.0005
+WRITE_INTERVAL = 0.001
+
+
+def build_contact_book() -> ContactBook:
+    """Builds a contact book with phone numbers."""
+    contact_book = ContactBook()
+    for number in range(CONTACTS):
+        contact = Contact(Name(f"user{number}"))
+        contact.phones.add(Phone(f"{number:010d}"))
+        contact_book.add(contact)
+    return contact_book
+
+
+def run(read_lock: Callable[[], ContextManager],
+        write_lock: Callable[[], ContextManager]) -> tuple[int, int]:
+    """Runs the readers and the writer and returns the numbers of reads and writes."""
+    contact_book = build_contact_book()
+    stop = threading.Event()
+    reads = [0] * READERS
+    writes = [0]
+
+    def reader(index: int) -> None:
+        number = index
+        while not stop.is_set():
+            with read_lock():
+                contact_book.find(Name(f"user{number % CONTACTS}"))
+                contact_book.find_by_name(NameSearchTemplate(f"user{number % 997}"))
+                contact_book.find_by_phone(PhoneNumberSearchTemplate(f"{number % 9973:04d}"))
+                time.sleep(READ_PAUSE)
+            reads[index] += 1
+            number += READERS
+
+    def writer() -> None:
+        number = CONTACTS
+        while not stop.is_set():
+            with write_lock():
+                contact_book.add(Contact(Name(f"user{number}")))
+            writes[0] += 1
+            number += 1
+            time.sleep(WRITE_INTERVAL)
+
+    threads = [threading.Thread(target=reader, args=(index,)) for index in range(READERS)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(reads), writes[0]
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results."""
+    rw_lock = ReadWriteLock()
+    mutex = threading.Lock()
+
+    @contextmanager
+    def exclusive():
+        with mutex:
+            yield
+
+    print(f"{READERS} readers, 1 writer, {DURATION:.0f} s, {CONTACTS} contacts")
+    for label, read_lock, write_lock in (
+            ("threading.Lock", exclusive, exclusive),
+            ("ReadWriteLock ", rw_lock.read, rw_lock.write),
+    ):
+        reads, writes = run(read_lock, write_lock)
+        print(f"{label}: {reads / DURATION:10.0f} reads/s {writes / DURATION:10.0f} writes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Measures the memory taken by the contacts of a contact book and by notes.
+
+Every contact has a name, two phone numbers, an email address on one of a few
+shared domains and a birthday; every note has a topic, a content and tags from
+a small vocabulary. The memory is measured with tracemalloc, including the
+indexes kept by `ContactBook` and `Notes`.
+
+Run from the repository root:
+
+    python -m benchmarks.memory_benchmark [count]
+"""
+import gc
+import sys
+import tracemalloc
+
+from src.domain.contact.birthday import Birthday
+from src.domain.contact.contact import Contact
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.email import Email
+from src.domain.contact.name import Name
+from src.domain.contact.phone import Phone
+from src.domain.note.content import Content
+from src.domain.note.note import Note
+from src.domain.note.notes import Notes
+from src.domain.note.tags import Tags
+from src.domain.note.topic import Topic
+
+DOMAINS = ["example.com", "mail.org", "corp.net", "school.edu"]
+TAGS = ["work", "home", "ideas", "todo", "travel", "books"]
+
+
+def build_contact(number: int) -> Contact:
+    """Builds one contact."""
+    contact = Contact(Name(f"user{number}"))
+    contact.phones.add(Phone(f"{number:010d}"))
+    contact.phones.add(Phone(f"{number + 1:012d}"))
+    # Split and joined again, so every domain string is a separate object
+    # as it would be when read from a file.
+    domain = "".join(list(DOMAINS[number % len(DOMAINS)]))
+    contact.emails.add(Email(f"user{number}@{domain}"))
+    contact.add_birthday(Birthday(f"{number % 28 + 1:02d}.{number % 12 + 1:02d}.1990"))
+    return contact
+
+
+def build_contacts(count: int) -> list[Contact]:
+    """Builds the given number of contacts without a contact book."""
+    return [build_contact(number) for number in range(count)]
+
+
+def build_contact_book(count: int) -> ContactBook:
+    """Builds a contact book with the given number of contacts."""
+    contact_book = ContactBook()
+    for number in range(count):
+        contact_book.add(build_contact(number))
+    return contact_book
+
+
+def build_notes(count: int) -> Notes:
+    """Builds notes with the given number of notes."""
+    notes = Notes()
+    for number in range(count):
+        tags = Tags.from_string(
+            ",".join("".join(list(TAGS[(number + shift) % len(TAGS)])) for shift in range(2))
+        )
+        notes.add(Note(Topic(f"topic{number}"), Content(f"content of note {number}"), tags))
+    return notes
+
+
+def measure(build, count: int) -> float:
+    """Returns the number of bytes allocated per built item."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return (after - before) / count
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"{count} items")
+    print(f"bytes per contact:                 {measure(build_contacts, count):10.0f}")
+    print(f"bytes per contact in contact book: {measure(build_contact_book, count):10.0f}")
+    print(f"bytes per note in notes:           {measure(build_notes, count):10.0f}")
+
+
+if __name__ == "__main__":
+    main()
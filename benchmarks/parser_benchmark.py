@@ -0,0 +1,62 @@
+"""
+Compares the regex-based tokenizer with the character-by-character
+`LexemesBuilder` on add-note commands with 512-character note bodies.
+
+Run from the repository root:
+
+    python -m benchmarks.parser_benchmark
+"""
+import random
+import string
+import timeit
+
+from src.parser.lexemes_builder import LexemesBuilder
+from src.parser.tokenizer import tokenize
+
+BODY_LENGTH = 512
+LINES = 200
+REPEAT = 5
+NUMBER = 20
+
+
+def build_lexemes(input_line: str) -> list[str]:
+    """Splits the input line into lexemes with the character-by-character builder."""
+    builder = LexemesBuilder()
+    for char in input_line:
+        builder.append_char(char)
+    return builder.build()
+
+
+def generate_lines(count: int, body_length: int, seed: int = 0) -> list[str]:
+    """Generates add-note commands with quoted bodies of the given length."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + "     ,.!"
+    lines = []
+    for number in range(count):
+        body = "".join(rng.choice(alphabet) for _ in range(body_length))
+        lines.append(f"add-note topic-{number} '{body}' --tags work,ideas")
+    return lines
+
+
+def measure(split, lines: list[str]) -> float:
+    """Returns the best time in microseconds to split one line."""
+    timer = timeit.Timer(lambda: [split(line) for line in lines])
+    best = min(timer.repeat(repeat=REPEAT, number=NUMBER))
+    return best / (NUMBER * len(lines)) * 1_000_000
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results."""
+    lines = generate_lines(LINES, BODY_LENGTH)
+    assert all(tokenize(line) == build_lexemes(line) for line in lines)
+
+    builder_time = measure(build_lexemes, lines)
+    tokenizer_time = measure(tokenize, lines)
+    print(f"body length: {BODY_LENGTH} characters, {LINES} lines")
+    print(f"LexemesBuilder: {builder_time:10.2f} us/line")
+    print(f"tokenize:       {tokenizer_time:10.2f} us/line")
+    print(f"speed-up:       {builder_time / tokenizer_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
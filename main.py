@@ -5,15 +5,56 @@ This module contains the main entry point of the program, designed to initialize
 and execute the core functionality of the application. It ensures that the primary
 logic is invoked only when the module is run as the main script.
 """
+import argparse
+import sys
+from pathlib import Path
 
+from src.output.output import RENDERERS, select_renderer
 from src.personal_assistant import PersonalAssistant
+from src.storage.storage import Storage
 
 
 def main() -> None:
     """
     The main entry point of the application that initializes and executes the program.
     """
-    PersonalAssistant().run()
+    parser = argparse.ArgumentParser(description="Personal assistant.")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="execute the commands of a script file ('-' for stdin) "
+                             "without prompts")
+    parser.add_argument("--serve", metavar="SOCKET",
+                        help="serve the command protocol on a Unix socket at the given path")
+    parser.add_argument("--format", choices=["auto", *RENDERERS],
+                        default="auto",
+                        help="how to render the output; 'auto' uses rich on a terminal "
+                             "and plain text otherwise")
+    parser.add_argument("--startup-times", action="store_true",
+                        help="print how long each phase of the startup took to stderr")
+    args = parser.parse_args()
+    select_renderer(None if args.format == "auto" else args.format)
+
+    assistant = PersonalAssistant(Storage(Storage.default_directory()))
+    if args.startup_times:
+        for phase, seconds in assistant.startup_timings.items():
+            print(f"{phase}: {seconds * 1000:.2f} ms", file=sys.stderr)
+    if args.serve is not None:
+        # The server modules are only needed in server mode.
+        import asyncio  # pylint: disable=import-outside-toplevel
+        from src.server.command_server import CommandServer  # pylint: disable=import-outside-toplevel
+
+        try:
+            asyncio.run(CommandServer(assistant, Path(args.serve)).serve())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            assistant.close()
+    elif args.batch is None:
+        assistant.run()
+    elif args.batch == "-":
+        sys.exit(1 if assistant.run_batch(sys.stdin) > 0 else 0)
+    else:
+        with open(args.batch, "r", encoding="utf-8") as script:
+            sys.exit(1 if assistant.run_batch(script) > 0 else 0)
 
 
 if __name__ == '__main__':
@@ -7,20 +7,39 @@ command and the number of arguments. It also contains a method to retrieve
 a descriptive help string for the command.
 """
 
-import rich
-from rich.table import Table
-
 from src.command.command_argument import CommandArgument
+from src.output.cached_table import CachedTable
+from src.output.column import Column
+from src.output.output import renderer
+from src.output.table import Table
 from src.util.colorize import cmd_color, arg_color
 
 
 class CommandDefinition:
-    """Represents a command definition with a name and associated arguments."""
+    """
+    Represents a command definition with a name and associated arguments.
+
+    The definition never changes, so the number of mandatory arguments is
+    counted once, and the usage is built on first use and shown from a
+    cache afterwards.
+    """
 
-    def __init__(self, name: str, description: str | None, *args: CommandArgument):
+    def __init__(self, name: str, description: str | None, *args: CommandArgument,
+                 is_paged: bool = False):
+        """
+        :param name: The name of the command.
+        :param description: The description of the command.
+        :param args: The positional arguments of the command.
+        :param is_paged: Whether the command lists results and accepts the
+            "--limit" and "--offset" options.
+        """
         self.__name = name
         self.__description = description
         self.__args = args
+        self.__is_paged = is_paged
+        self.__count_mandatory_args = sum(1 for arg in args if arg.is_required)
+        self.__usage_line: str | None = None
+        self.__usage_table = CachedTable(self.__build_usage_table)
 
     @property
     def name(self) -> str:
@@ -32,14 +51,15 @@ class CommandDefinition:
         """Returns the description of the command."""
         return self.__description
 
+    @property
+    def is_paged(self) -> bool:
+        """Returns whether the command accepts the "--limit" and "--offset" options."""
+        return self.__is_paged
+
     @property
     def count_mandatory_args(self) -> int:
-        """Returns the number of the command arguments."""
-        count = 0
-        for arg in self.__args:
-            if arg.is_required:
-                count += 1
-        return count
+        """Returns the number of the mandatory command arguments."""
+        return self.__count_mandatory_args
 
     @property
     def count_all_args(self) -> int:
@@ -48,17 +68,29 @@ class CommandDefinition:
 
     def show_usage(self):
         """Returns a formatted string representation of the command definition."""
-        rich.print(
-            f"usage: {cmd_color(self.__name)} "
-            f"{" ".join(map(lambda a: CommandDefinition.__arg_name_format(a), self.__args))}"
+        if self.__usage_line is None:
+            self.__usage_line = (
+                f"usage: {cmd_color(self.__name)} "
+                f"{" ".join(map(lambda a: CommandDefinition.__arg_name_format(a), self.__args))}"
+                f"{" [--limit N] [--offset N]" if self.__is_paged else ""}"
+            )
+        renderer().print(self.__usage_line)
+        if len(self.__args) > 0 or self.__is_paged:
+            self.__usage_table.show()
+
+    def __build_usage_table(self) -> Table:
+        """Builds the table of the arguments and their descriptions."""
+        table = Table(
+            Column("Arguments", style="blue", no_wrap=True),
+            Column("Description", style="yellow"),
+            show_header=False, bordered=False,
         )
-        if len(self.__args) > 0:
-            table = Table(box=None, show_header=False)
-            table.add_column("Arguments", justify="left", style="blue", no_wrap=True)
-            table.add_column("Description", justify="left", style="yellow")
-            for arg in self.__args:
-                table.add_row(" - " + arg.name, arg.description)
-            rich.print(table)
+        for arg in self.__args:
+            table.add_row(" - " + arg.name, arg.description)
+        if self.__is_paged:
+            table.add_row(" - --limit", "The maximum number of results to show.")
+            table.add_row(" - --offset", "The number of results to skip.")
+        return table
 
     @staticmethod
     def __arg_name_format(arg: CommandArgument) -> str:
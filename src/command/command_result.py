@@ -0,0 +1,36 @@
+"""
+Defines the `CommandResult` class representing the outcome of an executed command line.
+"""
+
+
+class CommandResult:
+    """Represents the outcome of an executed command line: its output and its error, if any."""
+
+    def __init__(self, output: str, error: str | None = None, is_exit: bool = False):
+        self.__output = output
+        self.__error = error
+        self.__is_exit = is_exit
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether the command has been executed without an error."""
+        return self.__error is None
+
+    @property
+    def output(self) -> str:
+        """Returns the text printed by the command."""
+        return self.__output
+
+    @property
+    def error(self) -> str | None:
+        """Returns the error message, or None if the command succeeded."""
+        return self.__error
+
+    @property
+    def is_exit(self) -> bool:
+        """Returns whether the command asked to end the session."""
+        return self.__is_exit
+
+    def to_dict(self) -> dict:
+        """Returns the result as a dictionary that can be encoded as JSON."""
+        return {"ok": self.ok, "output": self.__output, "error": self.__error}
@@ -0,0 +1,77 @@
+"""
+Provides the CommandStatistics class.
+
+The statistics record how long every executed command took and whether it
+failed, per command name, so the slow commands can be found at production
+data sizes.
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from src.util.latency_histogram import LatencyHistogram
+
+
+class CommandStatistics:
+    """
+    Latency histograms and error counts per command name.
+
+    Recording is cheap enough to stay on for every command: one clock
+    reading before and after the command, and one histogram update under a
+    lock, so commands run by several threads can record at once.
+    """
+
+    percentiles = (50, 95, 99)
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__histograms: dict[str, LatencyHistogram] = {}
+        self.__errors: dict[str, int] = {}
+
+    def record(self, name: str, nanoseconds: int, failed: bool) -> None:
+        """
+        Records one execution of a command.
+
+        :param name: The name of the command.
+        :param nanoseconds: How long the command took.
+        :param failed: Whether the command failed.
+        """
+        with self.__lock:
+            histogram = self.__histograms.get(name)
+            if histogram is None:
+                histogram = self.__histograms[name] = LatencyHistogram()
+                self.__errors[name] = 0
+            histogram.record(nanoseconds // 1000)
+            if failed:
+                self.__errors[name] += 1
+
+    def summary(self) -> list[dict[str, Any]]:
+        """
+        Returns one row per command, ordered by name, with the count, the error
+        rate and the mean, maximum and percentile latencies in milliseconds.
+        """
+        with self.__lock:
+            rows = []
+            for name in sorted(self.__histograms):
+                histogram = self.__histograms[name]
+                row: dict[str, Any] = {
+                    "command": name,
+                    "count": histogram.count,
+                    "errors": self.__errors[name],
+                    "error_rate": self.__errors[name] / histogram.count,
+                    "mean_ms": histogram.mean / 1000,
+                }
+                for percent in CommandStatistics.percentiles:
+                    row[f"p{percent}_ms"] = histogram.percentile(percent) / 1000
+                row["max_ms"] = histogram.max / 1000
+                rows.append(row)
+            return rows
+
+    def export(self, path: Path) -> None:
+        """
+        Writes the summary to a JSON file.
+
+        :param path: The path of the file.
+        """
+        path.write_text(json.dumps(self.summary(), indent=2) + "\n", encoding="utf-8")
@@ -0,0 +1,164 @@
+"""
+Declarative definitions of all commands.
+
+Each definition holds the name, the description and the argument schema of a
+command. The definitions are kept apart from the handler modules, so the list
+of commands, their help and the argument checks are available without
+importing any handler.
+"""
+from src.command.command_argument import mandatory_arg, optional_arg
+from src.command.command_description import CommandDefinition
+
+ADD_CONTACT = CommandDefinition(
+    "add-contact",
+    "Adds a contact to the address book.",
+    mandatory_arg("name", "Name of a contact.")
+)
+
+DEL_CONTACT = CommandDefinition(
+    "del-contact",
+    "Deletes a contact from a contact book.",
+    mandatory_arg("name", "Name of a contact."),
+)
+
+IMPORT_CONTACTS = CommandDefinition(
+    "import-contacts",
+    "Imports contacts from a CSV or JSON Lines file.",
+    mandatory_arg("path", "The path of a .csv or .jsonl file with the columns "
+                          "name, phones, emails and birthday."),
+    optional_arg("workers", "The number of processes that validate the rows (default 1)."),
+)
+
+ADD_PHONE = CommandDefinition(
+    "add-phone",
+    "Adds a phone number to a contact.",
+    mandatory_arg("name", "Name of a contact."),
+    mandatory_arg("phone", "The phone number to add."),
+)
+
+CHANGE_PHONE = CommandDefinition(
+    "change-phone",
+    "This command changes the phone number of a contact.",
+    mandatory_arg("name", "Name of a contact."),
+    mandatory_arg("old_phone", "The old phone number that needs to be changed."),
+    mandatory_arg("new_phone", "The new phone number to change to."),
+)
+
+DEL_PHONE = CommandDefinition(
+    "del-phone",
+    "Deletes a phone number from a a contact.",
+    mandatory_arg("name", "Name of a contact."),
+    mandatory_arg("phone", "The phone number to delete."),
+)
+
+ADD_EMAIL = CommandDefinition(
+    "add-email",
+    "Adds an email address to a contact.",
+    mandatory_arg("name", "Name of a contact."),
+    mandatory_arg("email", "The email to add."),
+)
+
+CHANGE_EMAIL = CommandDefinition(
+    "change-email",
+    "This command changes the email address of a contact.",
+    mandatory_arg("name", "Name of a contact."),
+    mandatory_arg("old_email", "The old email address that needs to be changed."),
+    mandatory_arg("new_email", "The new email address to change to."),
+)
+
+DEL_EMAIL = CommandDefinition(
+    "del-email",
+    "Deletes an email address from a contact.",
+    mandatory_arg("name", "Name of a contact."),
+    mandatory_arg("email", "The email address to delete."),
+)
+
+ADD_ADDRESS = CommandDefinition(
+    "add-address",
+    "Adds an address to a contact.",
+    mandatory_arg("name", "Name of a contact."),
+    mandatory_arg("email", "The email to add."),
+)
+
+CHANGE_ADDRESS = CommandDefinition(
+    "change-address",
+    "This command changes the address of a contact.",
+    mandatory_arg("name", "Name of a contact."),
+    mandatory_arg("old_email", "The old address that needs to be changed."),
+    mandatory_arg("new_email", "The new address to change to."),
+)
+
+DEL_ADDRESS = CommandDefinition(
+    "del-address",
+    "Deletes an address from a contact.",
+    mandatory_arg("name", "Name of a contact."),
+    mandatory_arg("phone", "The address to delete."),
+)
+
+ADD_BIRTHDAY = CommandDefinition(
+    "add-birthday",
+    "Adds a birthday to a contact or updates it.",
+    mandatory_arg("name", "Name of a contact."),
+    mandatory_arg("birthday", "The birthday in the format DD.MM.YYYY."),
+)
+
+DEL_BIRTHDAY = CommandDefinition(
+    "del-birthday",
+    "Deletes a birthday from a contact.",
+    mandatory_arg("name", "Name of a contact."),
+)
+
+ADD_NOTE = CommandDefinition(
+    "add-note",
+    "Adds a note to notes.",
+    mandatory_arg("name", "Name of a note."),
+    mandatory_arg("content", "The content of a note."),
+    optional_arg("tags", "The list tags of a note. Example: 'tag1,tag2,tag3'."),
+)
+
+CHANGE_NOTE = CommandDefinition(
+    "change-note",
+    "This command changes the note of notes.",
+    mandatory_arg("name", "Name of a note."),
+    mandatory_arg("content", "The content of a note."),
+)
+
+DEL_NOTE = CommandDefinition(
+    "del-note",
+    "Deletes a note from notes.",
+    mandatory_arg("name", "Name of a note."),
+)
+
+NOTE_BY_TEXT = CommandDefinition(
+    "note-by-text",
+    "Finds a note in notes by text. The best matches are shown first.",
+    mandatory_arg("text", "The text to search for. "
+                          "At most 20 notes are shown unless --limit is given."),
+    is_paged=True,
+)
+
+NOTE_BY_TAG = CommandDefinition(
+    "note-by-tag",
+    "Finds a note in notes by tag.",
+    mandatory_arg("tags", "The tags to search for. Example: 'tag1,tag2'."),
+    optional_arg("mode", "'any' - notes with any of the tags (default), "
+                         "'all' - notes with all the tags."),
+    is_paged=True,
+)
+
+STATS = CommandDefinition(
+    "stats",
+    "Shows the number of executions, the error rate and the latency percentiles of every command.",
+    optional_arg("path", "The path of a JSON file to export the statistics to."),
+)
+
+EXIT = CommandDefinition(
+    "exit",
+    "Exits the program.",
+)
+
+HELP = CommandDefinition(
+    "help",
+    "Displays a list of available commands or help for a specific command.",
+    optional_arg("command", "Name of the command for which help should be displayed.")
+)
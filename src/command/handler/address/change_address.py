@@ -1,7 +1,7 @@
 """Handler for the change-address command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import CHANGE_ADDRESS
 from src.command.handler.command_handler import CommandHandler
+from src.output.output import renderer
 
 
 class ChangeAddressCommandHandler(CommandHandler):
@@ -9,16 +9,8 @@ class ChangeAddressCommandHandler(CommandHandler):
 
     def __init__(self, address_book: dict[str, str]):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "change-address",
-                "This command changes the address of a contact.",
-                mandatory_arg("name", "Name of a contact."),
-                mandatory_arg("old_email", "The old address that needs to be changed."),
-                mandatory_arg("new_email", "The new address to change to."),
-            )
-        )
+        super().__init__(CHANGE_ADDRESS)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Change an address.")
+        renderer().print("Change an address.")
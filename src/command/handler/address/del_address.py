@@ -1,7 +1,7 @@
 """Handler for the del-address command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import DEL_ADDRESS
 from src.command.handler.command_handler import CommandHandler
+from src.output.output import renderer
 
 
 class DelAddressCommandHandler(CommandHandler):
@@ -9,15 +9,8 @@ class DelAddressCommandHandler(CommandHandler):
 
     def __init__(self, address_book: dict[str, str]):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "del-address",
-                "Deletes an address from a contact.",
-                mandatory_arg("name", "Name of a contact."),
-                mandatory_arg("phone", "The address to delete."),
-            )
-        )
+        super().__init__(DEL_ADDRESS)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Deleted an address.")
+        renderer().print("Deleted an address.")
@@ -1,23 +1,22 @@
-"""Handler for the add-email command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+"""Handler for the add-birthday command."""
+from src.command.definitions import ADD_BIRTHDAY
 from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.birthday import Birthday
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.output.output import renderer
+from src.usecase.find_contact import find_contact
 
 
 class AddBirthdayCommandHandler(CommandHandler):
     """Handles the functionality to add a birthday to a contact."""
 
-    def __init__(self, address_book: dict[str, str]):
+    def __init__(self, address_book: ContactBook):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "add-birthday",
-                "Adds an email to an address book.",
-                mandatory_arg("name", "Name of a contact."),
-                mandatory_arg("email", "The email to add."),
-            )
-        )
+        super().__init__(ADD_BIRTHDAY, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Added a birthday.")
+        contact = find_contact(self.__address_book, Name(args[0]))
+        contact.add_birthday(Birthday(args[1]))
+        renderer().print("Added a birthday.")
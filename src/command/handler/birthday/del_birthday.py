@@ -1,22 +1,21 @@
 """Handler for the del-birthday command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import DEL_BIRTHDAY
 from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.output.output import renderer
+from src.usecase.find_contact import find_contact
 
 
 class DelBirthdayCommandHandler(CommandHandler):
     """Handles the functionality to delete a birthday from a contact."""
 
-    def __init__(self, address_book: dict[str, str]):
+    def __init__(self, address_book: ContactBook):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "del-birthday",
-                "Deletes a birthday from a contact.",
-                mandatory_arg("name", "Name of a contact."),
-            )
-        )
+        super().__init__(DEL_BIRTHDAY, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Deleted  a birthday.")
+        contact = find_contact(self.__address_book, Name(args[0]))
+        contact.delete_birthday()
+        renderer().print("Deleted  a birthday.")
@@ -1,26 +1,47 @@
 """Base class for command handlers."""
-import rich
-
 from src.command.command_description import CommandDefinition
+from src.command.page import Page
+from src.output.output import renderer
 from src.util.colorize import error_color
+from src.util.markup import escape_markup
 
 
 class CommandHandler:
     """Base class for command handlers."""
 
-    def __init__(self, definition: CommandDefinition):
+    def __init__(self, definition: CommandDefinition, is_mutating: bool = False,
+                 is_bulk: bool = False):
         self.__definition = definition
+        self.__min_args = definition.count_mandatory_args
+        self.__max_args = definition.count_all_args
+        self.__is_mutating = is_mutating or is_bulk
+        self.__is_bulk = is_bulk
 
-    def handle(self, args: list[str]) -> None:
-        """Handles the command."""
+    def handle(self, args: list[str]) -> bool:
+        """
+        Handles the command.
+
+        The "--limit" and "--offset" options of a paged command are taken out
+        of the arguments and passed to `_handle_page` instead of `_handle`.
+
+        :return: True if the command has been executed, False if its arguments
+            were invalid and only the usage has been shown.
+        """
+        page = None
         try:
+            if self.__definition.is_paged:
+                page, args = Page.from_args(args, self._default_limit)
             self.__check_args(args)
         except ValueError as e:
-            rich.print(f"{error_color('[ERROR]')}: " + str(e))
+            renderer().print(f"{error_color('[ERROR]')}: " + escape_markup(str(e)))
             self.show_usage()
-            return
+            return False
 
-        self._handle(args)
+        if page is None:
+            self._handle(args)
+        else:
+            self._handle_page(args, page)
+        return True
 
     @property
     def name(self) -> str:
@@ -32,15 +53,38 @@ class CommandHandler:
         """Returns the description of the command."""
         return self.__definition.description
 
+    @property
+    def is_mutating(self) -> bool:
+        """Returns whether the command changes the contact book or the notes."""
+        return self.__is_mutating
+
+    @property
+    def is_bulk(self) -> bool:
+        """
+        Returns whether the command changes so much data at once that a snapshot
+        is written after it instead of a journal record.
+        """
+        return self.__is_bulk
+
     def show_usage(self) -> None:
         """Returns the help message for the command."""
         return self.__definition.show_usage()
 
+    @property
+    def _default_limit(self) -> int | None:
+        """
+        Returns the number of results a paged command shows without "--limit",
+        or None for all.
+        """
+        return None
+
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
 
+    def _handle_page(self, args: list[str], page: Page) -> None:
+        """Handles a paged command, showing the results of the page."""
+
     def __check_args(self, args: list[str]) -> None:
         """Checks if the number of command arguments matches the expected number."""
-        if (len(args) < self.__definition.count_mandatory_args or
-                len(args) > self.__definition.count_all_args):
+        if not self.__min_args <= len(args) <= self.__max_args:
             raise ValueError("Invalid command arguments.")
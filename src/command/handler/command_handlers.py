@@ -7,17 +7,24 @@ and retrieve command handlers and to view all registered command names.
 """
 from collections import UserDict
 
-import rich
-from rich.table import Table
-
 from src.command.handler.command_handler import CommandHandler
+from src.output.cached_table import CachedTable
+from src.output.column import Column
+from src.output.output import renderer
+from src.output.table import Table
 
 
 class CommandHandlers(UserDict[str, CommandHandler]):
-    """A collection of command handlers."""
+    """
+    A collection of command handlers.
+
+    The list of available commands is built on first use and shown from a
+    cache afterwards; registering a handler invalidates it.
+    """
 
     def __init__(self):
         self.__handler_names = []
+        self.__command_list = CachedTable(self.__build_command_list)
         super().__init__()
 
     def register(self, handler: CommandHandler) -> None:
@@ -27,6 +34,7 @@ class CommandHandlers(UserDict[str, CommandHandler]):
             raise ValueError(f"Command handler already registered for command: '{command_name}'.")
         self.data[command_name] = handler
         self.__handler_names.append(command_name)
+        self.__command_list.invalidate()
 
     def __getitem__(self, command_name: str) -> CommandHandler | None:
         return self.data.get(command_name, None)
@@ -34,13 +42,19 @@ class CommandHandlers(UserDict[str, CommandHandler]):
     def show_list_available_commands(self) -> None:
         """Shows a list of available commands."""
         if len(self.data) > 0:
-            print("The command list:")
-            table = Table(box=None)
-            table.add_column("Command", justify="left", style="green", no_wrap=True)
-            table.add_column("Description", justify="left", style="yellow")
-            for command_name in self.__handler_names:
-                command_handler = self.data[command_name]
-                table.add_row(command_handler.name, command_handler.description)
-            rich.print(table)
+            renderer().print("The command list:")
+            self.__command_list.show()
         else:
-            print("No commands available.")
+            renderer().print("No commands available.")
+
+    def __build_command_list(self) -> Table:
+        """Builds the table of the registered commands and their descriptions."""
+        table = Table(
+            Column("Command", style="green", no_wrap=True),
+            Column("Description", style="yellow"),
+            bordered=False,
+        )
+        for command_name in self.__handler_names:
+            command_handler = self.data[command_name]
+            table.add_row(command_handler.name, command_handler.description)
+        return table
@@ -1,22 +1,23 @@
 """Handler for the add-contact command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import ADD_CONTACT
 from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.contact import Contact
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.output.output import renderer
 
 
 class AddContactCommandHandler(CommandHandler):
     """Handles the functionality to add a contact into an address book."""
 
-    def __init__(self, address_book: dict[str, str]):
+    def __init__(self, address_book: ContactBook):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "add-contact",
-                "Adds a contact to the address book.",
-                mandatory_arg("name", "Name of a contact.")
-            )
-        )
+        super().__init__(ADD_CONTACT, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Adding a contact.")
+        name = Name(args[0])
+        if self.__address_book.find(name) is not None:
+            raise ValueError(f"Contact `{name}` already exists.")
+        self.__address_book.add(Contact(name))
+        renderer().print("Added a contact.")
@@ -1,22 +1,21 @@
 """Handler for the del-contact command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import DEL_CONTACT
 from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.error.unknown_contact_error import UnknownContactError
+from src.output.output import renderer
 
 
 class DelContactCommandHandler(CommandHandler):
     """Handles the functionality to delete a contact from a contact book."""
 
-    def __init__(self, address_book: dict[str, str]):
+    def __init__(self, address_book: ContactBook):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "del-contact",
-                "Deletes a contact from a contact book.",
-                mandatory_arg("name", "Name of a contact."),
-            )
-        )
+        super().__init__(DEL_CONTACT, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Deleted a contact.")
+        if self.__address_book.delete(Name(args[0])) is None:
+            raise UnknownContactError(args[0])
+        renderer().print("Deleted a contact.")
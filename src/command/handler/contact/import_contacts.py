@@ -0,0 +1,43 @@
+"""Handler for the import-contacts command."""
+from pathlib import Path
+
+from src.command.definitions import IMPORT_CONTACTS
+from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.output.output import renderer
+from src.usecase.import_contacts import import_contacts
+from src.util.markup import escape_markup
+
+
+class ImportContactsCommandHandler(CommandHandler):
+    """Handles the functionality to import contacts from a file into an address book."""
+
+    shown_skipped_rows = 10
+
+    def __init__(self, address_book: ContactBook):
+        self.__address_book = address_book
+        super().__init__(IMPORT_CONTACTS, is_bulk=True)
+
+    def _handle(self, args: list[str]) -> None:
+        """Handles the command."""
+        path = Path(args[0]).expanduser()
+        workers = 1
+        if len(args) > 1:
+            if not args[1].isdigit() or int(args[1]) == 0:
+                raise ValueError(f"Invalid number of workers: '{args[1]}'. "
+                                 "Expected a positive number.")
+            workers = int(args[1])
+        try:
+            report = import_contacts(self.__address_book, path, workers=workers)
+        except OSError as e:
+            raise ValueError(f"Cannot read '{path}': {e.strerror}.") from e
+
+        output = renderer()
+        shown = ImportContactsCommandHandler.shown_skipped_rows
+        output.print(f"Imported {report.imported} contacts, skipped {len(report.skipped)} rows "
+                     f"({report.rows} rows in {report.elapsed:.2f} s, "
+                     f"{report.rows_per_second:.0f} rows/s).")
+        for line, reason in report.skipped[:shown]:
+            output.print(f"  line {line}: {escape_markup(reason)}")
+        if len(report.skipped) > shown:
+            output.print(f"  ... and {len(report.skipped) - shown} more.")
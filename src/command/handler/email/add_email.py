@@ -1,23 +1,24 @@
 """Handler for the add-email command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import ADD_EMAIL
 from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.email import Email
+from src.domain.contact.name import Name
+from src.error.already_email_error import AlreadyEmailError
+from src.output.output import renderer
+from src.usecase.add_email import add_email
 
 
 class AddEmailCommandHandler(CommandHandler):
     """Handles the functionality to add an email address to a contact."""
 
-    def __init__(self, address_book: dict[str, str]):
+    def __init__(self, address_book: ContactBook):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "add-email",
-                "Adds an email address to a contact.",
-                mandatory_arg("name", "Name of a contact."),
-                mandatory_arg("email", "The email to add."),
-            )
-        )
+        super().__init__(ADD_EMAIL, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Added an email address.")
+        email = Email(args[1])
+        if add_email(self.__address_book, Name(args[0]), email) is None:
+            raise AlreadyEmailError(email.value)
+        renderer().print("Added an email address.")
@@ -1,24 +1,22 @@
 """Handler for the change-email command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import CHANGE_EMAIL
 from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.email import Email
+from src.domain.contact.name import Name
+from src.output.output import renderer
+from src.usecase.find_contact import find_contact
 
 
 class ChangeEmailCommandHandler(CommandHandler):
     """Handles the functionality to change an email address in a contact."""
 
-    def __init__(self, address_book: dict[str, str]):
+    def __init__(self, address_book: ContactBook):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "change-email",
-                "This command changes the email address of a contact.",
-                mandatory_arg("name", "Name of a contact."),
-                mandatory_arg("old_email", "The old email address that needs to be changed."),
-                mandatory_arg("new_email", "The new email address to change to."),
-            )
-        )
+        super().__init__(CHANGE_EMAIL, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Change an email address.")
+        contact = find_contact(self.__address_book, Name(args[0]))
+        contact.emails.replace(Email(args[1]), Email(args[2]))
+        renderer().print("Change an email address.")
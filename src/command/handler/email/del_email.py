@@ -1,23 +1,22 @@
 """Handler for the del-email command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import DEL_EMAIL
 from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.email import Email
+from src.domain.contact.name import Name
+from src.output.output import renderer
+from src.usecase.find_contact import find_contact
 
 
 class DelEmailCommandHandler(CommandHandler):
     """Handles the functionality to delete an email address from a contact."""
 
-    def __init__(self, address_book: dict[str, str]):
+    def __init__(self, address_book: ContactBook):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "del-email",
-                "Deletes an email address from a contact.",
-                mandatory_arg("name", "Name of a contact."),
-                mandatory_arg("phone", "The email address to delete."),
-            )
-        )
+        super().__init__(DEL_EMAIL, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Deleted an email address.")
+        contact = find_contact(self.__address_book, Name(args[0]))
+        contact.emails.remove(Email(args[1]))
+        renderer().print("Deleted an email address.")
@@ -1,19 +1,18 @@
 """Exit command handler."""
 import sys
 
-import rich
-
-from src.command.command_description import CommandDefinition
+from src.command.definitions import EXIT
 from src.command.handler.command_handler import CommandHandler
+from src.output.output import renderer
 
 
 class ExitCommandHandler(CommandHandler):
     """Handles the "exit" command functionality."""
 
     def __init__(self):
-        super().__init__(CommandDefinition("exit", "Exits the program.", ))
+        super().__init__(EXIT)
 
     def _handle(self, _: list[str]) -> None:
         """Handles the command."""
-        rich.print("[blue]Good bye![/blue]")
+        renderer().print("[blue]Good bye![/blue]")
         sys.exit(0)
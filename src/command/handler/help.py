@@ -1,10 +1,8 @@
 """Help command handler."""
 
-from src.command.command_argument import optional_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import HELP
 from src.command.handler.command_handler import CommandHandler
 from src.command.handler.command_handlers import CommandHandlers
-from src.util.colorize import cmd_color
 
 
 class HelpCommandHandler(CommandHandler):
@@ -12,13 +10,7 @@ class HelpCommandHandler(CommandHandler):
 
     def __init__(self, handlers: CommandHandlers):
         self.__handlers = handlers
-        super().__init__(
-            CommandDefinition(
-                "help",
-                "Displays a list of available commands or help for a specific command.",
-                optional_arg("command", "Name of the command for which help should be displayed.")
-            )
-        )
+        super().__init__(HELP)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
@@ -31,5 +23,5 @@ class HelpCommandHandler(CommandHandler):
         """Shows help for a specific command."""
         handler = self.__handlers.get(command_name, None)
         if handler is None:
-            raise ValueError(f"Help for command: '{cmd_color(command_name)}' is not available.")
+            raise ValueError(f"Help for command: '{command_name}' is not available.")
         handler.show_usage()
@@ -0,0 +1,76 @@
+"""
+Provides the LazyCommandHandler class.
+
+The handler stands in for a real command handler until the command is first
+dispatched, so the handler module and its dependencies are not imported at
+startup.
+"""
+import importlib
+import threading
+import time
+
+from src.command.command_description import CommandDefinition
+from src.command.handler.command_handler import CommandHandler
+
+
+class LazyCommandHandler(CommandHandler):
+    """
+    A command handler that imports and creates the real handler on first use.
+
+    The name, the description and the usage of the command come from its
+    definition, so listing the commands or showing help does not load the
+    real handler. Loading is guarded by a lock, so a handler used by several
+    threads at once is still created only once.
+    """
+
+    __load_lock = threading.Lock()
+
+    def __init__(self, definition: CommandDefinition, handler_path: str, *handler_args):
+        """
+        :param definition: The definition of the command.
+        :param handler_path: The dotted path of the real handler class, for example
+            "src.command.handler.exit.ExitCommandHandler".
+        :param handler_args: The arguments passed to the constructor of the real handler.
+        """
+        super().__init__(definition)
+        self.__handler_path = handler_path
+        self.__handler_args = handler_args
+        self.__handler: CommandHandler | None = None
+        self.__load_time: float | None = None
+
+    def handle(self, args: list[str]) -> bool:
+        """Handles the command with the real handler, loading it first if needed."""
+        return self.handler.handle(args)
+
+    @property
+    def is_mutating(self) -> bool:
+        """Returns whether the command changes the contact book or the notes."""
+        return self.handler.is_mutating
+
+    @property
+    def is_bulk(self) -> bool:
+        """Returns whether the command changes data in bulk."""
+        return self.handler.is_bulk
+
+    @property
+    def is_loaded(self) -> bool:
+        """Returns whether the real handler has been loaded."""
+        return self.__handler is not None
+
+    @property
+    def load_time(self) -> float | None:
+        """Returns how many seconds loading the real handler took, or None if it is not loaded."""
+        return self.__load_time
+
+    @property
+    def handler(self) -> CommandHandler:
+        """Returns the real handler, importing and creating it on first access."""
+        if self.__handler is None:
+            with LazyCommandHandler.__load_lock:
+                if self.__handler is None:
+                    started = time.perf_counter()
+                    module_name, _, class_name = self.__handler_path.rpartition(".")
+                    handler_class = getattr(importlib.import_module(module_name), class_name)
+                    self.__handler = handler_class(*self.__handler_args)
+                    self.__load_time = time.perf_counter() - started
+        return self.__handler
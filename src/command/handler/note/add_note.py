@@ -1,31 +1,30 @@
 """Handler for the add-note command."""
-from src.command.command_argument import mandatory_arg, optional_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import ADD_NOTE
 from src.command.handler.command_handler import CommandHandler
+from src.domain.note.content import Content
+from src.domain.note.note import Note
+from src.domain.note.notes import Notes
+from src.domain.note.tags import Tags
+from src.domain.note.topic import Topic
+from src.output.output import renderer
 
 
 class AddNoteCommandHandler(CommandHandler):
     """Handles the functionality to add a note to notes."""
 
-    def __init__(self, notes: dict[str, str]):
+    def __init__(self, notes: Notes):
         self.__notes = notes
-        super().__init__(
-            CommandDefinition(
-                "add-note",
-                "Adds a note to notes.",
-                mandatory_arg("name", "Name of a note."),
-                mandatory_arg("content", "The content of a note."),
-                optional_arg("tags", "The list tags of a note. Example: 'tag1,tag2,tag3'."),
-            )
-        )
+        super().__init__(ADD_NOTE, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        topic = args[0]
-        content = args[1]
+        topic = Topic(args[0])
+        content = Content(args[1])
         if len(args) > 2:
-            tags = args[2]
+            tags = Tags.from_string(args[2])
         else:
             tags = None
-        self.__notes.add_note(topic, content, tags)
-        print("Added a note.")
+        if self.__notes.add(Note(topic, content, tags)) is None:
+            renderer().print("The note has not been added - a note with this name already exists.")
+        else:
+            renderer().print("Added a note.")
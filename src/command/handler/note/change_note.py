@@ -1,29 +1,24 @@
 """Handler for the change-note command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import CHANGE_NOTE
 from src.command.handler.command_handler import CommandHandler
+from src.domain.note.content import Content
+from src.domain.note.notes import Notes
+from src.domain.note.topic import Topic
+from src.error.unknown_note_error import UnknownNoteError
+from src.output.output import renderer
 
 
 class ChangeNoteCommandHandler(CommandHandler):
     """Handles the functionality to change a note in notes."""
 
-    def __init__(self, notes: dict[str, str]):
+    def __init__(self, notes: Notes):
         self.__notes = notes
-        super().__init__(
-            CommandDefinition(
-                "change-note",
-                "This command changes the note of notes.",
-                mandatory_arg("name", "Name of a note."),
-                mandatory_arg("content", "The content of a note."),
-            )
-        )
+        super().__init__(CHANGE_NOTE, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        topic = args[0]
-        content = args[1]
-        is_done = self.__notes.edit_note(topic, content)
-        if is_done:
-            print("Changed the note.")
-        else:
-            print("The note has not been changed")
+        topic = Topic(args[0])
+        content = Content(args[1])
+        if self.__notes.change_content(topic, content) is None:
+            raise UnknownNoteError(topic.value)
+        renderer().print("Changed the note.")
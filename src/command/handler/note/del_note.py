@@ -1,28 +1,23 @@
 """Handler for the del-note command."""
 
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import DEL_NOTE
 from src.command.handler.command_handler import CommandHandler
+from src.domain.note.notes import Notes
+from src.domain.note.topic import Topic
+from src.error.unknown_note_error import UnknownNoteError
+from src.output.output import renderer
 
 
 class DelNoteCommandHandler(CommandHandler):
     """Handles the functionality to delete a note from notes."""
 
-    def __init__(self, notes: dict[str, str]):
+    def __init__(self, notes: Notes):
         self.__notes = notes
-        super().__init__(
-            CommandDefinition(
-                "del-note",
-                "Deletes a note from notes.",
-                mandatory_arg("name", "Name of a note."),
-            )
-        )
+        super().__init__(DEL_NOTE, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        topic = args[0]
-        is_done = self.__notes.delete_note(topic)
-        if is_done:
-            print("Deleted a note.")
-        else:
-            print("The note has not been delete")
+        topic = Topic(args[0])
+        if self.__notes.remove(topic) is None:
+            raise UnknownNoteError(topic.value)
+        renderer().print("Deleted a note.")
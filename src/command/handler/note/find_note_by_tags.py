@@ -1,29 +1,27 @@
 """Handler for the note-by-tag command."""
 
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import NOTE_BY_TAG
 from src.command.handler.command_handler import CommandHandler
 from src.command.handler.note.show_notes import show_notes
+from src.command.page import Page
+from src.domain.note.notes import Notes
+from src.domain.note.tags import Tags
+from src.output.output import renderer
 
 
 class FindNoteByTagCommandHandler(CommandHandler):
     """Handles the functionality to find a note in notes."""
 
-    def __init__(self, notes: dict[str, str]):
+    def __init__(self, notes: Notes):
         self.__notes = notes
-        super().__init__(
-            CommandDefinition(
-                "note-by-tag",
-                "Finds a note in notes by tag.",
-                mandatory_arg("tags", "The tag to search for."),
-            )
-        )
+        super().__init__(NOTE_BY_TAG)
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle_page(self, args: list[str], page: Page) -> None:
         """Handles the command."""
-        tag = args[0]
-        notes: list[NoteEntity] = self.__notes.search_by_tag(tag)
-        if notes:
-            show_notes(notes)
-        else:
-            print("No notes found.")
+        tags = Tags.from_string(args[0])
+        mode = args[1].casefold() if len(args) > 1 else "any"
+        if mode not in ("any", "all"):
+            raise ValueError(f"Invalid search mode: '{args[1]}'. Expected 'any' or 'all'.")
+        notes = page.apply(self.__notes.iter_by_tags(tags.data, match_all=mode == "all"))
+        if show_notes(notes) == 0:
+            renderer().print("No notes found.")
@@ -1,29 +1,28 @@
 """Handler for the note-by-text command."""
 
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import NOTE_BY_TEXT
 from src.command.handler.command_handler import CommandHandler
 from src.command.handler.note.show_notes import show_notes
+from src.command.page import Page
+from src.domain.note.notes import Notes
+from src.output.output import renderer
 
 
 class FindNoteByTextCommandHandler(CommandHandler):
     """Handles the functionality to find a note in notes."""
 
-    def __init__(self, notes: dict[str, str]):
+    default_limit = 20
+
+    def __init__(self, notes: Notes):
         self.__notes = notes
-        super().__init__(
-            CommandDefinition(
-                "note-by-text",
-                "Finds a note in notes by text.",
-                mandatory_arg("text", "The text to search for."),
-            )
-        )
+        super().__init__(NOTE_BY_TEXT)
+
+    @property
+    def _default_limit(self) -> int | None:
+        return FindNoteByTextCommandHandler.default_limit
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle_page(self, args: list[str], page: Page) -> None:
         """Handles the command."""
-        text = args[0]
-        notes: list[NoteEntity] = self.__notes.find_text_in_notes(text)
-        if notes:
-            show_notes(notes)
-        else:
-            print("No notes found.")
+        notes = page.apply(self.__notes.iter_by_text(args[0]))
+        if show_notes(notes) == 0:
+            renderer().print("No notes found.")
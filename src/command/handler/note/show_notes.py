@@ -1,14 +1,29 @@
 """Module for showing notes."""
+from typing import Iterable
 
-import rich
-from rich.table import Table, box
+from src.domain.note.note import Note
+from src.output.column import Column
+from src.output.pager import show_paged
+from src.output.table import Table
 
 
-def show_notes(notes) -> None:
-    """Shows the notes."""
-    table = Table(box=box.SIMPLE_HEAD)
-    table.add_column("Topic", justify="left", style="blue", no_wrap=True)
-    table.add_column("Content", justify="left", style="yellow")
-    for note in notes:
-        table.add_row(note.topic, note.content)
-    rich.print(table)
+def show_notes(notes: Iterable[Note]) -> int:
+    """
+    Shows the notes page by page as they are taken from the iterable.
+
+    :return: The number of notes shown.
+    """
+    rows = (
+        (note.topic.value, note.content.value, ", ".join(tag.value for tag in note.tags))
+        for note in notes
+    )
+    return show_paged(rows, _new_table)
+
+
+def _new_table(show_header: bool) -> Table:
+    return Table(
+        Column("Topic", style="blue", no_wrap=True),
+        Column("Content", style="yellow"),
+        Column("Tags", style="green"),
+        show_header=show_header,
+    )
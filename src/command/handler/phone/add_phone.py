@@ -1,23 +1,25 @@
 """Handler for the add-phone command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import ADD_PHONE
 from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.domain.contact.phone import Phone
+from src.error.already_phone_number_error import AlreadyPhoneNumberError
+from src.output.output import renderer
+from src.usecase.find_contact import find_contact
 
 
 class AddPhoneCommandHandler(CommandHandler):
     """Handles the functionality to add a phone number to a contact."""
 
-    def __init__(self, address_book: dict[str, str]):
+    def __init__(self, address_book: ContactBook):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "add-phone",
-                "Adds a phone number to a contact.",
-                mandatory_arg("name", "Name of a contact."),
-                mandatory_arg("phone", "The phone number to add."),
-            )
-        )
+        super().__init__(ADD_PHONE, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Added a phone number.")
+        contact = find_contact(self.__address_book, Name(args[0]))
+        phone = Phone(args[1])
+        if contact.phones.add(phone) is None:
+            raise AlreadyPhoneNumberError(phone.value)
+        renderer().print("Added a phone number.")
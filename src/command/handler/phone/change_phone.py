@@ -1,24 +1,22 @@
 """Handler for the change-phone command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import CHANGE_PHONE
 from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.domain.contact.phone import Phone
+from src.output.output import renderer
+from src.usecase.find_contact import find_contact
 
 
 class ChangePhoneCommandHandler(CommandHandler):
     """Handles the functionality to change a phone number in a contact."""
 
-    def __init__(self, address_book: dict[str, str]):
+    def __init__(self, address_book: ContactBook):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "change-phone",
-                "This command changes the phone number of a contact.",
-                mandatory_arg("name", "Name of a contact."),
-                mandatory_arg("old_phone", "The old phone number that needs to be changed."),
-                mandatory_arg("new_phone", "The new phone number to change to."),
-            )
-        )
+        super().__init__(CHANGE_PHONE, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Changed a phone number.")
+        contact = find_contact(self.__address_book, Name(args[0]))
+        contact.phones.replace(Phone(args[1]), Phone(args[2]))
+        renderer().print("Changed a phone number.")
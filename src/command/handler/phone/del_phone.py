@@ -1,23 +1,25 @@
 """Handler for the del-phone command."""
-from src.command.command_argument import mandatory_arg
-from src.command.command_description import CommandDefinition
+from src.command.definitions import DEL_PHONE
 from src.command.handler.command_handler import CommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.domain.contact.phone import Phone
+from src.error.unknown_phone_number_error import UnknownPhoneNumberError
+from src.output.output import renderer
+from src.usecase.find_contact import find_contact
 
 
 class DelPhoneCommandHandler(CommandHandler):
     """Handles the functionality to delete a phone number from a contact."""
 
-    def __init__(self, address_book: dict[str, str]):
+    def __init__(self, address_book: ContactBook):
         self.__address_book = address_book
-        super().__init__(
-            CommandDefinition(
-                "del-phone",
-                "Deletes a phone number from a a contact.",
-                mandatory_arg("name", "Name of a contact."),
-                mandatory_arg("phone", "The phone number to delete."),
-            )
-        )
+        super().__init__(DEL_PHONE, is_mutating=True)
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        print("Deleted a phone number.")
+        contact = find_contact(self.__address_book, Name(args[0]))
+        phone = Phone(args[1])
+        if contact.phones.remove(phone) is None:
+            raise UnknownPhoneNumberError(phone.value)
+        renderer().print("Deleted a phone number.")
@@ -0,0 +1,50 @@
+"""Stats command handler."""
+from pathlib import Path
+
+from src.command.command_statistics import CommandStatistics
+from src.command.definitions import STATS
+from src.command.handler.command_handler import CommandHandler
+from src.output.column import Column
+from src.output.output import renderer
+from src.output.table import Table
+from src.util.markup import escape_markup
+
+
+class StatsCommandHandler(CommandHandler):
+    """Handles the "stats" command functionality."""
+
+    def __init__(self, statistics: CommandStatistics):
+        self.__statistics = statistics
+        super().__init__(STATS)
+
+    def _handle(self, args: list[str]) -> None:
+        """Handles the command."""
+        if len(args) > 0:
+            path = Path(args[0]).expanduser()
+            try:
+                self.__statistics.export(path)
+            except OSError as e:
+                raise ValueError(f"Cannot write '{path}': {e.strerror}.") from e
+            renderer().print(f"Exported the statistics to '{escape_markup(str(path))}'.")
+            return
+
+        rows = self.__statistics.summary()
+        if len(rows) == 0:
+            renderer().print("No commands have been executed yet.")
+            return
+        table = Table(
+            Column("Command", style="green", no_wrap=True),
+            *(Column(header, justify="right")
+              for header in ("Count", "Errors", "p50 ms", "p95 ms", "p99 ms", "Max ms")),
+        )
+        for row in rows:
+            table.add_row(
+                row["command"],
+                str(row["count"]),
+                f"{row['error_rate']:.1%}",
+                f"{row['p50_ms']:.3f}",
+                f"{row['p95_ms']:.3f}",
+                f"{row['p99_ms']:.3f}",
+                f"{row['max_ms']:.3f}",
+            )
+        renderer().table(table)
@@ -0,0 +1,67 @@
+"""
+Defines the `Page` class: the "--limit" and "--offset" options of the
+commands that list results.
+"""
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class Page:
+    """The window of results to show: how many to skip and how many to show at most."""
+
+    options = ("--limit", "--offset")
+
+    def __init__(self, offset: int = 0, limit: int | None = None):
+        self.__offset = offset
+        self.__limit = limit
+
+    @property
+    def offset(self) -> int:
+        """Returns the number of results to skip."""
+        return self.__offset
+
+    @property
+    def limit(self) -> int | None:
+        """Returns the maximum number of results to show, or None for all."""
+        return self.__limit
+
+    def apply(self, results: Iterable[T]) -> Iterator[T]:
+        """
+        Takes the results of the page from an iterable without consuming more
+        of it than needed.
+
+        :param results: The results, usually a lazy iterator.
+        :return: An iterator over the results of the page.
+        """
+        stop = None if self.__limit is None else self.__offset + self.__limit
+        return islice(results, self.__offset, stop)
+
+    @staticmethod
+    def from_args(args: list[str], default_limit: int | None = None) -> tuple["Page", list[str]]:
+        """
+        Takes the "--limit N" and "--offset N" options out of command arguments.
+
+        :param args: The arguments of the command.
+        :param default_limit: The limit when the "--limit" option is missing.
+        :return: The page and the remaining arguments.
+        :raises ValueError: If an option has no value or its value is not a number.
+        """
+        values: dict[str, int] = {}
+        rest: list[str] = []
+        position = 0
+        while position < len(args):
+            arg = args[position]
+            if arg.casefold() not in Page.options:
+                rest.append(arg)
+                position += 1
+                continue
+            if position + 1 >= len(args) or not args[position + 1].isdigit():
+                raise ValueError(f"Invalid value of '{arg}'. Expected a number.")
+            values[arg.casefold()] = int(args[position + 1])
+            position += 2
+        limit = values.get("--limit", default_limit)
+        if limit == 0:
+            raise ValueError("Invalid value of '--limit'. Expected a positive number.")
+        return Page(values.get("--offset", 0), limit), rest
@@ -6,6 +6,8 @@ Provides the Address class.
 class Address:
     """Class for storing the address."""
 
+    __slots__ = ("__value",)
+
     def __init__(self, value: str):
         self.__value = value
 
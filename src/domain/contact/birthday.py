@@ -17,6 +17,8 @@ class Birthday:
     """
     format = "%d.%m.%Y"
 
+    __slots__ = ("__value",)
+
     def __init__(self, value: str):
         try:
             date_of_birthday: date = datetime.strptime(value, Birthday.format).date()
@@ -0,0 +1,102 @@
+"""
+Provides the BirthdayCalendar class.
+
+The calendar answers "whose birthday is within the next N days" queries by
+looking only at the days of the year that fall into the requested period.
+"""
+from datetime import date, timedelta
+from typing import Iterable
+
+from src.domain.contact.birthday import Birthday
+from src.domain.contact.contact import Contact
+from src.domain.contact.name import Name
+from src.util.observable import ObserverIndex
+
+
+class BirthdayCalendar(ObserverIndex[Contact, Birthday]):
+    """
+    A day-of-year index of the birthdays of attached contacts.
+
+    The calendar has one bucket for every day of a leap year, including
+    February 29. In non-leap years the birthdays of February 29 are celebrated
+    on February 28. The calendar follows the birthday of every attached
+    contact.
+    """
+
+    days_in_year = 366
+
+    def __init__(self):
+        days = BirthdayCalendar.days_in_year
+        self.__buckets: list[dict[Name, Contact]] = [{} for _ in range(days)]
+        super().__init__(lambda contact: contact.name, lambda contact: contact,
+                         self.__add, self.__remove)
+
+    def upcoming(self, days: int, today: date) -> list[Contact]:
+        """
+        Returns the contacts whose birthday falls within the given number of days.
+
+        The period starts today and includes the last day, so with `days` equal
+        to 0 only today's birthdays are returned. The period wraps around the
+        end of the year, and only the buckets of its days are visited.
+
+        :param days: The number of days after today to include.
+        :param today: The first day of the period.
+        :return: The contacts ordered by the date of their next birthday.
+        """
+        contacts: list[Contact] = []
+        visited: set[int] = set()
+        for offset in range(min(days, BirthdayCalendar.days_in_year - 1) + 1):
+            day = today + timedelta(days=offset)
+            indexes = [BirthdayCalendar.day_of_year(day.month, day.day)]
+            if (day.month, day.day) == (2, 28) and not BirthdayCalendar.__is_leap_year(day.year):
+                indexes.append(BirthdayCalendar.day_of_year(2, 29))
+            for index in indexes:
+                if index not in visited:
+                    visited.add(index)
+                    contacts.extend(self.__buckets[index].values())
+        return contacts
+
+    def in_month(self, month: int) -> list[Contact]:
+        """
+        Returns the contacts whose birthday is in the month of any year.
+
+        Only the buckets of the days of the month are visited.
+
+        :param month: The month, from 1 to 12.
+        :return: The contacts ordered by the day of their birthday.
+        """
+        first = BirthdayCalendar.day_of_year(month, 1)
+        if month < 12:
+            last = BirthdayCalendar.day_of_year(month + 1, 1)
+        else:
+            last = BirthdayCalendar.days_in_year
+        contacts: list[Contact] = []
+        for bucket in self.__buckets[first:last]:
+            contacts.extend(bucket.values())
+        return contacts
+
+    @staticmethod
+    def day_of_year(month: int, day: int) -> int:
+        """
+        Returns the zero-based bucket of a day of the year, counted in a leap
+        year so that February 29 has a bucket of its own.
+        """
+        return date(2000, month, day).timetuple().tm_yday - 1
+
+    def _items(self, owner: Contact) -> Iterable[Birthday]:
+        """Returns the birthday of the contact, if it has one."""
+        return () if owner.birthday is None else (owner.birthday,)
+
+    def __add(self, birthday: Birthday, contact: Contact) -> None:
+        self.__bucket(birthday)[contact.name] = contact
+
+    def __remove(self, birthday: Birthday, contact: Contact) -> None:
+        self.__bucket(birthday).pop(contact.name, None)
+
+    def __bucket(self, birthday: Birthday) -> dict[Name, Contact]:
+        value = birthday.value
+        return self.__buckets[BirthdayCalendar.day_of_year(value.month, value.day)]
+
+    @staticmethod
+    def __is_leap_year(year: int) -> bool:
+        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
@@ -0,0 +1,81 @@
+"""
+Provides the BirthdayIndex class.
+
+The index answers "who was born on this date, in this year or between these
+dates" queries with a binary search over the dates of birth, instead of
+reading the birthday of every contact.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Iterable
+
+from src.domain.contact.birthday import Birthday
+from src.domain.contact.contact import Contact
+from src.util.observable import ObserverIndex
+
+
+class BirthdayIndex(ObserverIndex[Contact, Birthday]):
+    """
+    A sorted index of the dates of birth of attached contacts.
+
+    The dates are kept as ordinals in a sorted list, with the contacts in a
+    second list at the same positions, so a range of dates is found with two
+    binary searches and read as one slice. Contacts born on the same day are
+    kept in the order they were added. The index follows the birthday of
+    every attached contact.
+    """
+
+    def __init__(self):
+        self.__ordinals: list[int] = []
+        self.__contacts: list[Contact] = []
+        super().__init__(lambda contact: contact.name, lambda contact: contact,
+                         self.__add, self.__remove)
+
+    def find_range(self, start: date, end: date) -> list[Contact]:
+        """
+        Returns the contacts born between the two dates, both included.
+
+        :param start: The first date of the range.
+        :param end: The last date of the range.
+        :return: The contacts ordered by their date of birth.
+        """
+        low = bisect_left(self.__ordinals, start.toordinal())
+        high = bisect_right(self.__ordinals, end.toordinal(), lo=low)
+        return self.__contacts[low:high]
+
+    def find_date(self, day: date) -> list[Contact]:
+        """
+        Returns the contacts born on the date.
+
+        :param day: The date of birth.
+        :return: The contacts in the order they were added.
+        """
+        return self.find_range(day, day)
+
+    def find_year(self, year: int) -> list[Contact]:
+        """
+        Returns the contacts born in the year.
+
+        :param year: The year of birth.
+        :return: The contacts ordered by their date of birth.
+        """
+        return self.find_range(date(year, 1, 1), date(year, 12, 31))
+
+    def _items(self, owner: Contact) -> Iterable[Birthday]:
+        """Returns the birthday of the contact, if it has one."""
+        return () if owner.birthday is None else (owner.birthday,)
+
+    def __add(self, birthday: Birthday, contact: Contact) -> None:
+        position = bisect_right(self.__ordinals, birthday.value.toordinal())
+        self.__ordinals.insert(position, birthday.value.toordinal())
+        self.__contacts.insert(position, contact)
+
+    def __remove(self, birthday: Birthday, contact: Contact) -> None:
+        ordinal = birthday.value.toordinal()
+        low = bisect_left(self.__ordinals, ordinal)
+        high = bisect_right(self.__ordinals, ordinal, lo=low)
+        for position in range(low, high):
+            if self.__contacts[position] is contact:
+                del self.__ordinals[position]
+                del self.__contacts[position]
+                return
@@ -5,12 +5,21 @@ from src.domain.contact.birthday import Birthday
 from src.domain.contact.emails import Emails
 from src.domain.contact.name import Name
 from src.domain.contact.phones import Phones
+from src.util.observable import Observable
 
 
-class Contact:
-    """A class for storing contact information."""
+class Contact(Observable[Birthday]):
+    """
+    A class for storing contact information.
+
+    The contact notifies its subscribers whenever its birthday is added,
+    changed or deleted.
+    """
+
+    __slots__ = ("__name", "__phones", "__emails", "__birthday")
 
     def __init__(self, name: Name):
+        super().__init__()
         self.__name = name
         self.__phones = Phones()
         self.__emails = Emails()
@@ -38,11 +47,16 @@ class Contact:
 
     def add_birthday(self, birthday: Birthday) -> None:
         """Adds a birthday to the contact."""
+        old_birthday = self.__birthday
         self.__birthday = birthday
+        self._notify(old_birthday, birthday)
 
     def delete_birthday(self) -> None:
         """Deletes the birthday from the contact."""
+        old_birthday = self.__birthday
         self.__birthday = None
+        if old_birthday is not None:
+            self._notify(old_birthday, None)
 
     def __str__(self):
         """Returns a string representation of the contact."""
@@ -3,15 +3,36 @@ Provides an AddressBook class for managing and storing contact information.
 """
 
 from collections import UserDict
+from datetime import date, timedelta
+from typing import Iterator
 
+from src.domain.contact.birthday_calendar import BirthdayCalendar
+from src.domain.contact.birthday_index import BirthdayIndex
 from src.domain.contact.contact import Contact
+from src.domain.contact.email_index import EmailIndex
+from src.domain.contact.email_search_template import EmailSearchTemplate
 from src.domain.contact.name import Name
 from src.domain.contact.name_search_template import NameSearchTemplate
+from src.domain.contact.phone_index import PhoneIndex
 from src.domain.contact.phone_number_search_template import PhoneNumberSearchTemplate
+from src.util.trigram_index import TrigramIndex
 
 
 class ContactBook(UserDict[Name, Contact]):
-    """A class for storing and managing contacts."""
+    """
+    A class for storing and managing contacts.
+
+    Contacts are keyed by their `Name`, which hashes and compares by its
+    precomputed casefolded key, so lookups are case-insensitive.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__name_index: TrigramIndex[Name] = TrigramIndex()
+        self.__phone_index = PhoneIndex()
+        self.__email_index = EmailIndex()
+        self.__birthday_calendar = BirthdayCalendar()
+        self.__birthday_index = BirthdayIndex()
 
     def add(self, contact: Contact) -> None:
         """
@@ -27,6 +48,11 @@ class ContactBook(UserDict[Name, Contact]):
         name: Name = contact.name
         if name not in self.data:
             self.data[name] = contact
+            self.__name_index.add(name, name.key)
+            self.__phone_index.attach(contact)
+            self.__email_index.attach(contact)
+            self.__birthday_calendar.attach(contact)
+            self.__birthday_index.attach(contact)
 
     def find(self, name: Name) -> Contact | None:
         """
@@ -46,35 +72,153 @@ class ContactBook(UserDict[Name, Contact]):
         Searches for contacts by a specified name substring.
 
         This method looks for all contacts where the given name substring
-        is found (case-insensitive) in the contact's name. If no matching contacts
-        are found, it returns None.
+        is found (case-insensitive) in the contact's name. The candidates are
+        taken from the trigram index of casefolded names, so only the contacts
+        that share every trigram with the template are checked. If no matching
+        contacts are found, it returns None.
 
         :param template: The name template to search for.
         :return: None
         """
-        contacts = [
-            contact for contact in self.data.values()
-            if template.value in contact.name.value.casefold()
-        ]
-        if len(contacts) == 0:
+        names = self.__name_index.search(template.value)
+        if len(names) == 0:
             return None
-        return contacts
+        return [self.data[name] for name in names]
+
+    def iter_by_name(self, template: NameSearchTemplate) -> Iterator[Contact]:
+        """
+        Lazily yields the contacts whose name contains the template
+        (case-insensitive), like `find_by_name`, without building a list of them.
+
+        The contact book must not change while the iterator is in use.
+
+        :param template: The name template to search for.
+        :return: An iterator over the matching contacts.
+        """
+        return (self.data[name] for name in self.__name_index.iter_search(template.value))
 
     def find_by_phone(self, template: PhoneNumberSearchTemplate) -> list[Contact] | None:
         """
         Searches for contacts by a specified phone number substring.
 
-        This method looks for all contacts where the given name substring
-        is found (case-insensitive) in the contact's name. If no matching contacts
-        are found, it returns None.
+        This method looks for all contacts where the given phone number substring
+        is found in one of the contact's phone numbers. The lookup goes through
+        the digit trigram index of the phone numbers, which follows every change
+        made through the contacts' `Phones`. If no matching contacts are found,
+        it returns None.
+
+        :param template: The phone number template to search for.
+        :return: None
+        """
+        contacts = self.__phone_index.find(template)
+        if len(contacts) == 0:
+            return None
+        return contacts
+
+    def iter_by_phone(self, template: PhoneNumberSearchTemplate) -> Iterator[Contact]:
+        """
+        Lazily yields the contacts with a phone number that contains the
+        template, like `find_by_phone`, without building a list of them.
+
+        The contact book must not change while the iterator is in use.
 
         :param template: The phone number template to search for.
+        :return: An iterator over the matching contacts.
+        """
+        return self.__phone_index.iter_find(template)
+
+    def find_by_email(self, template: EmailSearchTemplate) -> list[Contact] | None:
+        """
+        Searches for contacts by email (case-insensitive).
+
+        A template like "@example.com" finds every contact with an address on
+        that domain, a full address finds its owners, and any other template
+        finds the contacts with an address that starts with it. The lookup goes
+        through the email index, which follows every change made through the
+        contacts' `Emails`. If no matching contacts are found, it returns None.
+
+        :param template: The email template to search for.
         :return: None
         """
-        contacts = [
-            contact for contact in self.data.values()
-            if contact.phones.contains(template)
-        ]
+        if template.is_domain:
+            contacts = self.__email_index.find_domain(template.value)
+        elif template.is_address:
+            contacts = self.__email_index.find_address(template.value)
+        else:
+            contacts = self.__email_index.find_prefix(template.value)
+        if len(contacts) == 0:
+            return None
+        return contacts
+
+    def find_upcoming_birthdays(self, days: int, today: date | None = None) -> list[Contact] | None:
+        """
+        Searches for contacts whose birthday falls within the given number of days.
+
+        The period starts today and wraps around the end of the year. Contacts
+        without a birthday are ignored, and with `days` equal to 0 only the
+        contacts whose birthday is today are returned. Only the days of the
+        period are looked up in the birthday calendar. If no matching contacts
+        are found, it returns None.
+
+        :param days: The number of days after today to include.
+        :param today: The first day of the period, today by default.
+        :return: The contacts ordered by the date of their next birthday.
+        """
+        contacts = self.__birthday_calendar.upcoming(days, today or date.today())
+        if len(contacts) == 0:
+            return None
+        return contacts
+
+    def find_by_birthday(self, start: date, end: date | None = None) -> list[Contact] | None:
+        """
+        Searches for contacts born on a date or between two dates.
+
+        The dates of birth are looked up with a binary search in the sorted
+        birthday index. If no matching contacts are found, it returns None.
+
+        :param start: The date of birth, or the first date of the range.
+        :param end: The last date of the range (included), or None to search
+            for `start` only.
+        :return: The contacts ordered by their date of birth.
+        """
+        contacts = self.__birthday_index.find_range(start, end or start)
+        if len(contacts) == 0:
+            return None
+        return contacts
+
+    def find_by_birth_year(self, year: int) -> list[Contact] | None:
+        """
+        Searches for contacts born in the year. If no matching contacts are
+        found, it returns None.
+
+        :param year: The year of birth.
+        :return: The contacts ordered by their date of birth.
+        """
+        contacts = self.__birthday_index.find_year(year)
+        if len(contacts) == 0:
+            return None
+        return contacts
+
+    def find_by_birth_month(self, month: int, year: int | None = None) -> list[Contact] | None:
+        """
+        Searches for contacts born in the month.
+
+        With a year the month is a range of dates in the sorted birthday index;
+        without one the days of the month are looked up in the birthday
+        calendar, whatever the year of birth. If no matching contacts are
+        found, it returns None.
+
+        :param month: The month of birth, from 1 to 12.
+        :param year: The year of birth, or None for any year.
+        :return: The contacts ordered by their date of birth, or by the day of
+            their birthday when no year is given.
+        """
+        if year is None:
+            contacts = self.__birthday_calendar.in_month(month)
+        else:
+            last = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+            contacts = self.__birthday_index.find_range(date(year, month, 1),
+                                                        last - timedelta(days=1))
         if len(contacts) == 0:
             return None
         return contacts
@@ -88,7 +232,14 @@ class ContactBook(UserDict[Name, Contact]):
         :param name: The name of the contact to be deleted.
         :returns: The deleted contact if it existed; otherwise, None.
         """
-        return self.data.pop(name, None)
+        contact = self.data.pop(name, None)
+        if contact is not None:
+            self.__name_index.remove(contact.name)
+            self.__phone_index.detach(contact)
+            self.__email_index.detach(contact)
+            self.__birthday_calendar.detach(contact)
+            self.__birthday_index.detach(contact)
+        return contact
 
     def __str__(self) -> str:
         return "ContactBook\n" + '\n'.join([f'{record}' for record in self.data.values()])
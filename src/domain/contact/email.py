@@ -3,12 +3,20 @@ Provides the Phone class.
 """
 
 import re
+import sys
 
 from src.error.invalid_email_error import InvalidEmailError
 
 
 class Email:
-    """Class for storing email."""
+    """
+    Class for storing email.
+
+    Many addresses share a few domains, so the casefolded domain is interned
+    and all addresses on a domain refer to one string.
+    """
+
+    __slots__ = ("__value", "__domain")
 
     __pattern: re.Pattern = re.compile(r"^([a-zA-Z0-9]+[0-9._-]*)+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
@@ -16,12 +24,18 @@ class Email:
         if re.fullmatch(Email.__pattern, number) is None:
             raise InvalidEmailError(number)
         self.__value = number
+        self.__domain = sys.intern(number[number.rindex("@") + 1:].casefold())
 
     @property
     def value(self) -> str:
         """Getter for the email"""
         return self.__value
 
+    @property
+    def domain(self) -> str:
+        """Getter for the casefolded domain of the email"""
+        return self.__domain
+
     def __eq__(self, other) -> bool:
         if type(self) != type(other):
             raise TypeError(f"Cannot compare {self!r} and {other!r}")
@@ -0,0 +1,110 @@
+"""
+Provides the EmailIndex class.
+
+The index answers email queries for a whole contact book (one address, every
+address on a domain, or the addresses that start with a prefix) without
+scanning the emails of every contact.
+"""
+from bisect import bisect_left, insort
+
+from src.domain.contact.contact import Contact
+from src.domain.contact.email import Email
+from src.domain.contact.name import Name
+from src.util.observable import ObserverIndex
+
+
+class EmailIndex(ObserverIndex[Contact, Email]):
+    """
+    An index of the email addresses of attached contacts.
+
+    Addresses are casefolded. Each distinct address maps to the contacts that
+    own it, each domain maps to its addresses, and a sorted list of all the
+    addresses answers prefix queries with a binary search. The index follows
+    the `Emails` collection of every attached contact.
+
+    `Emails` tells addresses apart by case, so one contact may own several
+    addresses that casefold to the same one. The index counts them per
+    contact and drops the contact from an address only with the last of them.
+    """
+
+    def __init__(self):
+        self.__owners: dict[str, dict[Name, Contact]] = {}
+        self.__counts: dict[tuple[str, Name], int] = {}
+        self.__domains: dict[str, dict[str, None]] = {}
+        self.__addresses: list[str] = []
+        super().__init__(lambda contact: contact.name, lambda contact: contact.emails,
+                         self.__add, self.__remove)
+
+    def find_address(self, address: str) -> list[Contact]:
+        """
+        Searches for the contacts that own the address (case-insensitive).
+
+        :param address: The full email address.
+        :return: The matching contacts.
+        """
+        return list(self.__owners.get(address.casefold(), {}).values())
+
+    def find_domain(self, domain: str) -> list[Contact]:
+        """
+        Searches for the contacts with an address on the domain (case-insensitive).
+
+        :param domain: The domain, with or without the leading "@".
+        :return: The matching contacts, each of them listed once.
+        """
+        addresses = self.__domains.get(domain.removeprefix("@").casefold(), {})
+        return self.__contacts(addresses)
+
+    def find_prefix(self, prefix: str) -> list[Contact]:
+        """
+        Searches for the contacts with an address that starts with the prefix
+        (case-insensitive).
+
+        :param prefix: The beginning of the address.
+        :return: The matching contacts in the order of their addresses, each of
+            them listed once.
+        """
+        prefix = prefix.casefold()
+        addresses = []
+        for position in range(bisect_left(self.__addresses, prefix), len(self.__addresses)):
+            address = self.__addresses[position]
+            if not address.startswith(prefix):
+                break
+            addresses.append(address)
+        return self.__contacts(addresses)
+
+    def __contacts(self, addresses) -> list[Contact]:
+        contacts: dict[Name, Contact] = {}
+        for address in addresses:
+            contacts.update(self.__owners[address])
+        return list(contacts.values())
+
+    def __add(self, email: Email, contact: Contact) -> None:
+        address = email.value.casefold()
+        key = (address, contact.name)
+        self.__counts[key] = self.__counts.get(key, 0) + 1
+        owners = self.__owners.get(address)
+        if owners is None:
+            owners = self.__owners[address] = {}
+            self.__domains.setdefault(email.domain, {})[address] = None
+            insort(self.__addresses, address)
+        owners[contact.name] = contact
+
+    def __remove(self, email: Email, contact: Contact) -> None:
+        address = email.value.casefold()
+        key = (address, contact.name)
+        count = self.__counts.pop(key, 0)
+        if count > 1:
+            self.__counts[key] = count - 1
+            return
+        owners = self.__owners.get(address)
+        if owners is None:
+            return
+        owners.pop(contact.name, None)
+        if len(owners) > 0:
+            return
+        del self.__owners[address]
+        del self.__addresses[bisect_left(self.__addresses, address)]
+        addresses = self.__domains[email.domain]
+        del addresses[address]
+        if len(addresses) == 0:
+            del self.__domains[email.domain]
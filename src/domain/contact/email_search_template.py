@@ -0,0 +1,37 @@
+"""Module for email search template."""
+from src.error.invalid_email_search_template_error import InvalidEmailSearchTemplateError
+
+
+class EmailSearchTemplate:
+    """
+    Class for storing email search template.
+
+    A template that starts with "@" selects a whole domain ("@example.com"),
+    a template with a local part and a domain selects one address, and any
+    other template selects the addresses that start with it ("john.d").
+    """
+
+    def __init__(self, template: str):
+        tripped_template = template.strip()
+        if len(tripped_template) == 0 or tripped_template == "@":
+            raise InvalidEmailSearchTemplateError(template)
+        self.__value = tripped_template
+
+    @property
+    def value(self) -> str:
+        """Getter for the email search template"""
+        return self.__value
+
+    @property
+    def is_domain(self) -> bool:
+        """Returns whether the template selects a whole domain."""
+        return self.__value.startswith("@")
+
+    @property
+    def is_address(self) -> bool:
+        """Returns whether the template selects one full address."""
+        local_part, at, domain = self.__value.partition("@")
+        return len(local_part) > 0 and len(at) > 0 and "." in domain
+
+    def __str__(self) -> str:
+        return str(self.__value)
@@ -11,14 +11,23 @@ from collections import UserList
 from src.domain.contact.email import Email
 from src.error.already_email_error import AlreadyEmailError
 from src.error.unknown_email_error import UnknownEmailError
+from src.util.key_index import KeyIndex
+from src.util.observable import Observable
 
 
-class Emails(UserList[Email]):
-    """A class for storing email addresses."""
+class Emails(UserList[Email], Observable[Email]):
+    """
+    A class for storing email addresses.
+
+    The emails are kept in a list in the order they were added and are found
+    by their values through a key index, without calling `__eq__`. Every
+    added, removed or replaced email is reported to the subscribers.
+    """
 
     def __init__(self):
-        self.data = []
         super().__init__()
+        Observable.__init__(self)
+        self.__index = KeyIndex(Emails.__key)
 
     def add(self, email: Email) -> bool:
         """
@@ -28,9 +37,10 @@ class Emails(UserList[Email]):
         This method checks if the provided email object is already indexed in
         the internal storage. If not, the email is appended to the data list.
         """
-        index_email = self.__index_email(email)
-        if index_email is None:
+        if not self.__index.contains(self.data, email):
             self.data.append(email)
+            self.__index.added(self.data, email)
+            self._notify(None, email)
             return True
 
         return False
@@ -46,7 +56,9 @@ class Emails(UserList[Email]):
         if index_email is None:
             raise UnknownEmailError(email.value)
 
-        self.data.pop(index_email)
+        removed_email = self.data.pop(index_email)
+        self.__index.removed(removed_email)
+        self._notify(removed_email, None)
 
     def replace(self, old_email: Email, new_email: Email) -> None:
         """
@@ -61,24 +73,27 @@ class Emails(UserList[Email]):
         if index_old_email is None:
             raise UnknownEmailError(old_email.value)
 
-        if self.__index_email(new_email) is not None:
+        if self.__index.contains(self.data, new_email):
             raise AlreadyEmailError(new_email.value)
 
+        replaced_email = self.data[index_old_email]
         self.data[index_old_email] = new_email
+        self.__index.replaced(replaced_email, new_email)
+        self._notify(replaced_email, new_email)
 
     def __index_email(self, email: Email) -> int | None:
         """
         Searches for an email object in the data collection and returns its index if found.
 
-        This method iterates through the collection of email objects stored in the `data`
-        attribute to identify if a given email object exists in the collection. If the
-        email object matches an item in the collection, it returns the index of the first
-        occurrence. Otherwise, it returns None.
+        The email objects stored in the `data` attribute are compared by their values
+        through the key index. If the email object matches an item in the collection,
+        it returns the index of the first occurrence. Otherwise, it returns None.
         """
-        for index, item in enumerate(self.data):
-            if item == email:
-                return index
-        return None
+        return self.__index.index(self.data, email)
+
+    @staticmethod
+    def __key(email: Email) -> str:
+        return email.value
 
     def __str__(self):
         if len(self.data) == 0:
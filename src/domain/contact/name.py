@@ -5,26 +5,42 @@ from src.error.invalid_name_error import InvalidNameError
 
 
 class Name:
-    """Class for storing the contact name."""
+    """
+    Class for storing the contact name.
+
+    Names are compared case-insensitively. The casefolded key is computed once
+    at construction and is used both for hashing and for equality, so a name
+    can be looked up in a dictionary regardless of its case. A name that is
+    already casefolded shares one string with its key.
+    """
+
+    __slots__ = ("__value", "__key")
 
     def __init__(self, value: str):
         clean_value = value.strip()
         if len(clean_value) < 2 or len(clean_value) > 64:
             raise InvalidNameError(value)
+        key = value.casefold()
         self.__value = value
+        self.__key = value if key == value else key
 
     @property
     def value(self) -> str:
         """Getter for the name value"""
         return self.__value
 
+    @property
+    def key(self) -> str:
+        """Getter for the normalized (casefolded) name value"""
+        return self.__key
+
     def __str__(self) -> str:
         return str(self.__value)
 
     def __hash__(self) -> int:
-        return hash(self.__value)
+        return hash(self.__key)
 
     def __eq__(self, other) -> bool:
         if type(self) != type(other):
             raise TypeError(f"Cannot compare {self!r} and {other!r}")
-        return self.value.casefold() == other.value.casefold()
+        return self.__key == other.key
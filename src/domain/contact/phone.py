@@ -9,6 +9,8 @@ from src.error.invalid_phone_number_error import InvalidPhoneNumberError
 class Phone:
     """Class for storing phone numbers. Has format validation (10-12 digits)"""
 
+    __slots__ = ("__value",)
+
     __pattern: re.Pattern = re.compile(r"^\d{10,12}$")
 
     def __init__(self, number: str):
@@ -0,0 +1,74 @@
+"""
+Provides the PhoneIndex class.
+
+The index answers phone number substring queries (for example, the last four
+digits of a number) for a whole contact book without scanning the phone
+numbers of every contact.
+"""
+from typing import Iterator
+
+from src.domain.contact.contact import Contact
+from src.domain.contact.name import Name
+from src.domain.contact.phone import Phone
+from src.domain.contact.phone_number_search_template import PhoneNumberSearchTemplate
+from src.util.observable import ObserverIndex
+from src.util.trigram_index import TrigramIndex
+
+
+class PhoneIndex(ObserverIndex[Contact, Phone]):
+    """
+    A digit trigram index of the phone numbers of attached contacts.
+
+    Each distinct phone number is indexed once, together with the contacts
+    that own it. The index follows the `Phones` collection of every attached
+    contact.
+    """
+
+    def __init__(self):
+        self.__numbers: TrigramIndex[str] = TrigramIndex()
+        self.__owners: dict[str, dict[Name, Contact]] = {}
+        super().__init__(lambda contact: contact.name, lambda contact: contact.phones,
+                         self.__add, self.__remove)
+
+    def find(self, template: PhoneNumberSearchTemplate) -> list[Contact]:
+        """
+        Searches for contacts with a phone number that contains the template.
+
+        :param template: The phone number template to search for.
+        :return: The matching contacts, each of them listed once.
+        """
+        return list(self.iter_find(template))
+
+    def iter_find(self, template: PhoneNumberSearchTemplate) -> Iterator[Contact]:
+        """
+        Yields the contacts with a phone number that contains the template,
+        one at a time.
+
+        Only the names of the contacts already yielded are kept, so a contact
+        with several matching numbers is listed once.
+
+        :param template: The phone number template to search for.
+        :return: An iterator over the matching contacts.
+        """
+        seen: set[Name] = set()
+        for number in self.__numbers.iter_search(template.value):
+            for name, contact in self.__owners[number].items():
+                if name not in seen:
+                    seen.add(name)
+                    yield contact
+
+    def __add(self, phone: Phone, contact: Contact) -> None:
+        owners = self.__owners.get(phone.value)
+        if owners is None:
+            owners = self.__owners[phone.value] = {}
+            self.__numbers.add(phone.value, phone.value)
+        owners[contact.name] = contact
+
+    def __remove(self, phone: Phone, contact: Contact) -> None:
+        owners = self.__owners.get(phone.value)
+        if owners is None:
+            return
+        owners.pop(contact.name, None)
+        if len(owners) == 0:
+            del self.__owners[phone.value]
+            self.__numbers.remove(phone.value)
@@ -11,13 +11,22 @@ from src.domain.contact.phone import Phone
 from src.domain.contact.phone_number_search_template import PhoneNumberSearchTemplate
 from src.error.already_phone_number_error import AlreadyPhoneNumberError
 from src.error.unknown_phone_number_error import UnknownPhoneNumberError
+from src.util.key_index import KeyIndex
+from src.util.observable import Observable
 
 
-class Phones(UserList[Phone]):
-    """A class for storing phone numbers."""
+class Phones(UserList[Phone], Observable[Phone]):
+    """
+    A class for storing phone numbers.
+
+    The phone numbers are kept in a list in the order they were added and are
+    found by their values through a key index, without calling `__eq__`.
+    """
 
     def __init__(self):
         self.data = []
+        self.__index = KeyIndex(Phones.__key)
+        Observable.__init__(self)
 
     def add(self, phone: Phone) -> Phone | None:
         """
@@ -27,9 +36,10 @@ class Phones(UserList[Phone]):
         :return: A new Phone object if the phone number is successfully added,
             or None if the phone number is already present in the list.
         """
-        index_phone_number = self.__index_phone_number(phone)
-        if index_phone_number is None:
+        if not self.__index.contains(self.data, phone):
             self.data.append(phone)
+            self.__index.added(self.data, phone)
+            self._notify(None, phone)
             return phone
 
         return None
@@ -48,7 +58,10 @@ class Phones(UserList[Phone]):
         index_phone_number = self.__index_phone_number(phone)
         if index_phone_number is None:
             return None
-        return self.data.pop(index_phone_number)
+        removed_phone = self.data.pop(index_phone_number)
+        self.__index.removed(removed_phone)
+        self._notify(removed_phone, None)
+        return removed_phone
 
     def replace(self, old_phone: Phone, new_phone: Phone) -> Phone:
         """
@@ -67,10 +80,13 @@ class Phones(UserList[Phone]):
         if index_old_phone_number is None:
             raise UnknownPhoneNumberError(old_phone.value)
 
-        if self.__index_phone_number(new_phone) is not None:
+        if self.__index.contains(self.data, new_phone):
             raise AlreadyPhoneNumberError(new_phone.value)
 
+        replaced_phone = self.data[index_old_phone_number]
         self.data[index_old_phone_number] = new_phone
+        self.__index.replaced(replaced_phone, new_phone)
+        self._notify(replaced_phone, new_phone)
         return new_phone
 
     def contains(self, template: PhoneNumberSearchTemplate) -> bool:
@@ -93,17 +109,18 @@ class Phones(UserList[Phone]):
         """
         Searches for the index of a phone number in the list of stored phone numbers.
 
-        This method iterates through the list of phone numbers and checks if any of the
-        numbers matches the provided phone number. If a match is found, the index of the
-        phone number in the list is returned. If no match is found, the method returns None.
+        The phone numbers are compared by their values through the key index. If a
+        match is found, the index of the phone number in the list is returned. If no
+        match is found, the method returns None.
 
         :param phone: The phone number to search for in the list.
         :return: The index of the phone number if found, or None if no match is found.
         """
-        for index, item in enumerate(self.data):
-            if item == phone:
-                return index
-        return None
+        return self.__index.index(self.data, phone)
+
+    @staticmethod
+    def __key(phone: Phone) -> str:
+        return phone.value
 
     def __str__(self):
         if len(self.data) == 0:
@@ -7,6 +7,8 @@ from src.error.invalid_content_error import InvalidContentError
 class Content:
     """Class for storing the note content."""
 
+    __slots__ = ("__value",)
+
     def __init__(self, value: str):
         clean_value = value.strip()
         if len(clean_value) < 1 or len(clean_value) > 512:
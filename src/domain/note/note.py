@@ -8,10 +8,10 @@ from src.domain.note.topic import Topic
 class Note:
     """Class for storing the note."""
 
-    def __init__(self, topic: Topic, content: Content, tags: Tags = Tags()):
+    def __init__(self, topic: Topic, content: Content, tags: Tags | None = None):
         self.__topic = topic
         self.__content = content
-        self.__tags: Tags = tags
+        self.__tags: Tags = tags if tags is not None else Tags()
 
     @property
     def topic(self) -> Topic:
@@ -23,6 +23,10 @@ class Note:
         """Getter for the content of the note."""
         return self.__content
 
+    def change_content(self, content: Content) -> None:
+        """Changes the content of the note."""
+        self.__content = content
+
     @property
     def tags(self) -> Tags:
         """Getter for the tags of the note."""
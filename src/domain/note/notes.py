@@ -1,13 +1,99 @@
 """A class for storing notes."""
 
 from collections import UserList
+from typing import Iterable, Iterator
 
+from src.domain.note.content import Content
 from src.domain.note.note import Note
+from src.domain.note.tag import Tag
+from src.domain.note.tag_index import TagIndex
+from src.domain.note.text_index import TextIndex
 from src.domain.note.topic import Topic
 
 
 class Notes(UserList[Note]):
-    """A class for storing notes."""
+    """
+    A class for storing notes.
+
+    The notes are stored in an insertion-ordered dictionary from the
+    casefolded topic to the note, so adding, finding and removing a note by
+    its topic take constant time. The list that `UserList` works on is built
+    from the dictionary when it is first read after a change, and every
+    `UserList` method that changes the list goes through the dictionary, so
+    the two never disagree; a note whose topic is already taken is skipped,
+    as `add` skips it. Lookups by tag
+    go through an inverted index of the tags of all notes, and text search
+    goes through a ranked full-text index of the topics and contents.
+    """
+
+    def __init__(self, initlist: Iterable[Note] | None = None):
+        self.__index: dict[str, Note] = {}
+        self.__list: list[Note] | None = None
+        self.__tag_index = TagIndex()
+        self.__text_index = TextIndex()
+        super().__init__()
+        if initlist is not None:
+            for note in initlist:
+                self.add(note)
+
+    @property
+    def data(self) -> list[Note]:
+        """Returns the notes in the order they were added."""
+        if self.__list is None:
+            self.__list = list(self.__index.values())
+        return self.__list
+
+    @data.setter
+    def data(self, notes: Iterable[Note]) -> None:
+        self.__assign(notes)
+
+    def __setitem__(self, index, value) -> None:
+        notes = list(self.data)
+        notes[index] = value
+        self.__assign(notes)
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            removed = self.data[index]
+        else:
+            removed = [self.data[index]]
+        for note in removed:
+            self.remove(note.topic)
+
+    def __iadd__(self, other: Iterable[Note]) -> "Notes":
+        self.extend(other)
+        return self
+
+    def __imul__(self, n: int) -> "Notes":
+        if n <= 0:
+            self.clear()
+        return self
+
+    def append(self, item: Note) -> None:
+        self.add(item)
+
+    def extend(self, other: Iterable[Note]) -> None:
+        for note in list(other):
+            self.add(note)
+
+    def insert(self, i: int, item: Note) -> None:
+        notes = list(self.data)
+        notes.insert(i, item)
+        self.__assign(notes)
+
+    def pop(self, i: int = -1) -> Note:
+        note = self.data[i]
+        self.remove(note.topic)
+        return note
+
+    def clear(self) -> None:
+        self.__assign([])
+
+    def reverse(self) -> None:
+        self.__assign(reversed(self.data))
+
+    def sort(self, /, *args, **kwds) -> None:
+        self.__assign(sorted(self.data, *args, **kwds))
 
     def add(self, note: Note) -> Note | None:
         """
@@ -18,11 +104,15 @@ class Notes(UserList[Note]):
         returns the added note.
 
         """
-        index_note = self.__index_note(note.topic)
-        if index_note is None:
-            self.data.append(note)
-            return note
-        return None
+        key = Notes.__key(note.topic)
+        if key in self.__index:
+            return None
+        self.__index[key] = note
+        if self.__list is not None:
+            self.__list.append(note)
+        self.__tag_index.attach(note)
+        self.__text_index.add(note)
+        return note
 
     def remove(self, topic: Topic) -> Note | None:
         """
@@ -32,10 +122,13 @@ class Notes(UserList[Note]):
         If a note is found, it is removed from the data storage and returned.
         If no matching note is found, the method returns None.
         """
-        index_note = self.__index_note(topic)
-        if index_note is None:
+        note = self.__index.pop(Notes.__key(topic), None)
+        if note is None:
             return None
-        return self.data.pop(index_note)
+        self.__list = None
+        self.__tag_index.detach(note)
+        self.__text_index.remove(note)
+        return note
 
     def find(self, topic: Topic) -> Note | None:
         """
@@ -44,16 +137,98 @@ class Notes(UserList[Note]):
         This method attempts to locate the note corresponding to the provided topic
         from the internal data storage. If no match is found, it returns None.
         """
-        index_note = self.__index_note(topic)
-        if index_note is None:
+        return self.__index.get(Notes.__key(topic), None)
+
+    def change_content(self, topic: Topic, content: Content) -> Note | None:
+        """
+        Changes the content of the note with the given topic.
+
+        The note is re-indexed for text search. If no matching note is found,
+        the method returns None.
+        """
+        note = self.find(topic)
+        if note is None:
             return None
-        return self.data[index_note]
+        self.__text_index.remove(note)
+        note.change_content(content)
+        self.__text_index.add(note)
+        return note
+
+    def find_by_tags(self, tags: list[Tag], match_all: bool = False) -> list[Note]:
+        """
+        Searches for notes by tags (case-insensitive).
+
+        With `match_all` the notes must carry every one of the given tags (AND),
+        otherwise any one of them is enough (OR). The search intersects or
+        unites the sets of notes of each tag in the inverted tag index.
+
+        :param tags: The tags to search for.
+        :param match_all: Whether a note must carry all the tags.
+        :return: The matching notes, or an empty list if there are none.
+        """
+        if match_all:
+            return self.__tag_index.find_all(tags)
+        return self.__tag_index.find_any(tags)
+
+    def iter_by_tags(self, tags: list[Tag], match_all: bool = False) -> Iterator[Note]:
+        """
+        Lazily yields the notes found by tags (case-insensitive), like
+        `find_by_tags`, without building a list of them.
+
+        :param tags: The tags to search for.
+        :param match_all: Whether a note must carry all the tags.
+        :return: An iterator over the matching notes.
+        """
+        if match_all:
+            return self.__tag_index.iter_all(tags)
+        return self.__tag_index.iter_any(tags)
+
+    def find_by_text(self, text: str, limit: int | None = None) -> list[Note]:
+        """
+        Searches for notes whose topic or content contains words of the text.
+
+        The notes are ranked by relevance (BM25) and the best matches come first.
+
+        :param text: The text to search for.
+        :param limit: The maximum number of notes to return, or None for all.
+        :return: The matching notes, or an empty list if there are none.
+        """
+        return self.__text_index.search(text, limit)
+
+    def iter_by_text(self, text: str) -> Iterator[Note]:
+        """
+        Lazily yields the notes whose topic or content contains words of the
+        text, best matches first.
+
+        :param text: The text to search for.
+        :return: An iterator over the matching notes.
+        """
+        return self.__text_index.iter_search(text)
+
+    def __assign(self, notes: Iterable[Note]) -> None:
+        """
+        Replaces the notes with the given ones, in their order.
+
+        Only the notes that are new or gone are indexed again, so reordering
+        the notes does not touch the tag and text indexes.
+        """
+        index: dict[str, Note] = {}
+        for note in notes:
+            index.setdefault(Notes.__key(note.topic), note)
+        for key, note in self.__index.items():
+            if index.get(key) is not note:
+                self.__tag_index.detach(note)
+                self.__text_index.remove(note)
+        for key, note in index.items():
+            if self.__index.get(key) is not note:
+                self.__tag_index.attach(note)
+                self.__text_index.add(note)
+        self.__index = index
+        self.__list = None
 
-    def __index_note(self, topic: Topic) -> int | None:
+    @staticmethod
+    def __key(topic: Topic) -> str:
         """
-        Searches for the index of a note in the list of stored notes.
+        Returns the index key of a topic.
         """
-        for index, item in enumerate(self.data):
-            if item.topic == topic:
-                return index
-        return None
+        return topic.value.casefold()
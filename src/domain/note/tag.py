@@ -1,16 +1,24 @@
 """Provides the Tag class."""
+import sys
 
 from src.error.invalid_tag_error import InvalidTagError
 
 
 class Tag:
-    """Class for storing the tag."""
+    """
+    Class for storing the tag.
+
+    The same few tags are used across many notes, so the tag values are
+    interned and all equal tags share one string.
+    """
+
+    __slots__ = ("__value",)
 
     def __init__(self, value: str):
         clean_value = value.strip()
         if len(clean_value) < 1 or len(clean_value) > 32:
             raise InvalidTagError(value)
-        self.__value = value
+        self.__value = sys.intern(value)
 
     @property
     def value(self) -> str:
@@ -0,0 +1,107 @@
+"""
+Provides the TagIndex class.
+
+The index maps every tag used in the notes to the notes that carry it, so
+notes can be found by one or several tags without scanning the tags of
+every note.
+"""
+from typing import Iterator
+
+from src.domain.note.note import Note
+from src.domain.note.tag import Tag
+from src.util.observable import ObserverIndex
+
+
+class TagIndex(ObserverIndex[Note, Tag]):
+    """
+    An inverted index from the casefolded tag to the notes that carry it.
+
+    The index follows the `Tags` collection of every attached note.
+    """
+
+    def __init__(self):
+        self.__postings: dict[str, dict[str, Note]] = {}
+        super().__init__(TagIndex.__note_key, lambda note: note.tags, self.__add, self.__remove)
+
+    def find_all(self, tags: list[Tag]) -> list[Note]:
+        """
+        Searches for the notes that carry every one of the given tags.
+
+        :param tags: The tags to search for.
+        :return: The notes that carry all the tags.
+        """
+        return list(self.iter_all(tags))
+
+    def iter_all(self, tags: list[Tag]) -> Iterator[Note]:
+        """
+        Yields the notes that carry every one of the given tags, one at a time.
+
+        :param tags: The tags to search for.
+        :return: An iterator over the notes that carry all the tags.
+        """
+        postings = []
+        for tag in tags:
+            posting = self.__postings.get(TagIndex.__tag_key(tag))
+            if posting is None:
+                return iter(())
+            postings.append(posting)
+        if len(postings) == 0:
+            return iter(())
+        postings.sort(key=len)
+
+        smallest, others = postings[0], postings[1:]
+        return (
+            note for note_key, note in smallest.items()
+            if all(note_key in posting for posting in others)
+        )
+
+    def find_any(self, tags: list[Tag]) -> list[Note]:
+        """
+        Searches for the notes that carry at least one of the given tags.
+
+        :param tags: The tags to search for.
+        :return: The notes that carry any of the tags, each of them listed once.
+        """
+        return list(self.iter_any(tags))
+
+    def iter_any(self, tags: list[Tag]) -> Iterator[Note]:
+        """
+        Yields the notes that carry at least one of the given tags, one at a time.
+
+        A note is skipped in the posting list of a tag if it is in the posting
+        list of an earlier tag, so every note is yielded once without keeping
+        a set of the notes already seen.
+
+        :param tags: The tags to search for.
+        :return: An iterator over the notes that carry any of the tags.
+        """
+        postings: list[dict[str, Note]] = []
+        for key in dict.fromkeys(TagIndex.__tag_key(tag) for tag in tags):
+            posting = self.__postings.get(key)
+            if posting is None:
+                continue
+            for note_key, note in posting.items():
+                if not any(note_key in earlier for earlier in postings):
+                    yield note
+            postings.append(posting)
+
+    def __add(self, tag: Tag, note: Note) -> None:
+        posting = self.__postings.setdefault(TagIndex.__tag_key(tag), {})
+        posting[TagIndex.__note_key(note)] = note
+
+    def __remove(self, tag: Tag, note: Note) -> None:
+        tag_key = TagIndex.__tag_key(tag)
+        posting = self.__postings.get(tag_key)
+        if posting is None:
+            return
+        posting.pop(TagIndex.__note_key(note), None)
+        if len(posting) == 0:
+            del self.__postings[tag_key]
+
+    @staticmethod
+    def __tag_key(tag: Tag) -> str:
+        return tag.value.casefold()
+
+    @staticmethod
+    def __note_key(note: Note) -> str:
+        return note.topic.value.casefold()
@@ -11,13 +11,39 @@ from src.domain.note.tag import Tag
 from src.domain.note.tag_search_template import TagSearchTemplate
 from src.error.already_tag_error import AlreadyTagError
 from src.error.unknown_tag_error import UnknownTagError
+from src.util.key_index import KeyIndex
+from src.util.observable import Observable
 
 
-class Tags(UserList[Tag]):
-    """A class for storing tags."""
+class Tags(UserList[Tag], Observable[Tag]):
+    """
+    A class for storing tags.
+
+    The tags are kept in a list in the order they were added and are found by
+    their casefolded values through a key index, without calling `__eq__`.
+    """
 
     def __init__(self):
         self.data = []
+        self.__index = KeyIndex(Tags.__key)
+        Observable.__init__(self)
+
+    @staticmethod
+    def from_string(value: str) -> "Tags":
+        """
+        Creates tags from a comma-separated string, for example 'tag1,tag2,tag3'.
+
+        Empty items are skipped and duplicate tags are added once.
+
+        :param value: The comma-separated list of tags.
+        :return: The created tags.
+        :raises InvalidTagError: If one of the tags is invalid.
+        """
+        tags = Tags()
+        for item in value.split(","):
+            if len(item.strip()) > 0:
+                tags.add(Tag(item.strip()))
+        return tags
 
     def add(self, tag: Tag) -> Tag | None:
         """
@@ -27,9 +53,10 @@ class Tags(UserList[Tag]):
         :return: A new Phone object if the tag is successfully added,
             or None if the tag is already present in the list.
         """
-        index_phone_number = self.__index_tag(tag)
-        if index_phone_number is None:
+        if not self.__index.contains(self.data, tag):
             self.data.append(tag)
+            self.__index.added(self.data, tag)
+            self._notify(None, tag)
             return tag
 
         return None
@@ -48,7 +75,10 @@ class Tags(UserList[Tag]):
         index_phone_number = self.__index_tag(tag)
         if index_phone_number is None:
             return None
-        return self.data.pop(index_phone_number)
+        removed_tag = self.data.pop(index_phone_number)
+        self.__index.removed(removed_tag)
+        self._notify(removed_tag, None)
+        return removed_tag
 
     def replace(self, old_tag: Tag, new_tag: Tag) -> Tag:
         """
@@ -66,10 +96,13 @@ class Tags(UserList[Tag]):
         if index_old_tag is None:
             raise UnknownTagError(old_tag.value)
 
-        if self.__index_tag(new_tag) is not None:
+        if self.__index.contains(self.data, new_tag):
             raise AlreadyTagError(new_tag.value)
 
+        replaced_tag = self.data[index_old_tag]
         self.data[index_old_tag] = new_tag
+        self.__index.replaced(replaced_tag, new_tag)
+        self._notify(replaced_tag, new_tag)
         return new_tag
 
     def contains(self, template: TagSearchTemplate) -> bool:
@@ -92,17 +125,18 @@ class Tags(UserList[Tag]):
         """
         Searches for the index of a tag in the list of stored tags.
 
-        This method iterates through the list of tags and checks if any of the
-        numbers matches the provided tag. If a match is found, the index of the
-        tag in the list is returned. If no match is found, the method returns None.
+        The tags are compared by their casefolded values through the key index.
+        If a match is found, the index of the tag in the list is returned. If no
+        match is found, the method returns None.
 
         :param tag: The tag to search for in the list.
         :return: The index of the tag if found, or None if no match is found.
         """
-        for index, item in enumerate(self.data):
-            if item == tag:
-                return index
-        return None
+        return self.__index.index(self.data, tag)
+
+    @staticmethod
+    def __key(tag: Tag) -> str:
+        return tag.value.casefold()
 
     def __str__(self):
         if len(self.data) == 0:
@@ -0,0 +1,139 @@
+"""
+Provides the TextIndex class.
+
+The index tokenizes the topic and the content of every note and ranks the
+notes that match a free-text query with the BM25 scoring function.
+"""
+import heapq
+import math
+import re
+from typing import Iterator
+
+from src.domain.note.note import Note
+
+
+class TextIndex:
+    """
+    A tokenized inverted index over the topic and content of notes.
+
+    Each term keeps a posting list with the number of its occurrences in every
+    note that contains it. A query scores only the notes found in the posting
+    lists of its terms, and the best matches are taken from a heap, so neither
+    the whole collection is scanned nor all results are sorted up front.
+    """
+
+    k1 = 1.2
+    b = 0.75
+
+    __token_pattern: re.Pattern = re.compile(r"\w+")
+
+    def __init__(self):
+        self.__postings: dict[str, dict[str, int]] = {}
+        self.__notes: dict[str, tuple[Note, int, int]] = {}
+        self.__total_length = 0
+        self.__sequence = 0
+
+    def add(self, note: Note) -> None:
+        """
+        Indexes the topic and the content of the note.
+
+        :param note: The note to index.
+        """
+        note_key = TextIndex.__note_key(note)
+        if note_key in self.__notes:
+            self.remove(note)
+        tokens = TextIndex.tokenize(f"{note.topic.value} {note.content.value}")
+        for token in tokens:
+            posting = self.__postings.setdefault(token, {})
+            posting[note_key] = posting.get(note_key, 0) + 1
+        self.__notes[note_key] = (note, len(tokens), self.__sequence)
+        self.__total_length += len(tokens)
+        self.__sequence += 1
+
+    def remove(self, note: Note) -> None:
+        """
+        Removes the note from the index.
+
+        :param note: The note to remove.
+        """
+        note_key = TextIndex.__note_key(note)
+        entry = self.__notes.pop(note_key, None)
+        if entry is None:
+            return
+        self.__total_length -= entry[1]
+        for token in set(TextIndex.tokenize(f"{note.topic.value} {note.content.value}")):
+            posting = self.__postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(note_key, None)
+            if len(posting) == 0:
+                del self.__postings[token]
+
+    def search(self, text: str, limit: int | None = None) -> list[Note]:
+        """
+        Returns the notes that match the text, best matches first.
+
+        :param text: The free-text query.
+        :param limit: The maximum number of notes to return, or None for all.
+        :return: The matching notes ordered by descending score.
+        """
+        ranked = self.__rank(text)
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, ranked)
+        else:
+            ranked.sort()
+        return [self.__notes[note_key][0] for _, _, note_key in ranked]
+
+    def iter_search(self, text: str) -> Iterator[Note]:
+        """
+        Yields the notes that match the text, best matches first.
+
+        The ranked candidates are kept in a heap and popped one at a time, so
+        taking the first N results costs O(N log n) instead of a full sort.
+
+        :param text: The free-text query.
+        :return: An iterator over the matching notes ordered by descending score.
+        """
+        ranked = self.__rank(text)
+        heapq.heapify(ranked)
+        while ranked:
+            _, _, note_key = heapq.heappop(ranked)
+            yield self.__notes[note_key][0]
+
+    @staticmethod
+    def tokenize(text: str) -> list[str]:
+        """Splits the text into casefolded word tokens."""
+        return TextIndex.__token_pattern.findall(text.casefold())
+
+    def __rank(self, text: str) -> list[tuple[float, int, str]]:
+        """
+        Scores every note that contains at least one term of the text.
+
+        :return: A list of (negated score, insertion sequence, note key) tuples,
+            so that the smallest tuple is the best match.
+        """
+        count = len(self.__notes)
+        if count == 0:
+            return []
+        average_length = self.__total_length / count
+
+        scores: dict[str, float] = {}
+        for term in set(TextIndex.tokenize(text)):
+            posting = self.__postings.get(term)
+            if posting is None:
+                continue
+            idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for note_key, frequency in posting.items():
+                length = self.__notes[note_key][1]
+                norm = TextIndex.k1 * (1 - TextIndex.b + TextIndex.b * length / average_length)
+                score = idf * frequency * (TextIndex.k1 + 1) / (frequency + norm)
+                scores[note_key] = scores.get(note_key, 0.0) + score
+
+        return [
+            (-score, self.__notes[note_key][2], note_key)
+            for note_key, score in scores.items()
+        ]
+
+    @staticmethod
+    def __note_key(note: Note) -> str:
+        return note.topic.value.casefold()
@@ -6,6 +6,8 @@ from src.error.invalid_topic_error import InvalidTopicError
 class Topic:
     """Class for storing the note topic."""
 
+    __slots__ = ("__value",)
+
     def __init__(self, value: str):
         clean_value = value.strip()
         if len(clean_value) < 1 or len(clean_value) > 32:
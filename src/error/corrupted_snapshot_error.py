@@ -0,0 +1,15 @@
+"""
+Defines a custom exception class for handling snapshots that cannot be restored.
+"""
+
+
+class CorruptedSnapshotError(ValueError):
+    """
+    Exception raised when neither the main snapshot nor its backup can be read.
+    """
+
+    def __init__(self, path: str):
+        self.message = f"Cannot restore data: snapshot '{path}' and its backup are corrupted."
+
+    def __str__(self) -> str:
+        return self.message
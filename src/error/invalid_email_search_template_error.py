@@ -0,0 +1,16 @@
+"""
+Exception raised for invalid email search templates.
+
+This exception is used to indicate that the provided email search template
+does not meet the expected format or requirements.
+"""
+
+
+class InvalidEmailSearchTemplateError(ValueError):
+    """Represents an error raised for an invalid email search template."""
+
+    def __init__(self, template: str):
+        self.message = f"Invalid email search template: '{template}'."
+
+    def __str__(self) -> str:
+        return self.message
@@ -0,0 +1,14 @@
+"""
+Defines a custom exception class for import files that cannot be read to the end.
+"""
+
+
+class UnreadableImportFileError(ValueError):
+    """Exception raised when an import file cannot be decoded or parsed partway through."""
+
+    def __init__(self, path: str, line: int, reason: str):
+        self.line = line
+        self.message = f"Cannot import '{path}': line {line}: {reason}. No contacts were imported."
+
+    def __str__(self) -> str:
+        return self.message
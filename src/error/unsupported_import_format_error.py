@@ -0,0 +1,13 @@
+"""
+Defines a custom exception class for handling files that cannot be imported.
+"""
+
+
+class UnsupportedImportFormatError(ValueError):
+    """Exception raised when the format of an import file is not supported."""
+
+    def __init__(self, path: str):
+        self.message = f"Cannot import '{path}': expected a .csv or .jsonl file."
+
+    def __str__(self) -> str:
+        return self.message
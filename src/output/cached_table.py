@@ -0,0 +1,55 @@
+"""
+Provides the CachedTable class.
+
+Tables whose content only changes at known moments, such as the help of the
+commands, are built once and their text is kept per renderer, so showing
+them again costs a single write.
+"""
+import sys
+from typing import Callable
+
+from src.output.output import renderer
+from src.output.table import Table
+
+
+class CachedTable:
+    """
+    A table built on first use and shown from its cached text afterwards.
+
+    The text is cached per renderer. The layout of a renderer that is not
+    `cacheable`, like the rich one, depends on the terminal, so the cached
+    table is printed through it each time instead and only the building is
+    saved.
+    """
+
+    def __init__(self, build: Callable[[], Table]):
+        """
+        :param build: Builds the table; called again after `invalidate`.
+        """
+        self.__build = build
+        self.__table: Table | None = None
+        self.__texts: dict[str, str] = {}
+
+    @property
+    def table(self) -> Table:
+        """Returns the table, building it on first access."""
+        table = self.__table
+        if table is None:
+            table = self.__table = self.__build()
+        return table
+
+    def show(self) -> None:
+        """Prints the table with the current renderer."""
+        output = renderer()
+        if not output.cacheable:
+            output.table(self.table)
+            return
+        text = self.__texts.get(output.name)
+        if text is None:
+            text = self.__texts[output.name] = output.format_table(self.table)
+        sys.stdout.write(text)
+
+    def invalidate(self) -> None:
+        """Drops the table and its texts, so they are built again when next shown."""
+        self.__table = None
+        self.__texts = {}
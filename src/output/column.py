@@ -0,0 +1,40 @@
+"""
+Defines the `Column` class describing a column of a rendered table.
+"""
+
+
+class Column:
+    """A column of a table: its header and how the interactive renderer styles it."""
+
+    def __init__(self, header: str, style: str | None = None, justify: str = "left",
+                 no_wrap: bool = False):
+        """
+        :param header: The header of the column.
+        :param style: The console style of the cells, for example "blue".
+        :param justify: "left" or "right".
+        :param no_wrap: Whether the cells must not be wrapped.
+        """
+        self.__header = header
+        self.__style = style
+        self.__justify = justify
+        self.__no_wrap = no_wrap
+
+    @property
+    def header(self) -> str:
+        """Returns the header of the column."""
+        return self.__header
+
+    @property
+    def style(self) -> str | None:
+        """Returns the console style of the cells."""
+        return self.__style
+
+    @property
+    def justify(self) -> str:
+        """Returns how the cells are aligned: "left" or "right"."""
+        return self.__justify
+
+    @property
+    def no_wrap(self) -> bool:
+        """Returns whether the cells must not be wrapped."""
+        return self.__no_wrap
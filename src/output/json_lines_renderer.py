@@ -0,0 +1,29 @@
+"""JSON lines renderer."""
+import json
+import sys
+
+from src.output.renderer import Renderer
+from src.output.table import Table
+from src.util.markup import strip_markup
+
+
+class JsonLinesRenderer(Renderer):
+    """
+    Renders every table row as a JSON object on a line of its own, keyed by
+    the column headers, and every message as an object with a "message" key.
+    Empty messages, which only separate the output on a console, are left out.
+    """
+
+    name = "json"
+
+    def print(self, text: str = "") -> None:
+        """Prints the message as a JSON object."""
+        if text == "":
+            return
+        sys.stdout.write(json.dumps({"message": strip_markup(text)}) + "\n")
+
+    def format_table(self, table: Table) -> str:
+        """Returns one JSON object per row."""
+        headers = [column.header.casefold() for column in table.columns]
+        lines = [json.dumps(dict(zip(headers, row))) for row in table]
+        return "\n".join(lines) + "\n" if len(lines) > 0 else ""
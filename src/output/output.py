@@ -0,0 +1,44 @@
+"""
+Selects the renderer for the output of the commands.
+
+Unless a renderer has been chosen explicitly, the rich renderer is used when
+the standard output is a terminal and the plain renderer otherwise, so piped
+output, batch scripts and the socket server never import rich. The check is
+made on every call, because the standard output may be redirected or
+captured for a single command.
+"""
+import sys
+
+from src.output.json_lines_renderer import JsonLinesRenderer
+from src.output.plain_renderer import PlainRenderer
+from src.output.renderer import Renderer
+from src.output.rich_renderer import RichRenderer
+from src.output.tsv_renderer import TsvRenderer
+
+RENDERERS: dict[str, Renderer] = {
+    renderer.name: renderer
+    for renderer in (RichRenderer(), PlainRenderer(), TsvRenderer(), JsonLinesRenderer())
+}
+
+_selected: Renderer | None = None
+
+
+def select_renderer(name: str | None) -> None:
+    """
+    Chooses the renderer by its name, or None to choose it by the standard
+    output again.
+
+    :param name: "rich", "plain", "tsv", "json" or None.
+    """
+    global _selected  # pylint: disable=global-statement
+    if name is not None and name not in RENDERERS:
+        raise ValueError(f"Unknown output format: '{name}'.")
+    _selected = None if name is None else RENDERERS[name]
+
+
+def renderer() -> Renderer:
+    """Returns the renderer for the current standard output."""
+    if _selected is not None:
+        return _selected
+    isatty = getattr(sys.stdout, "isatty", None)
+    return RENDERERS["rich"] if isatty is not None and isatty() else RENDERERS["plain"]
@@ -0,0 +1,51 @@
+"""
+Shows rows of a table page by page as they are produced.
+
+The rows are taken from an iterator and rendered in chunks, so the first
+rows appear as soon as they are found and only one chunk is held in memory,
+however many rows there are. On an interactive terminal a chunk fills the
+screen and the pager waits for the user before the next one; otherwise the
+chunks are written one after another without stopping.
+"""
+import shutil
+import sys
+from itertools import islice
+from typing import Callable, Iterable
+
+from src.output.output import renderer
+from src.output.rich_renderer import RichRenderer
+from src.output.table import Table
+
+CHUNK_SIZE = 1000
+PROMPT = "-- more -- (Enter: next page, q: stop) "
+
+
+def show_paged(rows: Iterable[tuple[str, ...]], new_table: Callable[[bool], Table]) -> int:
+    """
+    Renders the rows in tables of one chunk each.
+
+    :param rows: The rows to show, usually a lazy iterator.
+    :param new_table: Creates an empty table; its argument tells whether the
+        table is the first one and should show the header.
+    :return: The number of rows shown.
+    """
+    output = renderer()
+    interactive = isinstance(output, RichRenderer) and _is_terminal(sys.stdin)
+    size = max(shutil.get_terminal_size().lines - 8, 5) if interactive else CHUNK_SIZE
+    iterator = iter(rows)
+    shown = 0
+    chunk = list(islice(iterator, size))
+    while chunk:
+        table = new_table(shown == 0)
+        table.extend(chunk)
+        output.table(table)
+        shown += len(chunk)
+        chunk = list(islice(iterator, size))
+        if chunk and interactive and input(PROMPT).strip().casefold() == "q":
+            break
+    return shown
+
+
+def _is_terminal(stream) -> bool:
+    isatty = getattr(stream, "isatty", None)
+    return isatty is not None and isatty()
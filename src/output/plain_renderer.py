@@ -0,0 +1,42 @@
+"""Fixed-width plain-text renderer."""
+from src.output.renderer import Renderer
+from src.output.table import Table
+
+
+class PlainRenderer(Renderer):
+    """
+    Renders tables as fixed-width plain text without colors.
+
+    Every column is as wide as its widest cell, and the columns are separated
+    by two spaces. The table is written with a single call, so thousands of
+    rows cost two passes over the cells and one join.
+    """
+
+    name = "plain"
+    separator = "  "
+
+    def format_table(self, table: Table) -> str:
+        """Returns the table as aligned columns."""
+        rows = list(table)
+        if table.show_header:
+            rows.insert(0, tuple(column.header for column in table.columns))
+        if len(rows) == 0:
+            return ""
+        widths = [max(map(len, cells)) for cells in zip(*rows)]
+        right = [column.justify == "right" for column in table.columns]
+        last = len(widths) - 1
+
+        lines = []
+        for row in rows:
+            cells = []
+            for index, cell in enumerate(row):
+                if right[index]:
+                    cells.append(cell.rjust(widths[index]))
+                elif index < last:
+                    cells.append(cell.ljust(widths[index]))
+                else:
+                    cells.append(cell)
+            lines.append(PlainRenderer.separator.join(cells).rstrip())
+        if table.show_header and table.bordered:
+            lines.insert(1, PlainRenderer.separator.join("-" * width for width in widths))
+        return "\n".join(lines) + "\n"
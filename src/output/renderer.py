@@ -0,0 +1,33 @@
+"""Base class for output renderers."""
+import sys
+from abc import ABC, abstractmethod
+
+from src.output.table import Table
+from src.util.markup import strip_markup
+
+
+class Renderer(ABC):
+    """
+    Base class for output renderers.
+
+    A renderer prints messages with console markup and tables to the current
+    standard output. The base class prints the messages without markup;
+    subclasses lay out the tables as text in `format_table`. The text of a
+    `cacheable` renderer does not depend on the terminal, so it can be kept
+    and written again.
+    """
+
+    name = ""
+    cacheable = True
+
+    def print(self, text: str = "") -> None:
+        """Prints a message, which may contain console markup."""
+        sys.stdout.write(strip_markup(text) + "\n")
+
+    def table(self, table: Table) -> None:
+        """Prints a table."""
+        sys.stdout.write(self.format_table(table))
+
+    @abstractmethod
+    def format_table(self, table: Table) -> str:
+        """Returns the table as the text `table` prints."""
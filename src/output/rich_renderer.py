@@ -0,0 +1,54 @@
+"""Interactive renderer using the rich library."""
+from src.output.renderer import Renderer
+from src.output.table import Table
+
+
+class RichRenderer(Renderer):
+    """
+    Renders colored messages and boxed tables with rich.
+
+    rich is imported on first use, so it stays out of the startup path and is
+    never imported when the output is not a terminal. The tables fit the
+    width of the terminal, so their text is not cached. The cells are plain
+    text, so a bracket in a name is never taken for markup.
+    """
+
+    name = "rich"
+    cacheable = False
+
+    def print(self, text: str = "") -> None:
+        """Prints a message, interpreting its console markup."""
+        import rich  # pylint: disable=import-outside-toplevel
+        rich.print(text)
+
+    def table(self, table: Table) -> None:
+        """Prints the table as a rich table."""
+        import rich  # pylint: disable=import-outside-toplevel
+        rich.print(self.__rich_table(table))
+
+    def format_table(self, table: Table) -> str:
+        """Returns the table as rich lays it out for the current terminal."""
+        from rich.console import Console  # pylint: disable=import-outside-toplevel
+
+        console = Console()
+        with console.capture() as capture:
+            console.print(self.__rich_table(table))
+        return capture.get()
+
+    @staticmethod
+    def __rich_table(table: Table):
+        """Converts the table to a rich table."""
+        from rich import box  # pylint: disable=import-outside-toplevel
+        from rich.table import Table as RichTable  # pylint: disable=import-outside-toplevel
+        from rich.text import Text  # pylint: disable=import-outside-toplevel
+
+        rich_table = RichTable(
+            box=box.SIMPLE_HEAD if table.bordered else None, show_header=table.show_header
+        )
+        for column in table.columns:
+            rich_table.add_column(
+                column.header, justify=column.justify, style=column.style, no_wrap=column.no_wrap
+            )
+        for row in table:
+            rich_table.add_row(*map(Text, row))
+        return rich_table
@@ -0,0 +1,45 @@
+"""
+Defines the `Table` class: rows of text that every renderer can show.
+"""
+from collections import UserList
+
+from src.output.column import Column
+
+
+class Table(UserList[tuple[str, ...]]):
+    """
+    A table to render: its columns and its rows of plain-text cells.
+
+    The table only holds the data, so building it costs no more than building
+    the rows; each renderer decides how to lay it out.
+    """
+
+    def __init__(self, *columns: Column, show_header: bool = True, bordered: bool = True):
+        """
+        :param columns: The columns of the table.
+        :param show_header: Whether the headers of the columns are shown.
+        :param bordered: Whether the header is separated from the rows by a line.
+        """
+        super().__init__()
+        self.__columns = columns
+        self.__show_header = show_header
+        self.__bordered = bordered
+
+    @property
+    def columns(self) -> tuple[Column, ...]:
+        """Returns the columns of the table."""
+        return self.__columns
+
+    @property
+    def show_header(self) -> bool:
+        """Returns whether the headers of the columns are shown."""
+        return self.__show_header
+
+    @property
+    def bordered(self) -> bool:
+        """Returns whether the header is separated from the rows by a line."""
+        return self.__bordered
+
+    def add_row(self, *cells: str) -> None:
+        """Adds a row with one cell per column."""
+        self.data.append(cells)
@@ -0,0 +1,24 @@
+"""Tab-separated values renderer."""
+from src.output.renderer import Renderer
+from src.output.table import Table
+
+
+class TsvRenderer(Renderer):
+    """
+    Renders tables as tab-separated values, one row per line, for tools such
+    as cut, sort and awk.
+
+    The header is written when the table shows it, and tabs, newlines and backslashes in the
+    cells are escaped as "\\t", "\\n" and "\\\\".
+    """
+
+    name = "tsv"
+
+    __escapes = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+    def format_table(self, table: Table) -> str:
+        """Returns the table as tab-separated values."""
+        lines = ["\t".join(column.header for column in table.columns)] if table.show_header else []
+        escapes = TsvRenderer.__escapes
+        lines.extend("\t".join(cell.translate(escapes) for cell in row) for row in table)
+        return "\n".join(lines) + "\n" if len(lines) > 0 else ""
@@ -6,7 +6,7 @@ associated arguments, and converts them into `Command` objects for further
 use in the application flow.
 """
 from src.command.command import Command
-from src.parser.lexemes_builder import LexemesBuilder
+from src.parser.tokenizer import tokenize
 
 
 def parse(input_line: str) -> Command | None:
@@ -20,10 +20,7 @@ def parse(input_line: str) -> Command | None:
     :param input_line: The raw input string to be parsed.
     :return: An object containing the extracted command name and a list of its arguments.
     """
-    builder = LexemesBuilder()
-    for char in input_line:
-        builder.append_char(char)
-    lexemes = builder.build()
+    lexemes = tokenize(input_line)
     if len(lexemes) == 0:
         return None
 
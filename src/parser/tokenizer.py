@@ -0,0 +1,47 @@
+"""
+Splits input lines into lexemes in a single pass.
+
+The tokenizer follows the same rules as `LexemesBuilder`: lexemes are
+separated by spaces, single or double quotation marks group text (spaces and
+the other kind of quotation mark included) into a lexeme, quoted and unquoted
+parts that touch form one lexeme, and empty lexemes are dropped. Instead of
+feeding the line one character at a time, it matches whole runs of characters
+with a compiled regular expression and slices them out of the line.
+"""
+import re
+
+_SEGMENT_PATTERN: re.Pattern = re.compile(
+    r"""(?P<space> +)|(?P<bare>[^ '"]+)|'(?P<single>[^']*)'|"(?P<double>[^"]*)"|(?P<open>['"])"""
+)
+
+
+def tokenize(input_line: str) -> list[str]:
+    """
+    Splits the input line into lexemes.
+
+    :param input_line: The raw input line.
+    :return: The lexemes of the line, in order.
+    :raises ValueError: If a quotation mark is not closed.
+    """
+    lexemes: list[str] = []
+    parts: list[str] = []
+    for match in _SEGMENT_PATTERN.finditer(input_line):
+        kind = match.lastgroup
+        if kind == "space":
+            _flush(parts, lexemes)
+        elif kind == "open":
+            raise ValueError("Invalid input - missing closing quotation marks.")
+        else:
+            parts.append(match.group(kind))
+    _flush(parts, lexemes)
+    return lexemes
+
+
+def _flush(parts: list[str], lexemes: list[str]) -> None:
+    """Joins the collected parts into a lexeme, unless it is empty."""
+    if len(parts) == 0:
+        return
+    lexeme = parts[0] if len(parts) == 1 else "".join(parts)
+    parts.clear()
+    if len(lexeme) != 0:
+        lexemes.append(lexeme)
@@ -8,43 +8,83 @@ The `PersonalAssistant` class acts as the main interface for the system, allowin
 users to interact with a series of commands such as adding contacts, adding notes,
 or exiting the application.
 """
-import rich
+import contextlib
+import io
+import sys
+import time
+from typing import Iterable, TextIO
 
+from src.command import definitions
 from src.command.command import Command
-from src.command.handler.address.add_address import AddAddressCommandHandler
-from src.command.handler.address.change_address import ChangeAddressCommandHandler
-from src.command.handler.address.del_address import DelAddressCommandHandler
-from src.command.handler.birthday.add_birthday import AddBirthdayCommandHandler
-from src.command.handler.birthday.del_birthday import DelBirthdayCommandHandler
+from src.command.command_result import CommandResult
+from src.command.command_statistics import CommandStatistics
+from src.command.command_description import CommandDefinition
 from src.command.handler.command_handler import CommandHandler
 from src.command.handler.command_handlers import CommandHandlers
-from src.command.handler.contact.add_contact import AddContactCommandHandler
-from src.command.handler.contact.del_contact import DelContactCommandHandler
-from src.command.handler.email.add_email import AddEmailCommandHandler
-from src.command.handler.email.change_email import ChangeEmailCommandHandler
-from src.command.handler.email.del_email import DelEmailCommandHandler
-from src.command.handler.exit import ExitCommandHandler
-from src.command.handler.help import HelpCommandHandler
-from src.command.handler.note.add_note import AddNoteCommandHandler
-from src.command.handler.note.change_note import ChangeNoteCommandHandler
-from src.command.handler.note.del_note import DelNoteCommandHandler
-from src.command.handler.note.find_note_by_tags import FindNoteByTagCommandHandler
-from src.command.handler.note.find_note_by_text import FindNoteByTextCommandHandler
-from src.command.handler.phone.add_phone import AddPhoneCommandHandler
-from src.command.handler.phone.change_phone import ChangePhoneCommandHandler
-from src.command.handler.phone.del_phone import DelPhoneCommandHandler
+from src.command.handler.lazy_command_handler import LazyCommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.domain.note.notes import Notes
+from src.output.output import renderer
 from src.parser.parser import parse
-from src.util.colorize import error_color, cmd_color
+from src.storage.storage import Storage
+from src.util.colorize import error_color
+from src.util.markup import escape_markup
+from src.util.output_capture import capture_output
+from src.util.read_write_lock import ReadWriteLock
 
 
 class PersonalAssistant:
     """Main class for the personal assistant system."""
 
-    def __init__(self):
-        self.__address_book = {}
-        self.__notes = {}
+    batch_buffer_size = 64 * 1024
+
+    def __init__(self, storage: Storage | None = None):
+        self.__storage = storage
+        self.__lock = ReadWriteLock()
+        self.__statistics = CommandStatistics()
+        self.__startup_timings: dict[str, float] = {}
+
+        started = time.perf_counter()
+        if storage is None:
+            self.__address_book, self.__notes = ContactBook(), Notes()
+        else:
+            self.__address_book, self.__notes = storage.load()
+        self.__startup_timings["load"] = time.perf_counter() - started
+
+        started = time.perf_counter()
         self.__handlers = CommandHandlers()
         self.__register_command_handlers()
+        self.__startup_timings["register"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self.__replay_journal()
+        self.__startup_timings["replay"] = time.perf_counter() - started
+
+    @property
+    def startup_timings(self) -> dict[str, float]:
+        """
+        Returns how many seconds each phase of the startup took: loading the
+        snapshot ("load"), registering the command handlers ("register") and
+        replaying the journal ("replay").
+        """
+        return dict(self.__startup_timings)
+
+    @property
+    def statistics(self) -> CommandStatistics:
+        """Returns the latency and error statistics of the executed commands."""
+        return self.__statistics
+
+    @property
+    def handler_load_timings(self) -> dict[str, float]:
+        """
+        Returns how many seconds loading each command handler took, for the
+        handlers that have been loaded so far.
+        """
+        return {
+            name: handler.load_time
+            for name, handler in self.__handlers.items()
+            if isinstance(handler, LazyCommandHandler) and handler.load_time is not None
+        }
 
     def run(self) -> None:
         """
@@ -53,29 +93,192 @@ class PersonalAssistant:
 
         :return: None
         """
-        while True:
+        try:
+            while True:
+                try:
+                    input_line = input("Enter a command: ")
+                    command = parse(input_line)
+                    if command is None:
+                        continue
+                    self.__handle(command)
+                except ValueError as e:
+                    renderer().print(f"{error_color('[ERROR]')}: " + escape_markup(str(e)))
+                except EOFError:
+                    break
+                renderer().print()
+        finally:
+            self.close()
+
+    def run_batch(self, lines: Iterable[str], output: TextIO | None = None,
+                  errors: TextIO | None = None) -> int:
+        """
+        Executes the commands of a script without prompts.
+
+        The lines are read one at a time, so the script may be a file or a
+        stream of any size. Empty lines and lines starting with "#" are
+        skipped. The output of the commands is collected in a buffer and
+        written in large blocks, and a line that fails is reported with its
+        line number without stopping the script. The "exit" command stops
+        the script.
+
+        The journal is compacted once when the script ends rather than every
+        time it grows enough, so a long script does not rewrite the snapshot
+        over and over.
+
+        :param lines: The lines of the script.
+        :param output: The stream for the output of the commands, stdout by default.
+        :param errors: The stream for the errors, stderr by default.
+        :return: The number of lines that failed.
+        """
+        output = sys.stdout if output is None else output
+        errors = sys.stderr if errors is None else errors
+        failed = 0
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                for number, line in enumerate(lines, start=1):
+                    line = line.rstrip("\r\n")
+                    if line.lstrip().startswith("#"):
+                        continue
+                    try:
+                        command = parse(line)
+                        if command is not None and not self.__handle(command, compact=False):
+                            raise ValueError("Invalid command arguments.")
+                    except ValueError as e:
+                        failed += 1
+                        print(f"line {number}: {e}", file=errors)
+                    except SystemExit:
+                        break
+                    if buffer.tell() >= PersonalAssistant.batch_buffer_size:
+                        output.write(buffer.getvalue())
+                        buffer.seek(0)
+                        buffer.truncate()
+        finally:
+            output.write(buffer.getvalue())
+            output.flush()
+            self.close()
+        return failed
+
+    def execute(self, line: str) -> CommandResult:
+        """
+        Executes one command line and captures its output.
+
+        This is the entry point for front ends other than the console, such as
+        the socket server: nothing is printed, and the error of a failing
+        command is returned as plain text instead. It may be called from
+        several threads at once; the output is captured per thread.
+
+        :param line: The command line.
+        :return: The output of the command and its error, if any.
+        """
+        error, is_exit = None, False
+        with capture_output() as buffer:
             try:
-                input_line = input("Enter a command: ")
-                command = parse(input_line)
-                if command is None:
-                    continue
-                self.__handle(command)
+                command = parse(line)
+                if command is not None and not self.__handle(command):
+                    error = "Invalid command arguments."
             except ValueError as e:
-                rich.print(f"{error_color('[ERROR]')}: " + str(e))
-            print()
+                error = str(e)
+            except SystemExit:
+                is_exit = True
+        return CommandResult(buffer.getvalue(), error, is_exit)
+
+    def close(self) -> None:
+        """
+        Saves the pending changes to the storage, if the assistant has one.
 
-    def __handle(self, command: Command) -> None:
+        :return: None
+        """
+        if self.__storage is not None:
+            with self.__lock.write():
+                self.__storage.close(self.__address_book, self.__notes)
+
+    def __handle(self, command: Command, compact: bool = True) -> bool:
         """
         Handles the processing of a command using a handler execution system. The method
         retrieves the appropriate handler for the provided command and executes it with
         the command's arguments.
 
+        Commands that only read run under the read side of the reader-writer
+        lock, so several of them may run at once, while a mutating command and
+        its journal record run under the write side, alone.
+
+        The latency of the command and whether it failed are recorded in the
+        statistics. A command that stops the assistant, such as `exit`, counts
+        as executed.
+
         :param command: The command object containing the action to be performed and its
             associated arguments.
         :type command: Command
+        :param compact: Whether the journal may be compacted after the command.
+        :return: True if the command has been executed, False if its arguments
+            were invalid.
         """
         handler = self.__get_handler(command)
-        handler.handle(command.args)
+        started = time.perf_counter_ns()
+        executed = False
+        try:
+            if not handler.is_mutating:
+                with self.__lock.read():
+                    executed = handler.handle(command.args)
+                    return executed
+            with self.__lock.write():
+                if not handler.handle(command.args):
+                    return False
+                if handler.is_bulk:
+                    self.__save_snapshot()
+                else:
+                    self.__record(command, compact)
+            executed = True
+            return True
+        except SystemExit:
+            executed = True
+            raise
+        finally:
+            latency = time.perf_counter_ns() - started
+            self.__statistics.record(handler.name, latency, not executed)
+
+    def __record(self, command: Command, compact: bool = True) -> None:
+        """
+        Appends an executed mutating command to the journal of the storage and
+        compacts the journal into a snapshot when it has grown enough.
+
+        :param command: The executed command.
+        :param compact: Whether the journal may be compacted.
+        """
+        if self.__storage is None:
+            return
+        self.__storage.record(command)
+        if compact and self.__storage.needs_compaction:
+            self.__storage.compact(self.__address_book, self.__notes)
+
+    def __save_snapshot(self) -> None:
+        """
+        Writes a snapshot of the current state after a bulk change, which is
+        not journaled because replaying it would depend on external files.
+        """
+        if self.__storage is not None:
+            self.__storage.checkpoint(self.__address_book, self.__notes)
+
+    def __replay_journal(self) -> None:
+        """
+        Re-executes the commands journaled after the last snapshot, so the state
+        is restored to where the previous run stopped. The output of the replayed
+        commands is suppressed.
+
+        :return: None
+        """
+        if self.__storage is None:
+            return
+        with contextlib.redirect_stdout(io.StringIO()):
+            for command in self.__storage.replay():
+                handler = self.__handlers.get(command.name.casefold(), None)
+                if handler is None:
+                    continue
+                try:
+                    handler.handle(command.args)
+                except ValueError:
+                    continue
 
     def __get_handler(self, command: Command) -> CommandHandler:
         """
@@ -95,48 +298,81 @@ class PersonalAssistant:
         command_name = command.name.casefold()
         handler = self.__handlers.get(command_name, None)
         if handler is None:
-            raise ValueError(f"Invalid command: '{cmd_color(command.name)}'.")
+            raise ValueError(f"Invalid command: '{command.name}'.")
         return handler
 
     def __register_command_handlers(self) -> None:
         """
         Sets up handlers for various commands in the application.
 
-        This method registers command handlers for operations. Each command is
-        associated with a lambda function that acts as an intermediary to the
-        actual command handler function, passing the necessary arguments to it.
+        The handlers are registered lazily: each command is known by its
+        definition, and the module of its handler is imported only when the
+        command is first dispatched.
 
         :return: None
         """
+        contact_book, notes = self.__address_book, self.__notes
+
         # Registering handlers for contact management commands
-        self.__handlers.register(AddContactCommandHandler(self.__address_book))
-        self.__handlers.register(DelContactCommandHandler(self.__address_book))
+        self.__register(definitions.ADD_CONTACT,
+                        "contact.add_contact.AddContactCommandHandler", contact_book)
+        self.__register(definitions.DEL_CONTACT,
+                        "contact.del_contact.DelContactCommandHandler", contact_book)
+        self.__register(definitions.IMPORT_CONTACTS,
+                        "contact.import_contacts.ImportContactsCommandHandler", contact_book)
 
         # Registering handlers for phone number management commands
-        self.__handlers.register(AddPhoneCommandHandler(self.__address_book))
-        self.__handlers.register(ChangePhoneCommandHandler(self.__address_book))
-        self.__handlers.register(DelPhoneCommandHandler(self.__address_book))
+        self.__register(definitions.ADD_PHONE,
+                        "phone.add_phone.AddPhoneCommandHandler", contact_book)
+        self.__register(definitions.CHANGE_PHONE,
+                        "phone.change_phone.ChangePhoneCommandHandler", contact_book)
+        self.__register(definitions.DEL_PHONE,
+                        "phone.del_phone.DelPhoneCommandHandler", contact_book)
 
         # Registering handlers for email address management commands
-        self.__handlers.register(AddEmailCommandHandler(self.__address_book))
-        self.__handlers.register(ChangeEmailCommandHandler(self.__address_book))
-        self.__handlers.register(DelEmailCommandHandler(self.__address_book))
+        self.__register(definitions.ADD_EMAIL,
+                        "email.add_email.AddEmailCommandHandler", contact_book)
+        self.__register(definitions.CHANGE_EMAIL,
+                        "email.change_email.ChangeEmailCommandHandler", contact_book)
+        self.__register(definitions.DEL_EMAIL,
+                        "email.del_email.DelEmailCommandHandler", contact_book)
 
         # Registering handlers for address management commands
-        self.__handlers.register(AddAddressCommandHandler(self.__address_book))
-        self.__handlers.register(ChangeAddressCommandHandler(self.__address_book))
-        self.__handlers.register(DelAddressCommandHandler(self.__address_book))
+        self.__register(definitions.ADD_ADDRESS,
+                        "address.add_address.AddAddressCommandHandler", contact_book)
+        self.__register(definitions.CHANGE_ADDRESS,
+                        "address.change_address.ChangeAddressCommandHandler", contact_book)
+        self.__register(definitions.DEL_ADDRESS,
+                        "address.del_address.DelAddressCommandHandler", contact_book)
 
         # Registering handlers for birthday management commands
-        self.__handlers.register(AddBirthdayCommandHandler(self.__address_book))
-        self.__handlers.register(DelBirthdayCommandHandler(self.__address_book))
+        self.__register(definitions.ADD_BIRTHDAY,
+                        "birthday.add_birthday.AddBirthdayCommandHandler", contact_book)
+        self.__register(definitions.DEL_BIRTHDAY,
+                        "birthday.del_birthday.DelBirthdayCommandHandler", contact_book)
 
         # Registering handlers for notes management commands
-        self.__handlers.register(AddNoteCommandHandler(self.__notes))
-        self.__handlers.register(ChangeNoteCommandHandler(self.__notes))
-        self.__handlers.register(DelNoteCommandHandler(self.__notes))
-        self.__handlers.register(FindNoteByTextCommandHandler(self.__notes))
-        self.__handlers.register(FindNoteByTagCommandHandler(self.__notes))
-
-        self.__handlers.register(ExitCommandHandler())
-        self.__handlers.register(HelpCommandHandler(self.__handlers))
+        self.__register(definitions.ADD_NOTE, "note.add_note.AddNoteCommandHandler", notes)
+        self.__register(definitions.CHANGE_NOTE, "note.change_note.ChangeNoteCommandHandler", notes)
+        self.__register(definitions.DEL_NOTE, "note.del_note.DelNoteCommandHandler", notes)
+        self.__register(definitions.NOTE_BY_TEXT,
+                        "note.find_note_by_text.FindNoteByTextCommandHandler", notes)
+        self.__register(definitions.NOTE_BY_TAG,
+                        "note.find_note_by_tags.FindNoteByTagCommandHandler", notes)
+
+        self.__register(definitions.STATS, "stats.StatsCommandHandler", self.__statistics)
+        self.__register(definitions.EXIT, "exit.ExitCommandHandler")
+        self.__register(definitions.HELP, "help.HelpCommandHandler", self.__handlers)
+
+    def __register(self, definition: CommandDefinition, handler_path: str, *handler_args) -> None:
+        """
+        Registers a lazily loaded handler for a command.
+
+        :param definition: The definition of the command.
+        :param handler_path: The dotted path of the handler class relative to
+            the `src.command.handler` package.
+        :param handler_args: The arguments passed to the constructor of the handler.
+        """
+        self.__handlers.register(
+            LazyCommandHandler(definition, f"src.command.handler.{handler_path}", *handler_args)
+        )
@@ -0,0 +1,108 @@
+"""
+Provides the CommandServer class.
+
+The server exposes the command protocol of the personal assistant on a local
+Unix socket. A client sends command lines, exactly as they would be typed at
+the prompt, and receives one JSON object per line in the same order:
+
+    {"id": 1, "ok": true, "output": "Added a contact.\\n", "error": null}
+
+`id` is the number of the line within the connection. A client may send many
+lines without waiting for the responses (pipelining). The "exit" command
+closes the connection.
+"""
+import asyncio
+import contextlib
+import json
+import signal
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.personal_assistant import PersonalAssistant
+
+
+class CommandServer:
+    """
+    An asyncio server that executes the commands of many clients.
+
+    The commands run in a pool of worker threads. The lines of one connection
+    are executed one after another, in order, while the commands of different
+    connections run at the same time: lookups share the assistant's
+    reader-writer lock and changes take it alone. A connection reads its lines
+    from a buffered stream, so the lines that a client has already sent are
+    executed without waiting for the network.
+    """
+
+    def __init__(self, assistant: PersonalAssistant, path: Path, workers: int = 4):
+        self.__assistant = assistant
+        self.__path = path
+        self.__workers = workers
+        self.__server: asyncio.AbstractServer | None = None
+        self.__executor: ThreadPoolExecutor | None = None
+
+    @property
+    def path(self) -> Path:
+        """Returns the path of the socket."""
+        return self.__path
+
+    async def start(self) -> None:
+        """Starts listening on the socket, replacing a stale socket file."""
+        with contextlib.suppress(FileNotFoundError):
+            self.__path.unlink()
+        self.__executor = ThreadPoolExecutor(
+            max_workers=self.__workers, thread_name_prefix="command"
+        )
+        self.__server = await asyncio.start_unix_server(self.__handle_client, path=str(self.__path))
+
+    async def serve(self) -> None:
+        """
+        Starts the server and serves clients until the task is cancelled or
+        the process receives SIGINT or SIGTERM.
+        """
+        await self.start()
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, task.cancel)
+        try:
+            await self.__server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signum)
+            await self.stop()
+
+    async def stop(self) -> None:
+        """Stops listening and removes the socket file."""
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+        with contextlib.suppress(FileNotFoundError):
+            self.__path.unlink()
+
+    async def __handle_client(self, reader: asyncio.StreamReader,
+                              writer: asyncio.StreamWriter) -> None:
+        """Executes the command lines of one connection and writes the responses."""
+        loop = asyncio.get_running_loop()
+        number = 0
+        try:
+            while line := await reader.readline():
+                number += 1
+                text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+                result = await loop.run_in_executor(self.__executor, self.__assistant.execute, text)
+                response = {"id": number, **result.to_dict()}
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+                if result.is_exit:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
@@ -0,0 +1,104 @@
+"""
+Provides the Journal class.
+
+The journal is an append-only file with one compact JSON record per executed
+mutating command. A record is appended after its command has been applied
+in memory, so the journal is a redo log of completed commands rather than a
+write-ahead log. Replaying the records on top of the last snapshot restores
+the state without rewriting the whole dataset on every change.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Iterator, TextIO
+
+from src.command.command import Command
+
+
+class Journal:
+    """
+    An append-only journal of executed mutating commands.
+
+    The file is opened on the first append and stays open for the following
+    ones; `close`, or leaving a `with` block, closes it.
+    """
+
+    def __init__(self, path: Path):
+        self.__path = path
+        self.__file: TextIO | None = None
+
+    def append(self, sequence: int, command: Command) -> None:
+        """
+        Appends a record of the command to the journal.
+
+        :param sequence: The sequence number of the record.
+        :param command: The executed command.
+        """
+        if self.__file is None:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            # Kept open across appends; closed by close() and __exit__.
+            self.__file = open(self.__path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+        try:
+            self.__file.write(Journal.__encode(sequence, command))
+            self.__file.flush()
+        except OSError:
+            self.close()
+            raise
+
+    def records(self) -> Iterator[tuple[int, Command]]:
+        """
+        Reads the records of the journal in the order they were written.
+
+        A record that cannot be decoded, such as a line torn by a crash in the
+        middle of a write, is skipped.
+
+        :return: An iterator over (sequence number, command) pairs.
+        """
+        if not self.__path.exists():
+            return
+        with open(self.__path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    sequence, name, args = json.loads(line)
+                except ValueError:
+                    continue
+                yield sequence, Command(name, args)
+
+    def truncate(self, through: int | None = None) -> None:
+        """
+        Removes the records up to a sequence number from the journal.
+
+        The remaining records are written to a temporary file that replaces the
+        journal, so a crash leaves either the old or the new journal.
+
+        :param through: The sequence number of the last record to remove, or
+            None to remove all records.
+        """
+        self.close()
+        if not self.__path.exists():
+            return
+        kept = [] if through is None else [
+            Journal.__encode(sequence, command)
+            for sequence, command in self.records() if sequence > through
+        ]
+        temporary_path = self.__path.with_name(self.__path.name + ".tmp")
+        temporary_path.write_text("".join(kept), encoding="utf-8")
+        os.replace(temporary_path, self.__path)
+
+    def close(self) -> None:
+        """Closes the journal file."""
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    @staticmethod
+    def __encode(sequence: int, command: Command) -> str:
+        """Encodes a record as one line of compact JSON."""
+        record = [sequence, command.name, command.args]
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -0,0 +1,81 @@
+"""
+Converts the contact book and the notes to and from plain dictionaries.
+
+The dictionaries contain only strings and lists, so they can be written to
+disk as JSON and restored through the same value objects that validate the
+user input.
+"""
+from typing import Any
+
+from src.domain.contact.birthday import Birthday
+from src.domain.contact.contact import Contact
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.email import Email
+from src.domain.contact.name import Name
+from src.domain.contact.phone import Phone
+from src.domain.note.content import Content
+from src.domain.note.note import Note
+from src.domain.note.notes import Notes
+from src.domain.note.tag import Tag
+from src.domain.note.tags import Tags
+from src.domain.note.topic import Topic
+
+
+def serialize(contact_book: ContactBook, notes: Notes) -> dict[str, Any]:
+    """Converts the contact book and the notes to a dictionary."""
+    return {
+        "contacts": [_serialize_contact(contact) for contact in contact_book.values()],
+        "notes": [_serialize_note(note) for note in notes],
+    }
+
+
+def deserialize(data: dict[str, Any]) -> tuple[ContactBook, Notes]:
+    """
+    Restores the contact book and the notes from a dictionary.
+
+    :raises ValueError: If one of the stored values is invalid.
+    """
+    contact_book = ContactBook()
+    for item in data.get("contacts", []):
+        contact_book.add(_deserialize_contact(item))
+
+    notes = Notes()
+    for item in data.get("notes", []):
+        notes.add(_deserialize_note(item))
+
+    return contact_book, notes
+
+
+def _serialize_contact(contact: Contact) -> dict[str, Any]:
+    return {
+        "name": contact.name.value,
+        "phones": [phone.value for phone in contact.phones],
+        "emails": [email.value for email in contact.emails],
+        "birthday": contact.birthday.to_string() if contact.birthday is not None else None,
+    }
+
+
+def _deserialize_contact(item: dict[str, Any]) -> Contact:
+    contact = Contact(Name(item["name"]))
+    for phone in item.get("phones", []):
+        contact.phones.add(Phone(phone))
+    for email in item.get("emails", []):
+        contact.emails.add(Email(email))
+    if item.get("birthday") is not None:
+        contact.add_birthday(Birthday(item["birthday"]))
+    return contact
+
+
+def _serialize_note(note: Note) -> dict[str, Any]:
+    return {
+        "topic": note.topic.value,
+        "content": note.content.value,
+        "tags": [tag.value for tag in note.tags],
+    }
+
+
+def _deserialize_note(item: dict[str, Any]) -> Note:
+    tags = Tags()
+    for tag in item.get("tags", []):
+        tags.add(Tag(tag))
+    return Note(Topic(item["topic"]), Content(item["content"]), tags)
@@ -0,0 +1,146 @@
+"""
+Reads and writes snapshots of the stored data.
+
+A snapshot is a JSON document with the whole contact book and notes, together
+with the sequence number of the last journal record it contains. The document
+is preceded by a one-line header with its length and CRC-32 checksum:
+
+    PA-SNAPSHOT 1 <length> <crc32 in hex>
+
+so a truncated or corrupted file is detected before it is parsed. Every write
+goes to a temporary file that is synced to disk and renamed over the main
+file, and the previous main file is kept as a backup. If the main file cannot
+be verified, the backup is used instead (FR-4.3), and it stays the backup
+until the main file has been written again, so the corrupted main file never
+replaces it.
+"""
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Any
+
+from src.error.corrupted_snapshot_error import CorruptedSnapshotError
+
+_MAGIC = b"PA-SNAPSHOT"
+_VERSION = b"1"
+
+
+def backup_path(path: Path) -> Path:
+    """Returns the path of the backup of the snapshot."""
+    return path.with_name(path.name + ".bak")
+
+
+def write_snapshot(path: Path, data: dict[str, Any], replace_backup: bool = False,
+                   keep_backup: bool = False) -> None:
+    """
+    Writes the snapshot atomically and keeps the previous one as a backup.
+
+    The new snapshot is written to a temporary file and synced to disk. Then the
+    current snapshot is moved to the backup and the temporary file is renamed to
+    the snapshot, so a crash at any moment leaves either the new or the previous
+    snapshot readable.
+
+    :param path: The path of the snapshot.
+    :param data: The data to store.
+    :param replace_backup: Whether the backup is written with the new data as
+        well, for changes that cannot be recovered from the previous snapshot.
+    :param keep_backup: Whether the current snapshot is overwritten instead of
+        becoming the backup, because it failed verification and the backup is
+        the last good snapshot.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header = b"%s %s %d %08x\n" % (_MAGIC, _VERSION, len(body), zlib.crc32(body))
+
+    temporary_path = path.with_name(path.name + ".tmp")
+    _write_synced(temporary_path, header, body)
+    if not keep_backup and path.exists():
+        os.replace(path, backup_path(path))
+    os.replace(temporary_path, path)
+    if replace_backup:
+        _write_synced(temporary_path, header, body)
+        os.replace(temporary_path, backup_path(path))
+    _sync_directory(path.parent)
+
+
+def _write_synced(path: Path, header: bytes, body: bytes) -> None:
+    """Writes a snapshot file and syncs it to disk."""
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(body)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def read_snapshot(path: Path) -> dict[str, Any] | None:
+    """
+    Reads the snapshot, falling back to the backup if the snapshot is missing
+    or fails verification.
+
+    :return: The stored data, or None if there is no snapshot and no backup yet.
+    :raises CorruptedSnapshotError: If neither the snapshot nor the backup can be read.
+    """
+    return read_snapshot_from(path)[0]
+
+
+def read_snapshot_from(path: Path) -> tuple[dict[str, Any] | None, Path | None]:
+    """
+    Reads the snapshot like `read_snapshot` and tells which file was read.
+
+    :return: The stored data and the path of the snapshot or of the backup it
+        was read from, or (None, None) if there is no snapshot and no backup yet.
+    :raises CorruptedSnapshotError: If neither the snapshot nor the backup can be read.
+    """
+    backup = backup_path(path)
+    if not path.exists() and not backup.exists():
+        return None, None
+
+    for candidate in (path, backup):
+        body = _read_verified_body(candidate)
+        if body is None:
+            continue
+        try:
+            return json.loads(body), candidate
+        except ValueError:
+            continue
+    raise CorruptedSnapshotError(str(path))
+
+
+def _read_verified_body(path: Path) -> bytes | None:
+    """
+    Reads the body of a snapshot file and verifies it against the header.
+
+    The length in the header is compared with the file size before the body is
+    read, so a truncated file is rejected without reading it.
+
+    :return: The verified body, or None if the file is missing or invalid.
+    """
+    try:
+        with open(path, "rb") as file:
+            header = file.readline(128).split()
+            if len(header) != 4 or header[0] != _MAGIC or header[1] != _VERSION:
+                return None
+            length, checksum = int(header[2]), int(header[3], 16)
+            if os.fstat(file.fileno()).st_size != file.tell() + length:
+                return None
+            body = file.read(length)
+    except (OSError, ValueError):
+        return None
+    if zlib.crc32(body) != checksum:
+        return None
+    return body
+
+
+def _sync_directory(directory: Path) -> None:
+    """Syncs the directory entry changes made by the renames to disk, where supported."""
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
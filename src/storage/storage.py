@@ -0,0 +1,128 @@
+"""
+Provides the Storage class.
+
+The storage keeps the contact book and the notes between runs (FR-4.1, FR-4.2)
+as a snapshot plus a journal of the mutating commands executed after it. A
+command is journaled once it has been applied in memory. The journal is
+compacted into a new snapshot periodically and on close, so the time to
+replay it at startup stays bounded.
+"""
+from pathlib import Path
+from typing import Iterator
+
+from src.command.command import Command
+from src.domain.contact.contact_book import ContactBook
+from src.domain.note.notes import Notes
+from src.storage.journal import Journal
+from src.storage.serializer import deserialize, serialize
+from src.storage.snapshot import backup_path, read_snapshot_from, write_snapshot
+
+
+class Storage:
+    """Persists the contact book and the notes in a directory."""
+
+    snapshot_file = "snapshot.json"
+    journal_file = "journal.jsonl"
+
+    def __init__(self, directory: Path, compact_every: int = 1000):
+        self.__snapshot_path = directory / Storage.snapshot_file
+        self.__journal = Journal(directory / Storage.journal_file)
+        self.__compact_every = compact_every
+        self.__sequence = 0
+        self.__snapshot_sequence = 0
+        self.__snapshot_verified = True
+        self.__pending = 0
+
+    @staticmethod
+    def default_directory() -> Path:
+        """Returns the directory used to store the data of the current user."""
+        return Path.home() / ".personal_assistant"
+
+    def load(self) -> tuple[ContactBook, Notes]:
+        """
+        Loads the contact book and the notes from the last snapshot.
+
+        The commands recorded after the snapshot are returned by `replay`. If
+        the snapshot was read from the backup, the backup is kept when the
+        snapshot is next written.
+        """
+        data, source = read_snapshot_from(self.__snapshot_path)
+        self.__snapshot_verified = source != backup_path(self.__snapshot_path)
+        if data is None:
+            return ContactBook(), Notes()
+        self.__sequence = self.__snapshot_sequence = data.get("sequence", 0)
+        return deserialize(data)
+
+    def replay(self) -> Iterator[Command]:
+        """
+        Yields the journaled commands that are not in the loaded snapshot yet,
+        in the order they were executed.
+        """
+        for sequence, command in self.__journal.records():
+            if sequence <= self.__sequence:
+                continue
+            self.__sequence = sequence
+            self.__pending += 1
+            yield command
+
+    def record(self, command: Command) -> None:
+        """Appends an executed mutating command to the journal."""
+        self.__sequence += 1
+        self.__journal.append(self.__sequence, command)
+        self.__pending += 1
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Returns whether the journal has grown enough to be compacted."""
+        return self.__pending >= self.__compact_every
+
+    def compact(self, contact_book: ContactBook, notes: Notes) -> None:
+        """
+        Writes a snapshot of the current state and drops the journal records
+        that the backup snapshot already contains.
+
+        The previous snapshot becomes the backup, so the records written after
+        it are kept: if the new snapshot turns out to be corrupted, loading
+        falls back to the backup and replays them, and nothing is lost. The
+        snapshot stores the sequence number of the last journaled command, so
+        the kept records are skipped on replay when the snapshot is readable.
+        If the snapshot was loaded from the backup, the corrupted snapshot is
+        overwritten and the backup, with the records after it, stays.
+        """
+        self.__write_snapshot(contact_book, notes, replace_backup=False)
+        self.__journal.truncate(through=self.__snapshot_sequence)
+        self.__snapshot_sequence = self.__sequence
+        self.__pending = 0
+
+    def checkpoint(self, contact_book: ContactBook, notes: Notes) -> None:
+        """
+        Writes a snapshot of the current state as both the snapshot and its
+        backup, and empties the journal.
+
+        This is for changes that are not journaled, such as bulk imports: the
+        previous snapshot plus the journal could not restore them, so it is
+        not kept as the backup.
+        """
+        self.__write_snapshot(contact_book, notes, replace_backup=True)
+        self.__journal.truncate()
+        self.__snapshot_sequence = self.__sequence
+        self.__pending = 0
+
+    def __write_snapshot(self, contact_book: ContactBook, notes: Notes,
+                         replace_backup: bool) -> None:
+        data = serialize(contact_book, notes)
+        data["sequence"] = self.__sequence
+        write_snapshot(self.__snapshot_path, data, replace_backup,
+                       keep_backup=not self.__snapshot_verified)
+        self.__snapshot_verified = True
+
+    def close(self, contact_book: ContactBook, notes: Notes) -> None:
+        """
+        Compacts the pending journal records and closes the journal, even if
+        the compaction fails.
+        """
+        try:
+            if self.__pending > 0:
+                self.compact(contact_book, notes)
+        finally:
+            self.__journal.close()
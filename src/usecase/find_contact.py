@@ -0,0 +1,20 @@
+"""
+Provides functionality to find a contact that must exist in a contact book.
+"""
+
+from src.domain.contact.contact import Contact
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.error.unknown_contact_error import UnknownContactError
+
+
+def find_contact(contact_book: ContactBook, name: Name) -> Contact:
+    """
+    Finds a contact by its name.
+
+    :raises UnknownContactError: If the contact does not exist.
+    """
+    contact = contact_book.find(name)
+    if contact is None:
+        raise UnknownContactError(name.value)
+    return contact
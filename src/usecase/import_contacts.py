@@ -0,0 +1,226 @@
+"""
+Provides functionality to import contacts in bulk from CSV or JSON Lines files.
+
+A CSV file has a header row with the columns `name`, `phones`, `emails` and
+`birthday`; several phones or emails in one cell are separated by ";", and a
+file without the `name` column is rejected before any row is read. A JSON
+Lines file has one object per line with the same keys, where `phones` and
+`emails` may also be lists. Only `name` is required.
+"""
+import csv
+import itertools
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from src.domain.contact.birthday import Birthday
+from src.domain.contact.contact import Contact
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.email import Email
+from src.domain.contact.name import Name
+from src.domain.contact.phone import Phone
+from src.error.unreadable_import_file_error import UnreadableImportFileError
+from src.error.unsupported_import_format_error import UnsupportedImportFormatError
+from src.usecase.import_report import ImportReport
+
+Row = tuple[int, dict[str, Any] | str]
+Fields = tuple[Name, list[Phone], list[Email], Birthday | None]
+ValidatedRow = tuple[int, Fields | str]
+
+
+def import_contacts(contact_book: ContactBook, path: Path, chunk_size: int = 1000,
+                    workers: int = 1) -> ImportReport:
+    """
+    Imports the contacts of a file into the contact book.
+
+    The file is streamed and handled in chunks of rows: the rows of a chunk are
+    validated with the `Name`, `Phone`, `Email` and `Birthday` value objects
+    first, and the valid contacts are then added to the contact book directly.
+    A row that is invalid or names an existing contact is skipped. If the file
+    cannot be read to the end, the contacts imported so far are removed again,
+    so the import either completes or changes nothing.
+
+    With more than one worker the chunks are validated in a pool of processes,
+    and only the contacts are built in this process. The chunks are collected
+    in the order they were read, so the result and the report are the same as
+    with a single worker.
+
+    :param contact_book: The contact book to import into.
+    :param path: The path of a .csv or .jsonl file.
+    :param chunk_size: The number of rows handled at a time.
+    :param workers: The number of processes that validate the rows.
+    :return: The report of the import.
+    :raises UnsupportedImportFormatError: If the file is neither CSV nor JSON Lines.
+    :raises UnreadableImportFileError: If the file cannot be decoded or parsed.
+    :raises OSError: If the file cannot be read.
+    """
+    report = ImportReport()
+    started = time.perf_counter()
+    chunks = _chunks(read_rows(path), chunk_size)
+    if workers <= 1:
+        validated_chunks = map(validate_rows, chunks)
+    else:
+        validated_chunks = _validate_in_pool(chunks, workers)
+    imported: list[Name] = []
+    try:
+        for validated_chunk in validated_chunks:
+            for line, fields in validated_chunk:
+                if isinstance(fields, str):
+                    report.add_skipped(line, fields)
+                elif contact_book.find(fields[0]) is not None:
+                    report.add_skipped(line, f"Contact `{fields[0]}` already exists.")
+                else:
+                    contact_book.add(_build_contact(fields))
+                    imported.append(fields[0])
+                    report.add_imported()
+    except (UnreadableImportFileError, OSError):
+        for name in imported:
+            contact_book.delete(name)
+        raise
+    report.finish(time.perf_counter() - started)
+    return report
+
+
+def read_rows(path: Path) -> Iterator[Row]:
+    """
+    Reads the rows of a .csv or .jsonl file one at a time.
+
+    :return: An iterator over (line number, row) pairs, where a row that cannot
+        be decoded is replaced by the reason.
+    :raises UnsupportedImportFormatError: If the file is neither CSV nor JSON Lines.
+    :raises UnreadableImportFileError: While iterating, if the file is not valid
+        UTF-8 or is not valid CSV.
+    """
+    suffix = path.suffix.casefold()
+    if suffix == ".csv":
+        return _read_csv_rows(path)
+    if suffix in (".jsonl", ".ndjson"):
+        return _read_jsonl_rows(path)
+    raise UnsupportedImportFormatError(str(path))
+
+
+def validate_rows(rows: list[Row]) -> list[ValidatedRow]:
+    """
+    Validates a chunk of rows with the value objects of a contact.
+
+    The function runs in the worker processes of a parallel import, so it
+    returns the value objects only; building the contacts is left to the
+    process that owns the contact book.
+
+    :return: (line number, (name, phones, emails, birthday)) pairs, where an
+        invalid row has the reason instead of the fields.
+    """
+    validated: list[ValidatedRow] = []
+    for line, row in rows:
+        if isinstance(row, str):
+            validated.append((line, row))
+            continue
+        try:
+            validated.append((line, _validate_row(row)))
+        except ValueError as e:
+            validated.append((line, str(e)))
+    return validated
+
+
+def _validate_in_pool(chunks: Iterable[list[Row]], workers: int) -> Iterator[list[ValidatedRow]]:
+    """
+    Validates the chunks in a pool of processes and yields the results in the
+    order of the chunks. At most two chunks per worker are in flight, so the
+    file is still read as a stream.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(validate_rows, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _read_csv_rows(path: Path) -> Iterator[Row]:
+    with open(path, "rb") as file:
+        reader = csv.DictReader(_decode_lines(path, file))
+        try:
+            if reader.fieldnames is not None and "name" not in reader.fieldnames:
+                raise UnreadableImportFileError(str(path), 1, "the header has no 'name' column")
+            for row in reader:
+                yield reader.line_num, row
+        except csv.Error as e:
+            reason = str(e).rstrip(".")
+            raise UnreadableImportFileError(str(path), reader.line_num + 1, reason) from e
+
+
+def _read_jsonl_rows(path: Path) -> Iterator[Row]:
+    with open(path, "rb") as file:
+        for line, text in enumerate(_decode_lines(path, file), start=1):
+            yield from _decode_jsonl_row(line, text)
+
+
+def _decode_lines(path: Path, file: Iterable[bytes]) -> Iterator[str]:
+    """
+    Decodes the lines of a file one at a time, so a line that is not valid
+    UTF-8 is reported with its own number.
+    """
+    for line, data in enumerate(file, start=1):
+        try:
+            yield data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise UnreadableImportFileError(str(path), line, "not valid UTF-8 text") from e
+
+
+def _decode_jsonl_row(line: int, text: str) -> Iterator[Row]:
+    """Yields the row of a JSON Lines line, if it is not blank."""
+    if text.strip() == "":
+        return
+    try:
+        row = json.loads(text)
+    except ValueError:
+        yield line, "Invalid JSON."
+        return
+    if not isinstance(row, dict):
+        yield line, "Expected a JSON object."
+        return
+    yield line, row
+
+
+def _chunks(rows: Iterable[Row], size: int) -> Iterator[list[Row]]:
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _validate_row(row: dict[str, Any]) -> Fields:
+    name = row.get("name")
+    if not name:
+        raise ValueError("Missing name.")
+    birthday = row.get("birthday")
+    return (
+        Name(str(name).strip()),
+        [Phone(phone) for phone in _values(row.get("phones"))],
+        [Email(email) for email in _values(row.get("emails"))],
+        Birthday(str(birthday).strip()) if birthday else None,
+    )
+
+
+def _build_contact(fields: Fields) -> Contact:
+    name, phones, emails, birthday = fields
+    contact = Contact(name)
+    for phone in phones:
+        contact.phones.add(phone)
+    for email in emails:
+        contact.emails.add(email)
+    if birthday is not None:
+        contact.add_birthday(birthday)
+    return contact
+
+
+def _values(value: Any) -> list[str]:
+    """Returns the non-empty items of a cell that holds one or several values."""
+    if value is None:
+        return []
+    items = value if isinstance(value, list) else str(value).split(";")
+    return [str(item).strip() for item in items if str(item).strip() != ""]
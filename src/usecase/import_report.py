@@ -0,0 +1,51 @@
+"""
+Provides the ImportReport class.
+"""
+
+
+class ImportReport:
+    """The outcome of a bulk import: what was imported, what was skipped and how fast."""
+
+    def __init__(self):
+        self.__imported = 0
+        self.__skipped: list[tuple[int, str]] = []
+        self.__elapsed = 0.0
+
+    @property
+    def imported(self) -> int:
+        """Returns the number of imported rows."""
+        return self.__imported
+
+    @property
+    def skipped(self) -> list[tuple[int, str]]:
+        """Returns the (line number, reason) pairs of the skipped rows."""
+        return self.__skipped
+
+    @property
+    def rows(self) -> int:
+        """Returns the number of rows read."""
+        return self.__imported + len(self.__skipped)
+
+    @property
+    def elapsed(self) -> float:
+        """Returns how many seconds the import took."""
+        return self.__elapsed
+
+    @property
+    def rows_per_second(self) -> float:
+        """Returns the number of rows read per second."""
+        if self.__elapsed == 0:
+            return 0.0
+        return self.rows / self.__elapsed
+
+    def add_imported(self) -> None:
+        """Counts an imported row."""
+        self.__imported += 1
+
+    def add_skipped(self, line: int, reason: str) -> None:
+        """Records a skipped row."""
+        self.__skipped.append((line, reason))
+
+    def finish(self, elapsed: float) -> None:
+        """Sets how many seconds the import took."""
+        self.__elapsed = elapsed
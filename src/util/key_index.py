@@ -0,0 +1,72 @@
+"""
+Provides the KeyIndex class.
+
+Collections of value objects (the phone numbers and emails of a contact, the
+tags of a note) use the index to find their items by a normalized key instead
+of comparing the items one by one with `__eq__`.
+"""
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class KeyIndex(Generic[T]):
+    """
+    Finds the items of an ordered list by a normalized key.
+
+    A short list is scanned comparing the keys. Once the list grows past
+    `threshold` items a hash set of the keys is kept, so checking for a
+    duplicate takes constant time while a collection with a few items does
+    not pay for an empty set.
+
+    The owner of the list tells the index about every item it adds, removes
+    or replaces.
+    """
+
+    threshold = 8
+
+    __slots__ = ("__key", "__keys")
+
+    def __init__(self, key: Callable[[T], str]):
+        self.__key = key
+        self.__keys: set[str] | None = None
+
+    def contains(self, items: list[T], item: T) -> bool:
+        """Returns whether the list has an item with the same key as the given one."""
+        if self.__keys is not None:
+            return self.__key(item) in self.__keys
+        return self.index(items, item) is not None
+
+    def index(self, items: list[T], item: T) -> int | None:
+        """
+        Returns the position of the item with the same key as the given one.
+
+        :param items: The list of the owner.
+        :param item: The item to search for.
+        :return: The position of the item, or None if the list has no such item.
+        """
+        key = self.__key(item)
+        if self.__keys is not None and key not in self.__keys:
+            return None
+        for index, stored in enumerate(items):
+            if self.__key(stored) == key:
+                return index
+        return None
+
+    def added(self, items: list[T], item: T) -> None:
+        """Records an item that has been appended to the list."""
+        if self.__keys is not None:
+            self.__keys.add(self.__key(item))
+        elif len(items) > KeyIndex.threshold:
+            self.__keys = {self.__key(stored) for stored in items}
+
+    def removed(self, item: T) -> None:
+        """Records an item that has been removed from the list."""
+        if self.__keys is not None:
+            self.__keys.discard(self.__key(item))
+
+    def replaced(self, old: T, new: T) -> None:
+        """Records an item that has been replaced with another one."""
+        if self.__keys is not None:
+            self.__keys.discard(self.__key(old))
+            self.__keys.add(self.__key(new))
@@ -0,0 +1,103 @@
+"""
+Provides the LatencyHistogram class.
+
+The histogram follows the idea of HdrHistogram: values are counted in
+buckets whose width grows with the value, so the relative error of every
+recorded value is bounded while the memory stays small and fixed, whatever
+the number of recorded values.
+"""
+import math
+
+
+class LatencyHistogram:
+    """
+    A log-linear histogram of latencies in microseconds.
+
+    Values below `2 ** precision_bits` get a bucket each. Above that, every
+    power of two is split into `2 ** (precision_bits - 1)` equal buckets, so
+    a value is known to within about 3% with the default 5 bits. Recording a
+    value is a few integer operations and one list increment.
+    """
+
+    precision_bits = 5
+
+    def __init__(self):
+        self.__counts: list[int] = []
+        self.__count = 0
+        self.__total = 0
+        self.__min: int | None = None
+        self.__max = 0
+
+    def record(self, microseconds: int) -> None:
+        """
+        Counts one latency.
+
+        :param microseconds: The latency in microseconds; negative values count as 0.
+        """
+        value = max(microseconds, 0)
+        index = LatencyHistogram.__index(value)
+        if index >= len(self.__counts):
+            self.__counts.extend([0] * (index + 1 - len(self.__counts)))
+        self.__counts[index] += 1
+        self.__count += 1
+        self.__total += value
+        self.__max = max(self.__max, value)
+        self.__min = value if self.__min is None else min(self.__min, value)
+
+    @property
+    def count(self) -> int:
+        """Returns the number of recorded values."""
+        return self.__count
+
+    @property
+    def min(self) -> int:
+        """Returns the smallest recorded value, or 0 if there is none."""
+        return self.__min or 0
+
+    @property
+    def max(self) -> int:
+        """Returns the largest recorded value, or 0 if there is none."""
+        return self.__max
+
+    @property
+    def mean(self) -> float:
+        """Returns the mean of the recorded values, or 0 if there is none."""
+        return self.__total / self.__count if self.__count > 0 else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """
+        Returns the value below which the given percentage of the recorded
+        values fall, to within the precision of the buckets.
+
+        :param percent: The percentile, from 0 to 100.
+        :return: The highest value of the bucket of the percentile, capped by
+            the largest recorded value, or 0 if there are no values.
+        """
+        if self.__count == 0:
+            return 0
+        rank = max(1, math.ceil(percent / 100 * self.__count))
+        seen = 0
+        for index, count in enumerate(self.__counts):
+            seen += count
+            if seen >= rank:
+                return min(LatencyHistogram.__highest_value(index), self.__max)
+        return self.__max
+
+    @staticmethod
+    def __index(value: int) -> int:
+        linear = 1 << LatencyHistogram.precision_bits
+        if value < linear:
+            return value
+        shift = value.bit_length() - LatencyHistogram.precision_bits
+        half = linear >> 1
+        return linear + (shift - 1) * half + ((value >> shift) - half)
+
+    @staticmethod
+    def __highest_value(index: int) -> int:
+        linear = 1 << LatencyHistogram.precision_bits
+        if index < linear:
+            return index
+        half = linear >> 1
+        shift, offset = divmod(index - linear, half)
+        shift += 1
+        return ((half + offset + 1) << shift) - 1
@@ -0,0 +1,52 @@
+"""
+Escapes and removes console markup without importing rich.
+
+The markup is the one of the `colorize` module: style tags in square
+brackets such as "[red]" and "[/red]". A tag must start with a lowercase
+letter, "#", "/" or "@", so bracketed text like "[ERROR]" is kept, and a
+tag escaped with a backslash is kept as literal text, as rich does.
+
+Text that does not come from the program, such as names typed by the user,
+must be escaped before it is put into markup, or rich would take a "[/x]"
+in it for a tag and fail.
+"""
+import re
+
+_TAG_PATTERN: re.Pattern = re.compile(r"(\\*)\[([a-z#/@][^[]*?)]")
+
+
+def escape_markup(text: str) -> str:
+    """
+    Returns the text with its tag-like brackets escaped, so it is printed
+    literally, as `rich.markup.escape` does.
+
+    :param text: The plain text.
+    :return: The text to put into console markup.
+    """
+    if "[" in text:
+        text = _TAG_PATTERN.sub(_escape_tag, text)
+    if text.endswith("\\") and not text.endswith("\\\\"):
+        text += "\\"
+    return text
+
+
+def strip_markup(text: str) -> str:
+    """
+    Returns the text without its markup tags.
+
+    :param text: The text with console markup.
+    :return: The plain text.
+    """
+    if "[" not in text:
+        return text
+    return _TAG_PATTERN.sub(_replace_tag, text)
+
+
+def _replace_tag(match: re.Match) -> str:
+    pairs, escaped = divmod(len(match.group(1)), 2)
+    return "\\" * pairs + (f"[{match.group(2)}]" if escaped else "")
+
+
+def _escape_tag(match: re.Match) -> str:
+    backslashes = match.group(1)
+    return f"{backslashes}{backslashes}\\[{match.group(2)}]"
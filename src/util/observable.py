@@ -0,0 +1,114 @@
+"""
+Provides the Observable mixin and the ObserverIndex base class.
+
+Collections that are indexed from the outside (for example, the phone numbers
+of a contact kept in a contact book index) use this mixin to tell their
+listeners about every item they add, remove or replace. The indexes derive
+from `ObserverIndex`, which keeps them subscribed to the collections of the
+owners attached to them.
+"""
+from collections.abc import Hashable
+from functools import partial
+from typing import Callable, Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+O = TypeVar("O")
+
+Listener = Callable[[T | None, T | None], None]
+
+
+class Observable(Generic[T]):
+    """
+    A mixin that notifies subscribed listeners about item changes.
+
+    A listener is called with the old and the new item: ``(None, item)`` when an
+    item is added, ``(item, None)`` when it is removed and ``(old, new)`` when
+    one item is replaced with another.
+    """
+
+    __slots__ = ("__listeners",)
+
+    def __init__(self):
+        self.__listeners: list[Listener] = []
+
+    def subscribe(self, listener: Listener) -> None:
+        """Subscribes the listener to item changes."""
+        self.__listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        """Unsubscribes the listener from item changes, if it is subscribed."""
+        if listener in self.__listeners:
+            self.__listeners.remove(listener)
+
+    def _notify(self, old: T | None, new: T | None) -> None:
+        """Notifies every subscribed listener about an item change."""
+        for listener in self.__listeners:
+            listener(old, new)
+
+
+class ObserverIndex(Generic[O, T]):
+    """
+    Base class of the indexes of the items of observable collections, each
+    collection belonging to an owner, such as the phone numbers of contacts.
+
+    Attaching an owner indexes its items and subscribes to its collection, so
+    the index stays up to date when items are added, removed or replaced.
+    Detaching the owner unsubscribes and removes its items. An owner is
+    attached once; attaching it again does nothing. An owner that is itself
+    the observable, such as a contact notifying about its birthday, tells
+    its items through `_items`.
+    """
+
+    def __init__(self, key: Callable[[O], Hashable], observable: Callable[[O], Observable[T]],
+                 add: Callable[[T, O], None], remove: Callable[[T, O], None]):
+        """
+        :param key: Returns the key that identifies an owner.
+        :param observable: Returns the observable collection of an owner.
+        :param add: Adds an item of an owner to the index.
+        :param remove: Removes an item of an owner from the index.
+        """
+        self.__key = key
+        self.__observable = observable
+        self.__add = add
+        self.__remove = remove
+        self.__listeners: dict[Hashable, partial] = {}
+
+    def attach(self, owner: O) -> None:
+        """
+        Indexes the items of the owner and follows their changes.
+
+        :param owner: The owner to attach.
+        """
+        key = self.__key(owner)
+        if key in self.__listeners:
+            return
+        for item in self._items(owner):
+            self.__add(item, owner)
+        listener = partial(self.__on_change, owner)
+        self.__observable(owner).subscribe(listener)
+        self.__listeners[key] = listener
+
+    def detach(self, owner: O) -> None:
+        """
+        Removes the items of the owner from the index and stops following
+        their changes.
+
+        :param owner: The owner to detach.
+        """
+        listener = self.__listeners.pop(self.__key(owner), None)
+        if listener is None:
+            return
+        self.__observable(owner).unsubscribe(listener)
+        for item in self._items(owner):
+            self.__remove(item, owner)
+
+    def _items(self, owner: O) -> Iterable[T]:
+        """Returns the current items of the owner, those of its observable collection."""
+        return self.__observable(owner)
+
+    def __on_change(self, owner: O, old: T | None, new: T | None) -> None:
+        """Applies a change of the owner's items to the index."""
+        if old is not None:
+            self.__remove(old, owner)
+        if new is not None:
+            self.__add(new, owner)
@@ -0,0 +1,76 @@
+"""
+Captures the text printed by the current thread.
+
+`contextlib.redirect_stdout` swaps `sys.stdout` for the whole process, so two
+threads that capture the output of their commands at the same time would
+mix it up. `capture_output` instead installs a stream that sends each
+thread's writes to that thread's own buffer while a capture is active, and to
+the original stream otherwise.
+"""
+import io
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator, TextIO
+
+
+class _ThreadLocalStream(io.TextIOBase):
+    """A text stream that writes to the buffer of the current thread, if it has one."""
+
+    def __init__(self, default: TextIO):
+        super().__init__()
+        self.default = default
+        self.__local = threading.local()
+
+    @property
+    def buffer_of_thread(self) -> io.StringIO | None:
+        """Returns the capture buffer of the current thread."""
+        return getattr(self.__local, "buffer", None)
+
+    @buffer_of_thread.setter
+    def buffer_of_thread(self, buffer: io.StringIO | None) -> None:
+        self.__local.buffer = buffer
+
+    def write(self, text: str) -> int:
+        target = self.buffer_of_thread
+        return (self.default if target is None else target).write(text)
+
+    def flush(self) -> None:
+        if self.buffer_of_thread is None:
+            self.default.flush()
+
+    def isatty(self) -> bool:
+        return self.buffer_of_thread is None and self.default.isatty()
+
+    def writable(self) -> bool:
+        return True
+
+
+_install_lock = threading.Lock()
+_active_captures = 0
+
+
+@contextmanager
+def capture_output() -> Iterator[io.StringIO]:
+    """
+    Collects what the current thread prints in the `with` block.
+
+    :return: The buffer with the captured text.
+    """
+    global _active_captures  # pylint: disable=global-statement
+    with _install_lock:
+        if not isinstance(sys.stdout, _ThreadLocalStream):
+            sys.stdout = _ThreadLocalStream(sys.stdout)
+        stream = sys.stdout
+        _active_captures += 1
+    buffer = io.StringIO()
+    previous = stream.buffer_of_thread
+    stream.buffer_of_thread = buffer
+    try:
+        yield buffer
+    finally:
+        stream.buffer_of_thread = previous
+        with _install_lock:
+            _active_captures -= 1
+            if _active_captures == 0 and sys.stdout is stream:
+                sys.stdout = stream.default
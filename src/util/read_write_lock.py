@@ -0,0 +1,86 @@
+"""
+Provides the ReadWriteLock class.
+
+The lock protects data that is read far more often than it is changed, such
+as the contact book and the notes shared by the clients of the server: any
+number of readers may hold it at once, while a writer holds it alone.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """
+    A lock that lets in either many readers or one writer at a time.
+
+    Writers are preferred: once a writer is waiting, new readers wait behind
+    it, so a steady stream of readers cannot starve the writers. The lock is
+    not reentrant.
+    """
+
+    def __init__(self):
+        self.__condition = threading.Condition(threading.Lock())
+        self.__readers = 0
+        self.__writer = False
+        self.__waiting_writers = 0
+        self.__waiting_readers = 0
+
+    @property
+    def waiting_readers(self) -> int:
+        """Returns the number of readers waiting for the lock."""
+        return self.__waiting_readers
+
+    @property
+    def waiting_writers(self) -> int:
+        """Returns the number of writers waiting for the lock."""
+        return self.__waiting_writers
+
+    def acquire_read(self) -> None:
+        """Waits until no writer holds or waits for the lock and enters as a reader."""
+        with self.__condition:
+            self.__waiting_readers += 1
+            while self.__writer or self.__waiting_writers > 0:
+                self.__condition.wait()
+            self.__waiting_readers -= 1
+            self.__readers += 1
+
+    def release_read(self) -> None:
+        """Leaves the lock as a reader."""
+        with self.__condition:
+            self.__readers -= 1
+            if self.__readers == 0:
+                self.__condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """Waits until the lock is free and enters as the only writer."""
+        with self.__condition:
+            self.__waiting_writers += 1
+            while self.__writer or self.__readers > 0:
+                self.__condition.wait()
+            self.__waiting_writers -= 1
+            self.__writer = True
+
+    def release_write(self) -> None:
+        """Leaves the lock as the writer."""
+        with self.__condition:
+            self.__writer = False
+            self.__condition.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Holds the lock as a reader for the duration of the `with` block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Holds the lock as the writer for the duration of the `with` block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -0,0 +1,115 @@
+"""
+Provides the TrigramIndex class.
+
+The index supports fast substring search over a large number of short texts
+(contact names, phone numbers) without scanning every text on each query.
+"""
+from collections.abc import Hashable
+from typing import Generic, Iterator, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class TrigramIndex(Generic[K]):
+    """
+    A posting-list index for substring search.
+
+    Every indexed text is split into overlapping trigrams, and each trigram
+    keeps a posting list of the keys whose text contains it. A substring query
+    intersects the posting lists of its own trigrams and verifies only the
+    candidates that survive. Posting lists are dictionaries, so the results
+    keep the order in which the keys were indexed.
+    """
+
+    size = 3
+
+    def __init__(self):
+        self.__texts: dict[K, str] = {}
+        self.__postings: dict[str, dict[K, None]] = {}
+
+    def add(self, key: K, text: str) -> None:
+        """
+        Indexes the text under the given key.
+
+        If the key is already indexed, its previous text is replaced.
+
+        :param key: The key returned by the search for this text.
+        :param text: The text to index.
+        """
+        if key in self.__texts:
+            self.remove(key)
+        self.__texts[key] = text
+        for gram in TrigramIndex.__grams(text):
+            self.__postings.setdefault(gram, {})[key] = None
+
+    def remove(self, key: K) -> bool:
+        """
+        Removes the key and its text from the index.
+
+        :param key: The key to remove.
+        :return: True if the key was indexed, False otherwise.
+        """
+        text = self.__texts.pop(key, None)
+        if text is None:
+            return False
+        for gram in TrigramIndex.__grams(text):
+            posting = self.__postings.get(gram)
+            if posting is None:
+                continue
+            posting.pop(key, None)
+            if len(posting) == 0:
+                del self.__postings[gram]
+        return True
+
+    def search(self, pattern: str) -> list[K]:
+        """
+        Returns the keys of all texts that contain the pattern.
+
+        Patterns shorter than a trigram have no posting list to look up, so
+        they are checked against every indexed text.
+
+        :param pattern: The substring to search for.
+        :return: The matching keys in the order they were indexed.
+        """
+        return list(self.iter_search(pattern))
+
+    def iter_search(self, pattern: str) -> Iterator[K]:
+        """
+        Yields the keys of the texts that contain the pattern, one at a time.
+
+        The candidates are verified as they are taken, so the first keys are
+        available before the posting lists have been walked to the end, and
+        no list of results is built. The index must not change while the
+        iterator is in use.
+
+        :param pattern: The substring to search for.
+        :return: An iterator over the matching keys in the order they were indexed.
+        """
+        if len(pattern) < TrigramIndex.size:
+            return (key for key, text in self.__texts.items() if pattern in text)
+
+        postings = []
+        for gram in TrigramIndex.__grams(pattern):
+            posting = self.__postings.get(gram)
+            if posting is None:
+                return iter(())
+            postings.append(posting)
+        postings.sort(key=len)
+
+        smallest, others = postings[0], postings[1:]
+        return (
+            key for key in smallest
+            if all(key in posting for posting in others) and pattern in self.__texts[key]
+        )
+
+    def __len__(self) -> int:
+        return len(self.__texts)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self.__texts
+
+    @staticmethod
+    def __grams(text: str) -> set[str]:
+        """Splits the text into a set of overlapping trigrams."""
+        size = TrigramIndex.size
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
@@ -0,0 +1,41 @@
+"""
+Unit tests for the CommandStatistics class.
+"""
+import json
+from pathlib import Path
+
+from src.command.command_statistics import CommandStatistics
+
+
+def test_summary_reports_counts_errors_and_latencies() -> None:
+    """
+    Tests that the summary has one row per command with its error rate and
+    latencies in milliseconds.
+    """
+    statistics = CommandStatistics()
+    statistics.record("add-contact", 2_000_000, False)
+    statistics.record("add-contact", 4_000_000, True)
+    statistics.record("all-contacts", 1_000_000, False)
+
+    rows = statistics.summary()
+
+    assert [row["command"] for row in rows] == ["add-contact", "all-contacts"]
+    assert rows[0]["count"] == 2
+    assert rows[0]["errors"] == 1
+    assert rows[0]["error_rate"] == 0.5
+    assert rows[0]["mean_ms"] == 3.0
+    assert rows[0]["max_ms"] == 4.0
+    assert rows[1]["p99_ms"] == 1.0
+
+
+def test_export_writes_the_summary_as_json(tmp_path: Path) -> None:
+    """
+    Tests that the exported file contains the summary.
+    """
+    statistics = CommandStatistics()
+    statistics.record("help", 500_000, False)
+    path = tmp_path / "stats.json"
+
+    statistics.export(path)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == statistics.summary()
@@ -0,0 +1,31 @@
+"""
+Unit tests for the CommandHandlers class.
+"""
+import io
+from contextlib import redirect_stdout
+
+from src.command.command_description import CommandDefinition
+from src.command.handler.command_handler import CommandHandler
+from src.command.handler.command_handlers import CommandHandlers
+
+
+def show_list(handlers: CommandHandlers) -> str:
+    """Returns the printed list of available commands."""
+    with redirect_stdout(io.StringIO()) as buffer:
+        handlers.show_list_available_commands()
+    return buffer.getvalue()
+
+
+def test_registering_a_handler_updates_the_cached_list() -> None:
+    """
+    Tests that the cached command list includes a handler registered after
+    the list has been shown.
+    """
+    handlers = CommandHandlers()
+    handlers.register(CommandHandler(CommandDefinition("first", "The first command.")))
+    assert "first" in show_list(handlers)
+
+    handlers.register(CommandHandler(CommandDefinition("second", "The second command.")))
+
+    listed = show_list(handlers)
+    assert "first" in listed and "second" in listed
@@ -0,0 +1,45 @@
+"""
+Unit tests for the LazyCommandHandler class.
+"""
+from src.command import definitions
+from src.command.handler.contact.add_contact import AddContactCommandHandler
+from src.command.handler.lazy_command_handler import LazyCommandHandler
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+
+
+def test_handler_is_not_loaded_until_used() -> None:
+    """
+    Tests that the name and description come from the definition without
+    loading the real handler.
+    """
+    handler = LazyCommandHandler(
+        definitions.ADD_CONTACT,
+        "src.command.handler.contact.add_contact.AddContactCommandHandler",
+        ContactBook(),
+    )
+
+    assert handler.name == definitions.ADD_CONTACT.name
+    assert handler.description == definitions.ADD_CONTACT.description
+    assert not handler.is_loaded
+    assert handler.load_time is None
+
+
+def test_handle_loads_and_delegates_to_real_handler() -> None:
+    """
+    Tests that handling a command creates the real handler with the given
+    arguments and delegates to it.
+    """
+    contact_book = ContactBook()
+    handler = LazyCommandHandler(
+        definitions.ADD_CONTACT,
+        "src.command.handler.contact.add_contact.AddContactCommandHandler",
+        contact_book,
+    )
+
+    assert handler.handle(["John"])
+    assert handler.is_loaded
+    assert handler.load_time is not None
+    assert isinstance(handler.handler, AddContactCommandHandler)
+    assert handler.is_mutating
+    assert contact_book.find(Name("John")) is not None
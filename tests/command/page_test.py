@@ -0,0 +1,46 @@
+"""
+Unit tests for the Page class.
+"""
+import itertools
+
+import pytest
+
+from src.command.page import Page
+
+
+def test_from_args_takes_out_the_options() -> None:
+    """
+    Tests that the options are taken out of the arguments wherever they are.
+    """
+    page, rest = Page.from_args(["--offset", "5", "work", "--LIMIT", "3", "all"])
+
+    assert (page.offset, page.limit) == (5, 3)
+    assert rest == ["work", "all"]
+
+
+def test_from_args_uses_the_default_limit() -> None:
+    """
+    Tests that the default limit applies when the option is missing.
+    """
+    page, rest = Page.from_args(["milk"], default_limit=20)
+
+    assert (page.offset, page.limit) == (0, 20)
+    assert rest == ["milk"]
+
+
+@pytest.mark.parametrize("args", [["--limit"], ["--limit", "x"], ["--offset", "-1"], ["--limit", "0"]])
+def test_from_args_rejects_invalid_values(args: list[str]) -> None:
+    """
+    Tests that an option without a non-negative number fails, and that the
+    limit must be positive.
+    """
+    with pytest.raises(ValueError):
+        Page.from_args(args)
+
+
+def test_apply_consumes_only_the_page() -> None:
+    """
+    Tests that applying a page to an endless iterator takes only the results
+    of the page.
+    """
+    assert list(Page(offset=2, limit=3).apply(itertools.count())) == [2, 3, 4]
@@ -0,0 +1,127 @@
+"""
+Unit tests for the BirthdayCalendar class.
+"""
+from datetime import date
+
+import pytest
+
+from src.domain.contact.birthday import Birthday
+from src.domain.contact.birthday_calendar import BirthdayCalendar
+from src.domain.contact.contact import Contact
+from src.domain.contact.name import Name
+
+
+def create_contact(name: str, birthday: str | None) -> Contact:
+    """Creates a contact with an optional birthday."""
+    contact = Contact(Name(name))
+    if birthday is not None:
+        contact.add_birthday(Birthday(birthday))
+    return contact
+
+
+@pytest.mark.parametrize("month, day, expected", [
+    (1, 1, 0),
+    (2, 29, 59),
+    (3, 1, 60),
+    (12, 31, 365),
+])
+def test_day_of_year(month: int, day: int, expected: int) -> None:
+    """
+    Tests that days are mapped to the buckets of a leap year.
+    """
+    assert BirthdayCalendar.day_of_year(month, day) == expected
+
+
+def test_upcoming_orders_by_date_and_ignores_contacts_without_birthday() -> None:
+    """
+    Tests that only the contacts with a birthday in the period are returned,
+    ordered by the date of the birthday.
+    """
+    calendar = BirthdayCalendar()
+    john = create_contact("John", "20.05.1990")
+    alice = create_contact("Alice", "15.05.1985")
+    bob = create_contact("Bob", None)
+    dan = create_contact("Dan", "01.07.1980")
+    for contact in (john, alice, bob, dan):
+        calendar.attach(contact)
+
+    assert calendar.upcoming(7, date(2025, 5, 14)) == [alice, john]
+
+
+def test_upcoming_today_only() -> None:
+    """
+    Tests that a period of 0 days returns only today's birthdays.
+    """
+    calendar = BirthdayCalendar()
+    john = create_contact("John", "14.05.1990")
+    alice = create_contact("Alice", "15.05.1990")
+    calendar.attach(john)
+    calendar.attach(alice)
+
+    assert calendar.upcoming(0, date(2025, 5, 14)) == [john]
+
+
+def test_upcoming_wraps_around_end_of_year() -> None:
+    """
+    Tests that the period continues into the next year.
+    """
+    calendar = BirthdayCalendar()
+    john = create_contact("John", "02.01.1990")
+    alice = create_contact("Alice", "30.12.1990")
+    calendar.attach(john)
+    calendar.attach(alice)
+
+    assert calendar.upcoming(5, date(2025, 12, 29)) == [alice, john]
+
+
+@pytest.mark.parametrize("today, expected_count", [
+    (date(2025, 2, 28), 1),
+    (date(2024, 2, 28), 0),
+    (date(2024, 2, 29), 1),
+])
+def test_upcoming_february_29(today: date, expected_count: int) -> None:
+    """
+    Tests that February 29 birthdays are celebrated on February 28 in non-leap
+    years and on February 29 in leap years.
+    """
+    calendar = BirthdayCalendar()
+    calendar.attach(create_contact("John", "29.02.2000"))
+
+    assert len(calendar.upcoming(0, today)) == expected_count
+
+
+def test_upcoming_full_year_lists_each_contact_once() -> None:
+    """
+    Tests that a period longer than a year visits every day once.
+    """
+    calendar = BirthdayCalendar()
+    john = create_contact("John", "28.02.1990")
+    leap = create_contact("Leap", "29.02.2000")
+    calendar.attach(john)
+    calendar.attach(leap)
+
+    assert calendar.upcoming(1000, date(2025, 2, 28)) == [john, leap]
+
+
+def test_calendar_follows_birthday_changes() -> None:
+    """
+    Tests that adding, changing and deleting the birthday of an attached contact
+    is reflected in the calendar, and that a detached contact is ignored.
+    """
+    calendar = BirthdayCalendar()
+    contact = create_contact("John", None)
+    calendar.attach(contact)
+    today = date(2025, 5, 14)
+
+    contact.add_birthday(Birthday("14.05.1990"))
+    assert calendar.upcoming(0, today) == [contact]
+
+    contact.add_birthday(Birthday("20.06.1990"))
+    assert calendar.upcoming(0, today) == []
+
+    contact.delete_birthday()
+    assert calendar.upcoming(60, today) == []
+
+    calendar.detach(contact)
+    contact.add_birthday(Birthday("14.05.1990"))
+    assert calendar.upcoming(0, today) == []
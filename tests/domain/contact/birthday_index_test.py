@@ -0,0 +1,60 @@
+"""
+Unit tests for the BirthdayIndex class.
+"""
+from datetime import date
+
+from src.domain.contact.birthday import Birthday
+from src.domain.contact.birthday_index import BirthdayIndex
+from src.domain.contact.contact import Contact
+from src.domain.contact.name import Name
+
+
+def make_contact(name: str, birthday: str | None = None) -> Contact:
+    """
+    Creates a contact with the given birthday.
+    """
+    contact = Contact(Name(name))
+    if birthday is not None:
+        contact.add_birthday(Birthday(birthday))
+    return contact
+
+
+def test_find_by_date_year_and_range() -> None:
+    """
+    Tests exact-date, year and range queries.
+    """
+    index = BirthdayIndex()
+    john = make_contact("John", "15.03.1990")
+    jane = make_contact("Jane", "01.01.1991")
+    bob = make_contact("Bob", "15.03.1990")
+    alice = make_contact("Alice")
+    for contact in (john, jane, bob, alice):
+        index.attach(contact)
+
+    assert index.find_date(date(1990, 3, 15)) == [john, bob]
+    assert index.find_year(1990) == [john, bob]
+    assert index.find_range(date(1990, 3, 16), date(1991, 1, 1)) == [jane]
+    assert index.find_range(date(1980, 1, 1), date(2000, 1, 1)) == [john, bob, jane]
+    assert index.find_year(1992) == []
+
+
+def test_find_follows_birthday_changes() -> None:
+    """
+    Tests that adding, changing and deleting the birthday of an attached
+    contact, and detaching it, is reflected in the index.
+    """
+    index = BirthdayIndex()
+    john = make_contact("John", "15.03.1990")
+    bob = make_contact("Bob", "15.03.1990")
+    index.attach(john)
+    index.attach(bob)
+
+    john.add_birthday(Birthday("16.03.1990"))
+    assert index.find_date(date(1990, 3, 15)) == [bob]
+    assert index.find_date(date(1990, 3, 16)) == [john]
+
+    john.delete_birthday()
+    assert index.find_year(1990) == [bob]
+
+    index.detach(bob)
+    assert index.find_year(1990) == []
@@ -2,12 +2,18 @@
 Unit tests for verifying the behavior of the ContactBook class methods.
 """
 
+from datetime import date
+
+from src.domain.contact.birthday import Birthday
 from src.domain.contact.contact import Contact
 from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.email import Email
+from src.domain.contact.email_search_template import EmailSearchTemplate
 from src.domain.contact.name import Name
 from src.domain.contact.name_search_template import NameSearchTemplate
 from src.domain.contact.phone import Phone
 from src.domain.contact.phone_number_search_template import PhoneNumberSearchTemplate
+from src.usecase.add_email import add_email
 
 
 def test_add_contact_adds_new_contact():
@@ -75,6 +81,35 @@ def test_find_contact_non_existing() -> None:
     assert result is None
 
 
+def test_find_contact_case_insensitive() -> None:
+    """
+    Test that the `find` method returns the contact when the Name differs
+    from the stored one only in case.
+    """
+    contact_book = ContactBook()
+    contact = Contact(Name("Alice"))
+    contact_book.add(contact)
+
+    result = contact_book.find(Name("aLiCe"))
+
+    assert result == contact
+
+
+def test_add_contact_does_not_add_duplicate_in_other_case() -> None:
+    """
+    Test that add does not add a contact whose name differs from an existing
+    one only in case.
+    """
+    contact_book = ContactBook()
+    contact = Contact(Name("Alice"))
+    contact_book.add(contact)
+
+    contact_book.add(Contact(Name("alice")))
+
+    assert len(contact_book.data) == 1
+    assert contact_book.find(Name("ALICE")) == contact
+
+
 def test_delete_existing_contact():
     """
     Test that delete successfully removes and returns a Contact object
@@ -245,3 +280,171 @@ def test_find_by_phone_empty_contact_book():
     result = book.find_by_phone(template)
 
     assert result is None
+
+
+def test_find_by_name_after_delete():
+    """
+    Tests that find_by_name does not return a contact that has been deleted.
+    """
+    book = ContactBook()
+    contact1 = Contact(Name("John Smith"))
+    contact2 = Contact(Name("Johnny Depp"))
+    book.add(contact1)
+    book.add(contact2)
+
+    book.delete(contact1.name)
+    result = book.find_by_name(NameSearchTemplate("John"))
+
+    assert result == [contact2]
+
+
+def test_find_by_name_short_template():
+    """
+    Tests that find_by_name matches templates shorter than a trigram.
+    """
+    book = ContactBook()
+    contact1 = Contact(Name("John Smith"))
+    contact2 = Contact(Name("Alice Wonderland"))
+    book.add(contact1)
+    book.add(contact2)
+
+    result = book.find_by_name(NameSearchTemplate("al"))
+
+    assert result == [contact2]
+
+
+def test_find_by_phone_after_phone_changes():
+    """
+    Test that `find_by_phone` reflects phone numbers changed after the contact
+    was added to the book.
+    """
+    book = ContactBook()
+    contact = Contact(Name("John"))
+    book.add(contact)
+
+    contact.phones.add(Phone("1234567890"))
+    contact.phones.replace(Phone("1234567890"), Phone("0987654321"))
+
+    assert book.find_by_phone(PhoneNumberSearchTemplate("123")) is None
+    assert book.find_by_phone(PhoneNumberSearchTemplate("4321")) == [contact]
+
+
+def test_find_by_phone_after_delete():
+    """
+    Test that `find_by_phone` does not return a deleted contact.
+    """
+    book = ContactBook()
+    contact = Contact(Name("John"))
+    contact.phones.add(Phone("1234567890"))
+    book.add(contact)
+
+    book.delete(contact.name)
+
+    assert book.find_by_phone(PhoneNumberSearchTemplate("123")) is None
+
+
+def test_delete_contact_case_insensitive():
+    """
+    Test that delete removes the contact from the book and from its indexes
+    when the Name differs from the stored one only in case.
+    """
+    book = ContactBook()
+    contact = Contact(Name("John"))
+    contact.phones.add(Phone("1234567890"))
+    book.add(contact)
+
+    deleted_contact = book.delete(Name("JOHN"))
+
+    assert deleted_contact == contact
+    assert book.find_by_name(NameSearchTemplate("john")) is None
+    assert book.find_by_phone(PhoneNumberSearchTemplate("123")) is None
+
+
+def test_find_upcoming_birthdays():
+    """
+    Test that `find_upcoming_birthdays` returns the contacts whose birthday is
+    within the period, including birthdays added after the contact, and None
+    when there are none.
+    """
+    book = ContactBook()
+    contact1 = Contact(Name("John"))
+    contact2 = Contact(Name("Alice"))
+    contact1.add_birthday(Birthday("16.05.1990"))
+    book.add(contact1)
+    book.add(contact2)
+    contact2.add_birthday(Birthday("15.05.1990"))
+
+    assert book.find_upcoming_birthdays(3, date(2025, 5, 14)) == [contact2, contact1]
+    assert book.find_upcoming_birthdays(0, date(2025, 5, 14)) is None
+
+
+def test_find_by_email_domain_address_and_prefix():
+    """
+    Test that `find_by_email` finds contacts by domain, by full address and by
+    prefix, and follows emails added through the `add_email` use case.
+    """
+    book = ContactBook()
+    john = Contact(Name("John"))
+    alice = Contact(Name("Alice"))
+    john.emails.add(Email("john@example.com"))
+    book.add(john)
+    book.add(alice)
+    add_email(book, Name("Alice"), Email("alice@example.com"))
+
+    assert book.find_by_email(EmailSearchTemplate("@Example.com")) == [john, alice]
+    assert book.find_by_email(EmailSearchTemplate("alice@example.com")) == [alice]
+    assert book.find_by_email(EmailSearchTemplate("jo")) == [john]
+    assert book.find_by_email(EmailSearchTemplate("@other.org")) is None
+
+
+def test_find_by_email_after_delete():
+    """
+    Test that the emails of a deleted contact are no longer found.
+    """
+    book = ContactBook()
+    john = Contact(Name("John"))
+    john.emails.add(Email("john@example.com"))
+    book.add(john)
+
+    book.delete(Name("John"))
+
+    assert book.find_by_email(EmailSearchTemplate("john@example.com")) is None
+
+
+def test_find_by_birthday_year_and_month():
+    """
+    Test the date of birth searches of the contact book.
+    """
+    book = ContactBook()
+    john = Contact(Name("John"))
+    john.add_birthday(Birthday("15.03.1990"))
+    alice = Contact(Name("Alice"))
+    alice.add_birthday(Birthday("02.03.1985"))
+    book.add(john)
+    book.add(alice)
+
+    assert book.find_by_birthday(date(1990, 3, 15)) == [john]
+    assert book.find_by_birthday(date(1980, 1, 1), date(1989, 12, 31)) == [alice]
+    assert book.find_by_birth_year(1985) == [alice]
+    assert book.find_by_birth_month(3) == [alice, john]
+    assert book.find_by_birth_month(3, 1990) == [john]
+    assert book.find_by_birth_month(12) is None
+
+
+def test_iter_by_name_and_phone_yield_matches_lazily() -> None:
+    """
+    Tests that the lazy searches yield the same contacts as the list searches.
+    """
+    contact_book = ContactBook()
+    for number in range(50):
+        contact = Contact(Name(f"Contact {number}"))
+        contact.phones.add(Phone(f"{number:010d}"))
+        contact_book.add(contact)
+
+    by_name = contact_book.iter_by_name(NameSearchTemplate("contact"))
+    assert next(by_name).name == Name("Contact 0")
+    assert list(contact_book.iter_by_name(NameSearchTemplate("act 4"))) == \
+        contact_book.find_by_name(NameSearchTemplate("act 4"))
+    assert list(contact_book.iter_by_phone(PhoneNumberSearchTemplate("0000000001"))) == \
+        contact_book.find_by_phone(PhoneNumberSearchTemplate("0000000001"))
+    assert list(contact_book.iter_by_name(NameSearchTemplate("missing"))) == []
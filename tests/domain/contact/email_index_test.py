@@ -0,0 +1,97 @@
+"""
+Unit tests for the EmailIndex class.
+"""
+
+from src.domain.contact.contact import Contact
+from src.domain.contact.email import Email
+from src.domain.contact.email_index import EmailIndex
+from src.domain.contact.name import Name
+
+
+def make_contact(name: str, *emails: str) -> Contact:
+    """
+    Creates a contact with the given emails.
+    """
+    contact = Contact(Name(name))
+    for email in emails:
+        contact.emails.add(Email(email))
+    return contact
+
+
+def test_find_by_address_domain_and_prefix() -> None:
+    """
+    Tests exact, domain-wide and prefix queries, all case-insensitive.
+    """
+    index = EmailIndex()
+    john = make_contact("John", "john@example.com", "jd@work.org")
+    jane = make_contact("Jane", "jane@Example.com")
+    index.attach(john)
+    index.attach(jane)
+
+    assert index.find_address("JOHN@example.com") == [john]
+    assert index.find_domain("@example.com") == [john, jane]
+    assert index.find_domain("work.org") == [john]
+    assert index.find_prefix("ja") == [jane]
+    assert index.find_prefix("j") == [jane, john]
+    assert index.find_prefix("x") == []
+
+
+def test_find_follows_email_changes() -> None:
+    """
+    Tests that adding, replacing and removing emails of an attached contact
+    is reflected in the index.
+    """
+    index = EmailIndex()
+    contact = make_contact("John")
+    index.attach(contact)
+
+    contact.emails.add(Email("john@example.com"))
+    assert index.find_domain("example.com") == [contact]
+
+    contact.emails.replace(Email("john@example.com"), Email("john@work.org"))
+    assert index.find_domain("example.com") == []
+    assert index.find_prefix("john@w") == [contact]
+
+    contact.emails.remove(Email("john@work.org"))
+    assert index.find_address("john@work.org") == []
+    assert index.find_prefix("john") == []
+
+
+def test_shared_address_stays_until_last_owner_is_detached() -> None:
+    """
+    Tests that an address shared by two contacts is kept until both are detached.
+    """
+    index = EmailIndex()
+    john = make_contact("John", "family@example.com")
+    jane = make_contact("Jane", "family@example.com")
+    index.attach(john)
+    index.attach(jane)
+
+    index.detach(john)
+    john.emails.add(Email("john@example.com"))
+
+    assert index.find_address("family@example.com") == [jane]
+    assert index.find_domain("example.com") == [jane]
+    index.detach(jane)
+    assert index.find_prefix("f") == []
+
+
+def test_address_stays_while_contact_owns_another_case() -> None:
+    """
+    Tests that removing one of two addresses of a contact that differ only in
+    case keeps the contact under the address and its domain.
+    """
+    index = EmailIndex()
+    contact = make_contact("John", "John@x.com", "john@x.com")
+    index.attach(contact)
+
+    contact.emails.remove(Email("John@x.com"))
+
+    assert index.find_address("john@x.com") == [contact]
+    assert index.find_domain("x.com") == [contact]
+    assert index.find_prefix("jo") == [contact]
+
+    contact.emails.remove(Email("john@x.com"))
+
+    assert index.find_address("john@x.com") == []
+    assert index.find_domain("x.com") == []
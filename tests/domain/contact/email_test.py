@@ -66,3 +66,16 @@ def test_creating_email_by_invalid_value(value: str) -> None:
     """
     with pytest.raises(InvalidEmailError):
         Email(value)
+
+
+def test_email_domain_is_casefolded_and_shared() -> None:
+    """
+    Tests that the domain of an email is casefolded and that emails on the
+    same domain share one domain string.
+    """
+    one_email = Email("john@Example.com")
+    two_email = Email("".join(["jane", "@", "example", ".com"]))
+
+    assert one_email.domain == "example.com"
+    assert one_email.domain is two_email.domain
+    assert not hasattr(one_email, "__dict__")
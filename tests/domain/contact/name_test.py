@@ -78,13 +78,35 @@ def test_checking_for_equality_of_two_unequal_type() -> None:
 
 
 @pytest.mark.parametrize("name, expected_hash", [
-    ("John", hash("John")),
-    ("Dan", hash("Dan"))
+    ("John", hash("john")),
+    ("Dan", hash("dan"))
 ])
 def test_name_hash_function(name, expected_hash: int) -> None:
     """
     Tests the correctness of the __hash__ implementation in the Name class.
-    Ensures that the hash of a Name object matches the hash of its value.
+    Ensures that the hash of a Name object matches the hash of its casefolded value.
     """
     name_instance = Name(name)
     assert expected_hash == hash(name_instance)
+
+
+def test_name_key_is_casefolded() -> None:
+    """
+    Tests that the key of a Name is its casefolded value and that names that
+    differ only in case have the same hash.
+    """
+    one_name = Name("STRASSE")
+    two_name = Name("straße")
+
+    assert one_name.key == "strasse"
+    assert hash(one_name) == hash(two_name)
+
+
+def test_casefolded_name_shares_key() -> None:
+    """
+    Tests that a name that is already casefolded uses its value as the key.
+    """
+    name = Name("john")
+
+    assert name.key is name.value
+    assert not hasattr(name, "__dict__")
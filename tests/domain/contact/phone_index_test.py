@@ -0,0 +1,88 @@
+"""
+Unit tests for the PhoneIndex class.
+"""
+
+from src.domain.contact.contact import Contact
+from src.domain.contact.name import Name
+from src.domain.contact.phone import Phone
+from src.domain.contact.phone_index import PhoneIndex
+from src.domain.contact.phone_number_search_template import PhoneNumberSearchTemplate
+
+
+def test_find_indexes_existing_phones_on_attach() -> None:
+    """
+    Tests that the phone numbers a contact already has are indexed on attach.
+    """
+    index = PhoneIndex()
+    contact = Contact(Name("John"))
+    contact.phones.add(Phone("1234567890"))
+
+    index.attach(contact)
+
+    assert index.find(PhoneNumberSearchTemplate("7890")) == [contact]
+
+
+def test_find_follows_phone_changes() -> None:
+    """
+    Tests that adding, replacing and removing phone numbers of an attached
+    contact is reflected in the index.
+    """
+    index = PhoneIndex()
+    contact = Contact(Name("John"))
+    index.attach(contact)
+
+    contact.phones.add(Phone("1234567890"))
+    assert index.find(PhoneNumberSearchTemplate("123")) == [contact]
+
+    contact.phones.replace(Phone("1234567890"), Phone("5554443322"))
+    assert index.find(PhoneNumberSearchTemplate("123")) == []
+    assert index.find(PhoneNumberSearchTemplate("3322")) == [contact]
+
+    contact.phones.remove(Phone("5554443322"))
+    assert index.find(PhoneNumberSearchTemplate("3322")) == []
+
+
+def test_find_returns_each_contact_once() -> None:
+    """
+    Tests that a contact with several matching phone numbers is returned once,
+    and that a phone number shared by two contacts returns both.
+    """
+    index = PhoneIndex()
+    john = Contact(Name("John"))
+    alice = Contact(Name("Alice"))
+    john.phones.add(Phone("1234567890"))
+    john.phones.add(Phone("1234500000"))
+    alice.phones.add(Phone("1234567890"))
+    index.attach(john)
+    index.attach(alice)
+
+    assert index.find(PhoneNumberSearchTemplate("12345")) == [john, alice]
+
+
+def test_detach_stops_indexing() -> None:
+    """
+    Tests that a detached contact is removed from the index and that its later
+    phone changes are ignored.
+    """
+    index = PhoneIndex()
+    contact = Contact(Name("John"))
+    contact.phones.add(Phone("1234567890"))
+    index.attach(contact)
+
+    index.detach(contact)
+    contact.phones.add(Phone("1231231231"))
+
+    assert index.find(PhoneNumberSearchTemplate("123")) == []
+
+
+def test_iter_find_lists_each_contact_once() -> None:
+    """
+    Tests that a contact with several matching phone numbers is yielded once.
+    """
+    index = PhoneIndex()
+    contact = Contact(Name("John"))
+    contact.phones.add(Phone("1234567890"))
+    contact.phones.add(Phone("1234567891"))
+    index.attach(contact)
+
+    assert list(index.iter_find(PhoneNumberSearchTemplate("123456"))) == [contact]
@@ -186,3 +186,24 @@ def test_contains_empty_phone_list():
     template = PhoneNumberSearchTemplate("1234567890")
 
     assert phones.contains(template) is False
+
+
+def test_many_phones_duplicates_and_replace() -> None:
+    """
+    Tests duplicate checks, removal and replacement in a collection large
+    enough to keep a set of its phone numbers.
+    """
+    phones = Phones()
+    numbers = [f"{number:010d}" for number in range(20)]
+    for number in numbers:
+        phones.add(Phone(number))
+
+    assert phones.add(Phone(numbers[5])) is None
+    assert phones.remove(Phone(numbers[5])) is not None
+    assert phones.add(Phone(numbers[5])) is not None
+    with pytest.raises(AlreadyPhoneNumberError):
+        phones.replace(Phone(numbers[0]), Phone(numbers[1]))
+    phones.replace(Phone(numbers[0]), Phone("9999999999"))
+
+    assert phones.add(Phone(numbers[0])) is not None
+    assert [phone.value for phone in phones][0] == "9999999999"
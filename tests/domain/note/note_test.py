@@ -84,3 +84,15 @@ def test_hash_function(topic, content, tags, expected_hash: int) -> None:
         note_instance = Note(topic_instance, content_instance)
 
     assert expected_hash == hash(note_instance)
+
+
+def test_notes_without_tags_do_not_share_tags() -> None:
+    """
+    Tests that notes created without tags get their own empty tag collections.
+    """
+    one_note = Note(Topic("topic-1"), Content("content-1"))
+    two_note = Note(Topic("topic-2"), Content("content-2"))
+
+    one_note.tags.add(Tag("tag-1"))
+
+    assert len(two_note.tags) == 0
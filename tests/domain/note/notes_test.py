@@ -6,6 +6,8 @@ in the `Phones` collection.
 from src.domain.note.content import Content
 from src.domain.note.note import Note
 from src.domain.note.notes import Notes
+from src.domain.note.tag import Tag
+from src.domain.note.tags import Tags
 from src.domain.note.topic import Topic
 
 
@@ -182,3 +184,227 @@ def test_remove_from_empty_list():
     removed_note = notes.remove(topic_instance)
 
     assert removed_note is None
+
+
+def test_find_note_case_insensitive() -> None:
+    """
+    Tests finding a note by a topic that differs from the stored one only in case.
+    """
+    notes = Notes()
+    one_note = Note(Topic("Topic-1"), Content("content-1"))
+    notes.add(one_note)
+
+    result = notes.find(Topic("TOPIC-1"))
+
+    assert result == one_note
+
+
+def test_remove_keeps_order_of_remaining_notes() -> None:
+    """
+    Tests that removing a note keeps the insertion order of the remaining notes,
+    both in the data list and when iterating over the collection.
+    """
+    notes = Notes()
+    one_note = Note(Topic("topic-1"), Content("content-1"))
+    two_note = Note(Topic("topic-2"), Content("content-2"))
+    three_note = Note(Topic("topic-3"), Content("content-3"))
+    notes.add(one_note)
+    notes.add(two_note)
+    notes.add(three_note)
+
+    notes.remove(Topic("topic-2"))
+
+    assert notes.data == [one_note, three_note]
+    assert list(notes) == [one_note, three_note]
+    assert notes.find(Topic("topic-2")) is None
+    assert notes.add(Note(Topic("topic-2"), Content("content-4"))) is not None
+
+
+def test_find_by_tags() -> None:
+    """
+    Tests finding notes by tags with OR and AND semantics, including a removed
+    note and a tag added after the note was stored.
+    """
+    notes = Notes()
+    one_note = Note(Topic("topic-1"), Content("content-1"), Tags.from_string("work,home"))
+    two_note = Note(Topic("topic-2"), Content("content-2"), Tags.from_string("work"))
+    three_note = Note(Topic("topic-3"), Content("content-3"))
+    notes.add(one_note)
+    notes.add(two_note)
+    notes.add(three_note)
+
+    three_note.tags.add(Tag("home"))
+    notes.remove(Topic("topic-2"))
+
+    assert notes.find_by_tags([Tag("work")]) == [one_note]
+    assert notes.find_by_tags([Tag("home")]) == [one_note, three_note]
+    assert notes.find_by_tags([Tag("work"), Tag("home")], match_all=True) == [one_note]
+
+
+def test_find_by_text() -> None:
+    """
+    Tests finding notes by text, ranked by relevance, and that removed notes
+    are not found.
+    """
+    notes = Notes()
+    one_note = Note(Topic("topic-1"), Content("buy milk"))
+    two_note = Note(Topic("topic-2"), Content("milk, milk and milk"))
+    three_note = Note(Topic("topic-3"), Content("milk again"))
+    notes.add(one_note)
+    notes.add(two_note)
+    notes.add(three_note)
+
+    notes.remove(Topic("topic-3"))
+
+    assert notes.find_by_text("milk") == [two_note, one_note]
+    assert notes.find_by_text("milk", limit=1) == [two_note]
+    assert list(notes.iter_by_text("buy")) == [one_note]
+
+
+def test_remove_does_not_compare_notes() -> None:
+    """
+    Tests that removing a note finds it through the index without comparing
+    it with the other notes.
+    """
+    notes = Notes()
+    for number in range(100):
+        notes.add(Note(Topic(f"topic-{number}"), Content("content")))
+    comparisons = 0
+    original_eq = Note.__eq__
+
+    def counting_eq(self, other) -> bool:
+        nonlocal comparisons
+        comparisons += 1
+        return original_eq(self, other)
+
+    Note.__eq__ = counting_eq
+    try:
+        removed = notes.remove(Topic("topic-99"))
+    finally:
+        Note.__eq__ = original_eq
+
+    assert removed.topic.value == "topic-99"
+    assert comparisons == 0
+    assert len(notes) == 99
+    assert notes[-1].topic.value == "topic-98"
+
+
+def test_slice_and_copy_keep_the_index() -> None:
+    """
+    Tests that slicing and copying notes give indexed collections.
+    """
+    notes = Notes()
+    for number in range(3):
+        notes.add(Note(Topic(f"topic-{number}"), Content("content")))
+
+    first_two = notes[0:2]
+    copied = notes.copy()
+
+    assert isinstance(first_two, Notes)
+    assert [note.topic.value for note in first_two] == ["topic-0", "topic-1"]
+    assert first_two.find(Topic("topic-1")) is notes[1]
+    assert first_two.find(Topic("topic-2")) is None
+    assert copied.find(Topic("TOPIC-2")) is notes[2]
+
+
+def build_notes(count: int) -> Notes:
+    """Builds notes with the topics "topic-0", "topic-1" and so on."""
+    notes = Notes()
+    for number in range(count):
+        notes.add(Note(Topic(f"topic-{number}"), Content(f"content {number}")))
+    return notes
+
+
+def topics(notes: Notes) -> list[str]:
+    """Returns the topics of the notes in their order."""
+    return [note.topic.value for note in notes]
+
+
+def test_append_and_extend_index_the_notes() -> None:
+    """
+    Tests that appended and extended notes can be found, and that a note
+    whose topic is taken is skipped.
+    """
+    notes = build_notes(1)
+    appended = Note(Topic("appended"), Content("milk"))
+    extended = Note(Topic("extended"), Content("bread"))
+
+    notes.append(appended)
+    notes.extend([extended, Note(Topic("TOPIC-0"), Content("other"))])
+    notes += [Note(Topic("added"), Content("eggs"))]
+
+    assert topics(notes) == ["topic-0", "appended", "extended", "added"]
+    assert notes.find(Topic("appended")) is appended
+    assert notes.find_by_text("bread") == [extended]
+    notes.remove(Topic("topic-0"))
+    assert topics(notes) == ["appended", "extended", "added"]
+
+
+def test_insert_and_setitem_index_the_notes() -> None:
+    """
+    Tests that inserted and replacing notes can be found in their positions,
+    and that a replaced note cannot.
+    """
+    notes = build_notes(3)
+    inserted = Note(Topic("inserted"), Content("milk"))
+    replacing = Note(Topic("replacing"), Content("bread"))
+
+    notes.insert(1, inserted)
+    notes[2] = replacing
+
+    assert topics(notes) == ["topic-0", "inserted", "replacing", "topic-2"]
+    assert notes.find(Topic("inserted")) is inserted
+    assert notes.find(Topic("topic-1")) is None
+    assert notes.find_by_text("bread") == [replacing]
+    assert len(notes.find_by_text("content")) == 2
+
+
+def test_delitem_and_pop_remove_the_notes() -> None:
+    """
+    Tests that deleted and popped notes can no longer be found.
+    """
+    notes = build_notes(5)
+
+    del notes[0]
+    del notes[1:3]
+    popped = notes.pop()
+
+    assert popped.topic.value == "topic-4"
+    assert topics(notes) == ["topic-1"]
+    for number in (0, 2, 3, 4):
+        assert notes.find(Topic(f"topic-{number}")) is None
+    assert notes.find_by_text("content") == [notes[0]]
+
+
+def test_clear_removes_all_notes() -> None:
+    """
+    Tests that clearing the notes empties the indexes too.
+    """
+    notes = build_notes(3)
+    notes.add(Note(Topic("tagged"), Content("content"), Tags.from_string("work")))
+
+    notes.clear()
+
+    assert len(notes) == 0
+    assert notes.find(Topic("topic-0")) is None
+    assert notes.find_by_tags([Tag("work")]) == []
+    assert notes.find_by_text("content") == []
+
+
+def test_sort_and_reverse_keep_the_index() -> None:
+    """
+    Tests that reordering the notes keeps them findable and the new order
+    survives a removal.
+    """
+    notes = build_notes(3)
+
+    notes.reverse()
+    assert topics(notes) == ["topic-2", "topic-1", "topic-0"]
+    notes.sort(key=lambda note: note.topic.value)
+    assert topics(notes) == ["topic-0", "topic-1", "topic-2"]
+    notes.reverse()
+    notes.remove(Topic("topic-1"))
+
+    assert topics(notes) == ["topic-2", "topic-0"]
+    assert notes.find(Topic("topic-2")) is notes[0]
+    assert len(notes.find_by_text("content")) == 2
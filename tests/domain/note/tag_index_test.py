@@ -0,0 +1,91 @@
+"""
+Unit tests for the TagIndex class.
+"""
+
+from src.domain.note.content import Content
+from src.domain.note.note import Note
+from src.domain.note.tag import Tag
+from src.domain.note.tag_index import TagIndex
+from src.domain.note.tags import Tags
+from src.domain.note.topic import Topic
+
+
+def create_note(topic: str, tags: str) -> Note:
+    """Creates a note with the given topic and comma-separated tags."""
+    return Note(Topic(topic), Content("content"), Tags.from_string(tags))
+
+
+def test_find_any_and_find_all() -> None:
+    """
+    Tests OR and AND queries over the tags of attached notes.
+    """
+    index = TagIndex()
+    one_note = create_note("topic-1", "work,home")
+    two_note = create_note("topic-2", "work")
+    three_note = create_note("topic-3", "travel")
+    for note in (one_note, two_note, three_note):
+        index.attach(note)
+
+    assert index.find_any([Tag("home"), Tag("travel")]) == [one_note, three_note]
+    assert index.find_all([Tag("work"), Tag("home")]) == [one_note]
+    assert index.find_all([Tag("work"), Tag("unknown")]) == []
+    assert index.find_all([]) == []
+
+
+def test_find_is_case_insensitive() -> None:
+    """
+    Tests that tags are matched regardless of their case.
+    """
+    index = TagIndex()
+    note = create_note("topic-1", "Work")
+    index.attach(note)
+
+    assert index.find_any([Tag("WORK")]) == [note]
+
+
+def test_index_follows_tag_changes() -> None:
+    """
+    Tests that adding, replacing and removing tags of an attached note is
+    reflected in the index.
+    """
+    index = TagIndex()
+    note = create_note("topic-1", "work")
+    index.attach(note)
+
+    note.tags.add(Tag("home"))
+    note.tags.replace(Tag("work"), Tag("travel"))
+
+    assert index.find_any([Tag("work")]) == []
+    assert index.find_all([Tag("home"), Tag("travel")]) == [note]
+
+    note.tags.remove(Tag("home"))
+
+    assert index.find_any([Tag("home")]) == []
+
+
+def test_detach_removes_note() -> None:
+    """
+    Tests that a detached note is no longer found and its later tag changes
+    are ignored.
+    """
+    index = TagIndex()
+    note = create_note("topic-1", "work")
+    index.attach(note)
+
+    index.detach(note)
+    note.tags.add(Tag("home"))
+
+    assert index.find_any([Tag("work"), Tag("home")]) == []
+
+
+def test_iter_any_yields_each_note_once() -> None:
+    """
+    Tests that a note carrying several of the searched tags is yielded once,
+    in the order of the first tag it was found by.
+    """
+    index = TagIndex()
+    first, second, third = create_note("One", "work,home"), create_note("Two", "home"), create_note("Three", "work")
+    for note in (first, second, third):
+        index.attach(note)
+
+    assert list(index.iter_any([Tag("work"), Tag("home"), Tag("WORK")])) == [first, third, second]
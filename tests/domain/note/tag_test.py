@@ -93,3 +93,14 @@ def test_hash_function(tag, expected_hash: int) -> None:
     """
     tag_instance = Tag(tag)
     assert expected_hash == hash(tag_instance)
+
+
+def test_equal_tags_share_value() -> None:
+    """
+    Tests that equal tag values are interned, so the tags share one string.
+    """
+    one_tag = Tag("work")
+    two_tag = Tag("".join(["wo", "rk"]))
+
+    assert one_tag.value is two_tag.value
+    assert not hasattr(one_tag, "__dict__")
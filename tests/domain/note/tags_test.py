@@ -186,3 +186,13 @@ def test_contains_empty_tag_list():
     template = TagSearchTemplate("tag-1")
 
     assert tags.contains(template) is False
+
+
+def test_from_string() -> None:
+    """
+    Tests creating tags from a comma-separated string, skipping empty items
+    and duplicates.
+    """
+    tags = Tags.from_string("tag-1, tag-2,,TAG-1")
+
+    assert [tag.value for tag in tags] == ["tag-1", "tag-2"]
@@ -0,0 +1,86 @@
+"""
+Unit tests for the TextIndex class.
+"""
+
+from itertools import islice
+
+from src.domain.note.content import Content
+from src.domain.note.note import Note
+from src.domain.note.text_index import TextIndex
+from src.domain.note.topic import Topic
+
+
+def create_index(*notes: Note) -> TextIndex:
+    """Creates a text index with the given notes."""
+    index = TextIndex()
+    for note in notes:
+        index.add(note)
+    return index
+
+
+def test_tokenize() -> None:
+    """
+    Tests that text is split into casefolded word tokens.
+    """
+    assert TextIndex.tokenize("Hello, WORLD! it's 2025") == ["hello", "world", "it", "s", "2025"]
+
+
+def test_search_ranks_best_matches_first() -> None:
+    """
+    Tests that notes matching more query terms, and rarer terms, rank higher.
+    """
+    one_note = Note(Topic("shopping"), Content("buy milk and bread"))
+    two_note = Note(Topic("milk"), Content("buy milk, milk and more milk"))
+    three_note = Note(Topic("work"), Content("finish the report"))
+    index = create_index(one_note, two_note, three_note)
+
+    assert index.search("milk") == [two_note, one_note]
+    assert index.search("bread milk") == [one_note, two_note]
+    assert index.search("holiday") == []
+
+
+def test_search_matches_topic_and_is_case_insensitive() -> None:
+    """
+    Tests that the topic is searched as well as the content, regardless of case.
+    """
+    note = Note(Topic("Groceries"), Content("eggs"))
+    index = create_index(note)
+
+    assert index.search("GROCERIES") == [note]
+
+
+def test_search_with_limit() -> None:
+    """
+    Tests that the limit keeps only the best matches, ties in insertion order.
+    """
+    notes = [Note(Topic(f"topic-{i}"), Content("same content")) for i in range(5)]
+    index = create_index(*notes)
+
+    assert index.search("content", limit=2) == notes[:2]
+
+
+def test_iter_search_streams_ranked_results() -> None:
+    """
+    Tests that iter_search yields the same order as search and can be stopped early.
+    """
+    one_note = Note(Topic("a"), Content("milk"))
+    two_note = Note(Topic("b"), Content("milk milk"))
+    three_note = Note(Topic("c"), Content("milk milk milk"))
+    index = create_index(one_note, two_note, three_note)
+
+    assert list(islice(index.iter_search("milk"), 2)) == index.search("milk")[:2]
+    assert list(index.iter_search("milk")) == index.search("milk")
+
+
+def test_remove() -> None:
+    """
+    Tests that a removed note is no longer found.
+    """
+    one_note = Note(Topic("a"), Content("milk"))
+    two_note = Note(Topic("b"), Content("milk bread"))
+    index = create_index(one_note, two_note)
+
+    index.remove(one_note)
+
+    assert index.search("milk") == [two_note]
+    assert index.search("a") == []
@@ -0,0 +1,74 @@
+"""
+Unit tests for the CachedTable class.
+"""
+import io
+from contextlib import redirect_stdout
+
+from src.output.cached_table import CachedTable
+from src.output.column import Column
+from src.output.output import select_renderer
+from src.output.table import Table
+
+
+class CountingBuilder:
+    """Builds a one-row table and counts how many times it was built."""
+
+    def __init__(self):
+        self.builds = 0
+        self.value = "one"
+
+    def __call__(self) -> Table:
+        self.builds += 1
+        table = Table(Column("Value"))
+        table.add_row(self.value)
+        return table
+
+
+def show(cached: CachedTable) -> str:
+    """Returns what the cached table prints."""
+    with redirect_stdout(io.StringIO()) as buffer:
+        cached.show()
+    return buffer.getvalue()
+
+
+def test_table_is_built_once() -> None:
+    """
+    Tests that showing the table again reuses the cached text.
+    """
+    builder = CountingBuilder()
+    cached = CachedTable(builder)
+
+    assert show(cached) == show(cached) == "Value\n-----\none\n"
+    assert builder.builds == 1
+
+
+def test_text_is_cached_per_renderer() -> None:
+    """
+    Tests that another renderer formats the same table again without
+    rebuilding it.
+    """
+    builder = CountingBuilder()
+    cached = CachedTable(builder)
+    show(cached)
+    select_renderer("tsv")
+    try:
+        assert show(cached) == "Value\none\n"
+    finally:
+        select_renderer(None)
+
+    assert builder.builds == 1
+
+
+def test_invalidate_rebuilds_the_table() -> None:
+    """
+    Tests that the table is built again after it has been invalidated.
+    """
+    builder = CountingBuilder()
+    cached = CachedTable(builder)
+    show(cached)
+
+    builder.value = "two"
+    cached.invalidate()
+
+    assert show(cached).endswith("two\n")
+    assert builder.builds == 2
@@ -0,0 +1,51 @@
+"""
+Unit tests for the show_paged function.
+"""
+import io
+import itertools
+from contextlib import redirect_stdout
+
+import pytest
+
+from src.output import pager
+from src.output.column import Column
+from src.output.output import select_renderer
+from src.output.table import Table
+
+
+def new_table(show_header: bool) -> Table:
+    """Creates a table with one column."""
+    return Table(Column("Number"), show_header=show_header)
+
+
+def test_rows_are_written_in_chunks_with_one_header(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that redirected output gets every row, in chunks, and the header only once.
+    """
+    monkeypatch.setattr(pager, "CHUNK_SIZE", 2)
+    rows = ((str(number),) for number in range(5))
+
+    with redirect_stdout(io.StringIO()) as buffer:
+        shown = pager.show_paged(rows, new_table)
+
+    assert shown == 5
+    assert buffer.getvalue().splitlines() == ["Number", "------", "0", "1", "2", "3", "4"]
+
+
+def test_interactive_pager_stops_on_q(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that on a terminal the pager waits after each page and stops when
+    the user answers "q", without taking more rows from an endless iterator.
+    """
+    answers = iter(["", "q"])
+    monkeypatch.setattr(pager, "_is_terminal", lambda _: True)
+    monkeypatch.setattr("builtins.input", lambda _: next(answers))
+    monkeypatch.setattr(pager.shutil, "get_terminal_size", lambda: pager.shutil.os.terminal_size((80, 10)))
+    select_renderer("rich")
+    try:
+        with redirect_stdout(io.StringIO()):
+            shown = pager.show_paged(((str(number),) for number in itertools.count()), new_table)
+    finally:
+        select_renderer(None)
+
+    assert shown == 10
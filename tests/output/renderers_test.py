@@ -0,0 +1,126 @@
+"""
+Unit tests for the output renderers and their selection.
+"""
+import io
+import json
+from contextlib import redirect_stdout
+
+import pytest
+
+from src.output.column import Column
+from src.output.json_lines_renderer import JsonLinesRenderer
+from src.output.output import renderer, select_renderer
+from src.output.plain_renderer import PlainRenderer
+from src.output.rich_renderer import RichRenderer
+from src.output.table import Table
+from src.output.tsv_renderer import TsvRenderer
+from src.util.markup import escape_markup
+
+
+def build_table(**options) -> Table:
+    """Builds a table with a left-aligned and a right-aligned column."""
+    table = Table(Column("Name"), Column("Count", justify="right"), **options)
+    table.add_row("alpha", "1")
+    table.add_row("b\tc", "100")
+    return table
+
+
+def render(table: Table, output) -> str:
+    """Returns what the renderer prints for the table."""
+    with redirect_stdout(io.StringIO()) as buffer:
+        output.table(table)
+    return buffer.getvalue()
+
+
+def test_plain_renderer_aligns_columns() -> None:
+    """
+    Tests that the plain renderer pads the columns to their widest cell and
+    aligns right-justified columns to the right.
+    """
+    assert render(build_table(), PlainRenderer()).splitlines() == [
+        "Name   Count",
+        "-----  -----",
+        "alpha      1",
+        "b\tc      100",
+    ]
+
+
+def test_plain_renderer_without_header() -> None:
+    """
+    Tests that a table without a header shows only its rows.
+    """
+    assert render(build_table(show_header=False), PlainRenderer()).splitlines() == ["alpha    1", "b\tc    100"]
+
+
+def test_tsv_renderer_escapes_tabs() -> None:
+    """
+    Tests that the TSV renderer separates the cells by tabs and escapes the
+    tabs inside the cells.
+    """
+    assert render(build_table(), TsvRenderer()).splitlines() == ["Name\tCount", "alpha\t1", "b\\tc\t100"]
+
+
+def test_json_lines_renderer_writes_one_object_per_row() -> None:
+    """
+    Tests that every row becomes a JSON object keyed by the casefolded headers,
+    and that messages lose their markup.
+    """
+    output = JsonLinesRenderer()
+    lines = render(build_table(), output).splitlines()
+    with redirect_stdout(io.StringIO()) as buffer:
+        output.print("[blue]Good bye![/blue]")
+
+    assert [json.loads(line) for line in lines] == [{"name": "alpha", "count": "1"}, {"name": "b\tc", "count": "100"}]
+    assert json.loads(buffer.getvalue()) == {"message": "Good bye!"}
+
+
+def test_renderer_is_plain_when_output_is_not_a_terminal() -> None:
+    """
+    Tests that the plain renderer is chosen for redirected output unless a
+    renderer has been selected explicitly.
+    """
+    try:
+        with redirect_stdout(io.StringIO()):
+            assert isinstance(renderer(), PlainRenderer)
+            select_renderer("rich")
+            assert isinstance(renderer(), RichRenderer)
+    finally:
+        select_renderer(None)
+
+
+def test_select_unknown_renderer() -> None:
+    """
+    Tests that selecting an unknown renderer fails.
+    """
+    with pytest.raises(ValueError):
+        select_renderer("html")
+
+
+def test_rich_renderer_formats_table_as_it_prints_it() -> None:
+    """
+    Tests that the rich renderer returns the table as text and is not cached,
+    since its layout depends on the terminal.
+    """
+    output = RichRenderer()
+
+    text = output.format_table(build_table())
+
+    assert "alpha" in text and "100" in text
+    assert not output.cacheable
+
+
+def test_rich_renderer_prints_brackets_of_user_data_literally() -> None:
+    """
+    Tests that a cell and an escaped message containing a closing tag are
+    printed as they are instead of failing as markup.
+    """
+    table = Table(Column("Topic"))
+    table.add_row("[/x] note")
+    output = RichRenderer()
+
+    text = output.format_table(table)
+    with redirect_stdout(io.StringIO()) as buffer:
+        output.print(f"[red]Note[/red] '{escape_markup('[/x]')}'")
+
+    assert "[/x] note" in text
+    assert buffer.getvalue() == "Note '[/x]'\n"
@@ -0,0 +1,65 @@
+"""
+Unit tests for the `tokenize` function, including its equivalence with the
+`LexemesBuilder` class.
+"""
+import pytest
+
+from src.parser.lexemes_builder import LexemesBuilder
+from src.parser.tokenizer import tokenize
+
+
+def build_lexemes(input_line: str) -> list[str]:
+    """
+    Splits the input line into lexemes with the character-by-character builder.
+    """
+    builder = LexemesBuilder()
+    for char in input_line:
+        builder.append_char(char)
+    return builder.build()
+
+
+@pytest.mark.parametrize("input_line, expected_lexemes", [
+    ("", []),
+    ("   ", []),
+    ("exit", ["exit"]),
+    ("  add-note  topic  ", ["add-note", "topic"]),
+    ("add-note topic 'Hello, world!'", ["add-note", "topic", "Hello, world!"]),
+    ("add-note topic \"it's fine\"", ["add-note", "topic", "it's fine"]),
+    ("add-note topic 'say \"hi\"'", ["add-note", "topic", "say \"hi\""]),
+    ("pre'quoted part'post", ["prequoted partpost"]),
+    ("a '' b", ["a", "b"]),
+    ("a ' ' b", ["a", " ", "b"]),
+    ("tab\tseparated", ["tab\tseparated"]),
+])
+def test_tokenize(input_line: str, expected_lexemes: list[str]) -> None:
+    """
+    Tests that the input line is split into the expected lexemes, the same
+    way as the builder does.
+    """
+    assert tokenize(input_line) == expected_lexemes
+    assert build_lexemes(input_line) == expected_lexemes
+
+
+@pytest.mark.parametrize("input_line", [
+    "add-note topic 'Hello, world!",
+    "add-note topic \"Hello, world! ",
+    "add-note topic 'one' 'two",
+    "'",
+])
+def test_tokenize_unclosed_quotation_mark(input_line: str) -> None:
+    """
+    Tests that an unclosed quotation mark raises the same error as the builder.
+    """
+    with pytest.raises(ValueError, match="missing closing quotation marks"):
+        tokenize(input_line)
+    with pytest.raises(ValueError, match="missing closing quotation marks"):
+        build_lexemes(input_line)
+
+
+def test_tokenize_long_quoted_text() -> None:
+    """
+    Tests that a long quoted note content is kept as one lexeme.
+    """
+    content = "lorem ipsum " * 100
+
+    assert tokenize(f"add-note topic '{content}'") == ["add-note", "topic", content]
@@ -0,0 +1,118 @@
+"""
+Unit tests for the batch mode of the PersonalAssistant class.
+"""
+import io
+import json
+from pathlib import Path
+
+from src.output.output import select_renderer
+from src.personal_assistant import PersonalAssistant
+from src.storage.storage import Storage
+
+
+def test_run_batch_executes_commands() -> None:
+    """
+    Tests that the commands of a script are executed and their output is written.
+    """
+    script = io.StringIO("# comment\nadd-contact John\n\nadd-phone John 1234567890\n")
+    output, errors = io.StringIO(), io.StringIO()
+
+    failed = PersonalAssistant().run_batch(script, output, errors)
+
+    assert failed == 0
+    assert "Added a contact." in output.getvalue()
+    assert "Added a phone number." in output.getvalue()
+    assert errors.getvalue() == ""
+
+
+def test_run_batch_reports_errors_with_line_numbers() -> None:
+    """
+    Tests that failing lines are reported with their numbers and do not stop
+    the script.
+    """
+    script = io.StringIO("unknown\nadd-phone Jane 1234567890\nadd-phone\nadd-contact John\n")
+    output, errors = io.StringIO(), io.StringIO()
+
+    failed = PersonalAssistant().run_batch(script, output, errors)
+
+    assert failed == 3
+    lines = errors.getvalue().splitlines()
+    assert lines[0] == "line 1: Invalid command: 'unknown'."
+    assert lines[1].startswith("line 2: ")
+    assert lines[2] == "line 3: Invalid command arguments."
+    assert "Added a contact." in output.getvalue()
+
+
+def test_run_batch_stops_at_exit() -> None:
+    """
+    Tests that the exit command stops the script.
+    """
+    script = io.StringIO("add-contact John\nexit\nadd-contact Jane\n")
+    output = io.StringIO()
+
+    PersonalAssistant().run_batch(script, output, io.StringIO())
+
+    assert output.getvalue().count("Added a contact.") == 1
+
+
+def test_run_batch_persists_state(tmp_path: Path) -> None:
+    """
+    Tests that the changes made by a script are stored and loaded by the next run.
+    """
+    script = io.StringIO("add-contact John\nadd-phone John 1234567890\n")
+    PersonalAssistant(Storage(tmp_path, compact_every=1)).run_batch(script, io.StringIO(), io.StringIO())
+
+    output = io.StringIO()
+    failed = PersonalAssistant(Storage(tmp_path)).run_batch(
+        io.StringIO("add-contact John\n"), output, io.StringIO()
+    )
+
+    assert failed == 1
+
+
+def test_commands_are_recorded_in_statistics() -> None:
+    """
+    Tests that every executed command is counted in the statistics, together
+    with its failures.
+    """
+    assistant = PersonalAssistant()
+    script = io.StringIO("add-contact John\nadd-contact John\nhelp\n")
+
+    assistant.run_batch(script, io.StringIO(), io.StringIO())
+
+    rows = {row["command"]: row for row in assistant.statistics.summary()}
+    assert rows["add-contact"]["count"] == 2
+    assert rows["add-contact"]["errors"] == 1
+    assert rows["help"]["errors"] == 0
+
+
+def test_exit_is_not_recorded_as_error() -> None:
+    """
+    Tests that the exit command, which stops the assistant, is counted in the
+    statistics as executed.
+    """
+    assistant = PersonalAssistant()
+
+    assistant.run_batch(io.StringIO("exit\n"), io.StringIO(), io.StringIO())
+
+    rows = {row["command"]: row for row in assistant.statistics.summary()}
+    assert rows["exit"]["count"] == 1
+    assert rows["exit"]["errors"] == 0
+
+
+def test_json_output_of_batch_is_json_lines() -> None:
+    """
+    Tests that with the JSON lines renderer every line of the output,
+    messages included, is a JSON object.
+    """
+    script = io.StringIO('add-contact John\nadd-note "[/x]" text\nnote-by-text x\nhelp\nstats\n')
+    output = io.StringIO()
+    select_renderer("json")
+    try:
+        PersonalAssistant().run_batch(script, output, io.StringIO())
+    finally:
+        select_renderer(None)
+
+    lines = output.getvalue().splitlines()
+    assert {"message": "Added a note."} in [json.loads(line) for line in lines]
+    assert {"topic": "[/x]", "content": "text", "tags": ""} in [json.loads(line) for line in lines]
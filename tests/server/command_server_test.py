@@ -0,0 +1,86 @@
+"""
+Unit tests for the CommandServer class.
+"""
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+
+from src.personal_assistant import PersonalAssistant
+from src.server.command_server import CommandServer
+
+
+async def exchange(path: Path, lines: list[str]) -> list[dict]:
+    """
+    Sends all the lines at once and reads one response per line.
+    """
+    reader, writer = await asyncio.open_unix_connection(str(path))
+    writer.write("".join(f"{line}\n" for line in lines).encode("utf-8"))
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in lines]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+def run_with_server(scenario) -> None:
+    """
+    Runs the scenario against a server on a temporary socket.
+    """
+    async def main() -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            server = CommandServer(PersonalAssistant(), Path(directory) / "pa.sock")
+            await server.start()
+            try:
+                await scenario(server.path)
+            finally:
+                await server.stop()
+            assert not server.path.exists()
+
+    asyncio.run(main())
+
+
+def test_pipelined_commands_are_answered_in_order() -> None:
+    """
+    Tests that pipelined command lines get one JSON response each, in order.
+    """
+    async def scenario(path: Path) -> None:
+        responses = await exchange(path, ["add-contact John", "add-phone John 1234567890", "unknown"])
+
+        assert [response["id"] for response in responses] == [1, 2, 3]
+        assert responses[0] == {"id": 1, "ok": True, "output": "Added a contact.\n", "error": None}
+        assert responses[1]["ok"]
+        assert responses[2] == {"id": 3, "ok": False, "output": "", "error": "Invalid command: 'unknown'."}
+
+    run_with_server(scenario)
+
+
+def test_clients_share_state() -> None:
+    """
+    Tests that concurrent clients work on the same contact book.
+    """
+    async def scenario(path: Path) -> None:
+        await exchange(path, ["add-contact John"])
+        responses = await asyncio.gather(*(exchange(path, ["add-contact John"]) for _ in range(5)))
+
+        assert all(not response[0]["ok"] for response in responses)
+
+    run_with_server(scenario)
+
+
+def test_exit_closes_connection() -> None:
+    """
+    Tests that the exit command is answered and closes the connection.
+    """
+    async def scenario(path: Path) -> None:
+        reader, writer = await asyncio.open_unix_connection(str(path))
+        writer.write(b"exit\nadd-contact John\n")
+        await writer.drain()
+
+        response = json.loads(await reader.readline())
+        assert response["ok"]
+        assert await reader.readline() == b""
+        writer.close()
+        await writer.wait_closed()
+
+    run_with_server(scenario)
@@ -0,0 +1,22 @@
+"""
+Unit tests for the Journal class.
+"""
+from pathlib import Path
+
+from src.command.command import Command
+from src.storage.journal import Journal
+
+
+def test_journal_closes_its_file_on_exit(tmp_path: Path) -> None:
+    """
+    Tests that leaving the `with` block closes the journal file, and that
+    the records written in it can be read back.
+    """
+    path = tmp_path / "journal.jsonl"
+    with Journal(path) as journal:
+        journal.append(1, Command("add-contact", ["John"]))
+        handle = journal._Journal__file  # pylint: disable=protected-access
+
+    assert handle.closed
+    assert [(sequence, command.name, command.args) for sequence, command in Journal(path).records()] == \
+        [(1, "add-contact", ["John"])]
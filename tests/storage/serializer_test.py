@@ -0,0 +1,44 @@
+"""
+Unit tests for converting the contact book and the notes to and from dictionaries.
+"""
+
+from src.domain.contact.birthday import Birthday
+from src.domain.contact.contact import Contact
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.email import Email
+from src.domain.contact.name import Name
+from src.domain.contact.phone import Phone
+from src.domain.note.content import Content
+from src.domain.note.note import Note
+from src.domain.note.notes import Notes
+from src.domain.note.tag import Tag
+from src.domain.note.tags import Tags
+from src.domain.note.topic import Topic
+from src.storage.serializer import deserialize, serialize
+
+
+def test_serialize_and_deserialize_round_trip() -> None:
+    """
+    Tests that the restored contact book and notes contain the same data and
+    that their search indexes are rebuilt.
+    """
+    contact_book = ContactBook()
+    contact = Contact(Name("John"))
+    contact.phones.add(Phone("1234567890"))
+    contact.emails.add(Email("a@b.co"))
+    contact.add_birthday(Birthday("01.02.1990"))
+    contact_book.add(contact)
+    contact_book.add(Contact(Name("Alice")))
+    notes = Notes()
+    tags = Tags()
+    tags.add(Tag("work"))
+    notes.add(Note(Topic("topic-1"), Content("content-1"), tags))
+
+    data = serialize(contact_book, notes)
+    restored_book, restored_notes = deserialize(data)
+
+    assert serialize(restored_book, restored_notes) == data
+    restored_contact = restored_book.find(Name("John"))
+    assert restored_contact.phones.data == [Phone("1234567890")]
+    assert restored_contact.birthday == Birthday("01.02.1990")
+    assert restored_notes.find_by_tags([Tag("work")])[0].topic == Topic("topic-1")
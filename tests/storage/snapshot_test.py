@@ -0,0 +1,87 @@
+"""
+Unit tests for writing and reading snapshots with a backup.
+"""
+from pathlib import Path
+
+import pytest
+
+from src.error.corrupted_snapshot_error import CorruptedSnapshotError
+from src.storage.snapshot import backup_path, read_snapshot, write_snapshot
+
+
+def test_read_missing_snapshot(tmp_path: Path) -> None:
+    """
+    Tests that None is returned when there is neither a snapshot nor a backup.
+    """
+    assert read_snapshot(tmp_path / "snapshot.json") is None
+
+
+def test_write_and_read_snapshot(tmp_path: Path) -> None:
+    """
+    Tests that a written snapshot is read back and no temporary file is left.
+    """
+    path = tmp_path / "snapshot.json"
+
+    write_snapshot(path, {"sequence": 1, "name": "Jöhn"})
+
+    assert read_snapshot(path) == {"sequence": 1, "name": "Jöhn"}
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["snapshot.json"]
+
+
+def test_previous_snapshot_is_kept_as_backup(tmp_path: Path) -> None:
+    """
+    Tests that writing a snapshot moves the previous one to the backup.
+    """
+    path = tmp_path / "snapshot.json"
+
+    write_snapshot(path, {"sequence": 1})
+    write_snapshot(path, {"sequence": 2})
+
+    assert read_snapshot(path) == {"sequence": 2}
+    assert read_snapshot(backup_path(path)) == {"sequence": 1}
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda content: content[:-3],
+    lambda content: content[:-3] + b"xyz",
+    lambda content: b"garbage\n" + content,
+    lambda content: b"",
+])
+def test_corrupted_snapshot_falls_back_to_backup(tmp_path: Path, corrupt) -> None:
+    """
+    Tests that a truncated, modified or malformed snapshot is detected and the
+    backup is read instead.
+    """
+    path = tmp_path / "snapshot.json"
+    write_snapshot(path, {"sequence": 1})
+    write_snapshot(path, {"sequence": 2})
+
+    path.write_bytes(corrupt(path.read_bytes()))
+
+    assert read_snapshot(path) == {"sequence": 1}
+
+
+def test_missing_snapshot_falls_back_to_backup(tmp_path: Path) -> None:
+    """
+    Tests that the backup is read when the snapshot itself is missing, as after
+    a crash between the two renames.
+    """
+    path = tmp_path / "snapshot.json"
+    write_snapshot(path, {"sequence": 1})
+    write_snapshot(path, {"sequence": 2})
+
+    path.unlink()
+
+    assert read_snapshot(path) == {"sequence": 1}
+
+
+def test_corrupted_snapshot_and_backup(tmp_path: Path) -> None:
+    """
+    Tests that an error is raised when neither the snapshot nor the backup can be read.
+    """
+    path = tmp_path / "snapshot.json"
+    write_snapshot(path, {"sequence": 1})
+    path.write_bytes(b"garbage")
+
+    with pytest.raises(CorruptedSnapshotError):
+        read_snapshot(path)
@@ -0,0 +1,170 @@
+"""
+Unit tests for the Storage class.
+"""
+from pathlib import Path
+
+from src.command.command import Command
+from src.domain.contact.contact import Contact
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.domain.note.notes import Notes
+from src.storage.snapshot import backup_path, read_snapshot
+from src.storage.storage import Storage
+
+
+def test_load_without_data(tmp_path: Path) -> None:
+    """
+    Tests that an empty contact book and notes are loaded when nothing is stored.
+    """
+    storage = Storage(tmp_path)
+
+    contact_book, notes = storage.load()
+
+    assert len(contact_book) == 0
+    assert len(notes) == 0
+    assert list(storage.replay()) == []
+
+
+def test_recorded_commands_are_replayed(tmp_path: Path) -> None:
+    """
+    Tests that the recorded commands are replayed in order by a new storage.
+    """
+    storage = Storage(tmp_path)
+    storage.load()
+    storage.record(Command("add-contact", ["John"]))
+    storage.record(Command("add-phone", ["John", "1234567890"]))
+
+    replayed = list(Storage(tmp_path).replay())
+
+    assert [(command.name, command.args) for command in replayed] == [
+        ("add-contact", ["John"]),
+        ("add-phone", ["John", "1234567890"]),
+    ]
+
+
+def test_compaction_writes_snapshot_and_empties_journal(tmp_path: Path) -> None:
+    """
+    Tests that compaction stores the state in a snapshot, so only the commands
+    recorded afterwards are replayed.
+    """
+    storage = Storage(tmp_path, compact_every=2)
+    contact_book, notes = storage.load()
+    contact_book.add(Contact(Name("John")))
+    storage.record(Command("add-contact", ["John"]))
+    assert storage.needs_compaction is False
+    storage.record(Command("add-contact", ["Alice"]))
+    assert storage.needs_compaction is True
+
+    storage.compact(contact_book, notes)
+    storage.record(Command("add-contact", ["Dan"]))
+
+    restored = Storage(tmp_path)
+    restored_book, _ = restored.load()
+    assert restored_book.find(Name("John")) is not None
+    assert [command.args for command in restored.replay()] == [["Dan"]]
+
+
+def test_records_covered_by_snapshot_are_skipped(tmp_path: Path) -> None:
+    """
+    Tests that journal records already contained in the snapshot are not
+    replayed, even if the journal was not emptied.
+    """
+    storage = Storage(tmp_path)
+    contact_book, notes = ContactBook(), Notes()
+    storage.record(Command("add-contact", ["John"]))
+    journal = (tmp_path / Storage.journal_file).read_text(encoding="utf-8")
+    storage.compact(contact_book, notes)
+    (tmp_path / Storage.journal_file).write_text(journal, encoding="utf-8")
+
+    restored = Storage(tmp_path)
+    restored.load()
+
+    assert list(restored.replay()) == []
+
+
+def test_torn_journal_record_is_skipped(tmp_path: Path) -> None:
+    """
+    Tests that a partially written record at the end of the journal is ignored.
+    """
+    storage = Storage(tmp_path)
+    storage.record(Command("add-contact", ["John"]))
+    with open(tmp_path / Storage.journal_file, "a", encoding="utf-8") as file:
+        file.write('[2,"add-con')
+
+    replayed = list(Storage(tmp_path).replay())
+
+    assert [command.args for command in replayed] == [["John"]]
+
+
+def test_no_data_is_lost_when_snapshot_is_corrupted_after_two_compactions(tmp_path: Path) -> None:
+    """
+    Tests that when the snapshot is corrupted, loading falls back to the
+    backup and replays the journal records written since the backup, so the
+    changes of the latest compaction are restored.
+    """
+    storage = Storage(tmp_path)
+    contact_book, notes = storage.load()
+    for name in ("John", "Alice"):
+        contact_book.add(Contact(Name(name)))
+        storage.record(Command("add-contact", [name]))
+        storage.compact(contact_book, notes)
+    storage.record(Command("add-contact", ["Dan"]))
+
+    snapshot = tmp_path / Storage.snapshot_file
+    snapshot.write_bytes(snapshot.read_bytes()[:-5])
+
+    restored = Storage(tmp_path)
+    restored_book, _ = restored.load()
+    replayed = [command.args for command in restored.replay()]
+    assert restored_book.find(Name("John")) is not None
+    assert restored_book.find(Name("Alice")) is None
+    assert replayed == [["Alice"], ["Dan"]]
+
+
+def test_checkpoint_replaces_the_backup(tmp_path: Path) -> None:
+    """
+    Tests that a checkpoint after an unjournaled change survives a corrupted
+    snapshot, because the backup holds the same state.
+    """
+    storage = Storage(tmp_path)
+    contact_book, notes = storage.load()
+    storage.compact(contact_book, notes)
+    contact_book.add(Contact(Name("Imported")))
+    storage.checkpoint(contact_book, notes)
+
+    (tmp_path / Storage.snapshot_file).write_bytes(b"garbage")
+
+    restored_book, _ = Storage(tmp_path).load()
+    assert restored_book.find(Name("Imported")) is not None
+
+
+def run_once(directory: Path, name: str) -> None:
+    """Runs the storage like one session of the assistant that adds a contact."""
+    storage = Storage(directory)
+    contact_book, notes = storage.load()
+    for command in storage.replay():
+        contact_book.add(Contact(Name(command.args[0])))
+    contact_book.add(Contact(Name(name)))
+    storage.record(Command("add-contact", [name]))
+    storage.close(contact_book, notes)
+
+
+def test_backup_survives_a_run_after_the_snapshot_was_corrupted(tmp_path: Path) -> None:
+    """
+    Tests that a run that loaded the backup does not replace it with the
+    corrupted snapshot, so the snapshot may be corrupted again without losing
+    data.
+    """
+    run_once(tmp_path, "John")
+    run_once(tmp_path, "Alice")
+    snapshot = tmp_path / Storage.snapshot_file
+    snapshot.write_bytes(b"garbage")
+    run_once(tmp_path, "Dan")
+
+    assert read_snapshot(backup_path(snapshot)) is not None
+    snapshot.write_bytes(b"garbage")
+    storage = Storage(tmp_path)
+    restored_book, _ = storage.load()
+    names = [command.args[0] for command in storage.replay()]
+    names.extend(contact.name.value for contact in restored_book.values())
+    assert sorted(names) == ["Alice", "Dan", "John"]
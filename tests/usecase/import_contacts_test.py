@@ -0,0 +1,150 @@
+"""
+Unit tests for the bulk import of contacts.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from src.domain.contact.contact_book import ContactBook
+from src.domain.contact.name import Name
+from src.error.unreadable_import_file_error import UnreadableImportFileError
+from src.error.unsupported_import_format_error import UnsupportedImportFormatError
+from src.usecase.import_contacts import import_contacts
+
+
+def test_import_csv(tmp_path: Path) -> None:
+    """
+    Tests that the contacts of a CSV file are imported with all their fields.
+    """
+    path = tmp_path / "contacts.csv"
+    path.write_text(
+        "name,phones,emails,birthday\n"
+        "John,1234567890;0987654321,john@example.com,01.02.1990\n"
+        "Jane,,,\n",
+        encoding="utf-8",
+    )
+    contact_book = ContactBook()
+
+    report = import_contacts(contact_book, path)
+
+    assert report.imported == 2
+    assert report.skipped == []
+    john = contact_book.find(Name("John"))
+    assert [phone.value for phone in john.phones] == ["1234567890", "0987654321"]
+    assert [email.value for email in john.emails] == ["john@example.com"]
+    assert john.birthday.to_string() == "01.02.1990"
+    assert contact_book.find(Name("Jane")) is not None
+
+
+def test_import_jsonl(tmp_path: Path) -> None:
+    """
+    Tests that the contacts of a JSON Lines file are imported.
+    """
+    path = tmp_path / "contacts.jsonl"
+    path.write_text(
+        json.dumps({"name": "John", "phones": ["1234567890"], "emails": "john@example.com"}) + "\n"
+        + "\n"
+        + json.dumps({"name": "Jane", "birthday": "03.04.1985"}) + "\n",
+        encoding="utf-8",
+    )
+    contact_book = ContactBook()
+
+    report = import_contacts(contact_book, path, chunk_size=1)
+
+    assert report.imported == 2
+    assert contact_book.find(Name("John")).phones[0].value == "1234567890"
+    assert contact_book.find(Name("Jane")).birthday.to_string() == "03.04.1985"
+
+
+def test_import_skips_invalid_and_duplicate_rows(tmp_path: Path) -> None:
+    """
+    Tests that invalid rows and rows of existing contacts are skipped and
+    reported with their line numbers.
+    """
+    path = tmp_path / "contacts.jsonl"
+    path.write_text(
+        '{"name": "John"}\n'
+        "not json\n"
+        '{"name": "Jane", "phones": "123"}\n'
+        "[1, 2]\n"
+        '{"name": "john"}\n'
+        '{"phones": "1234567890"}\n',
+        encoding="utf-8",
+    )
+    contact_book = ContactBook()
+
+    report = import_contacts(contact_book, path)
+
+    assert report.imported == 1
+    assert [line for line, _ in report.skipped] == [2, 3, 4, 5, 6]
+    assert report.rows == 6
+    assert len(contact_book) == 1
+
+
+def test_import_unsupported_format(tmp_path: Path) -> None:
+    """
+    Tests that a file that is neither CSV nor JSON Lines is rejected.
+    """
+    path = tmp_path / "contacts.txt"
+    path.write_text("John\n", encoding="utf-8")
+
+    with pytest.raises(UnsupportedImportFormatError):
+        import_contacts(ContactBook(), path)
+
+
+def test_parallel_import_matches_serial_import(tmp_path: Path) -> None:
+    """
+    Tests that validating the rows in a pool of processes gives the same
+    contacts and the same report, in the same order, as a single process.
+    """
+    path = tmp_path / "contacts.csv"
+    rows = ["name,phones,emails,birthday"]
+    for number in range(50):
+        phone = f"{number:010d}" if number % 7 else "123"
+        rows.append(f"user{number},{phone},user{number}@example.com,01.02.1990")
+    rows.append("user1,,,")
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    serial_book, parallel_book = ContactBook(), ContactBook()
+    serial = import_contacts(serial_book, path, chunk_size=4)
+    parallel = import_contacts(parallel_book, path, chunk_size=4, workers=2)
+
+    assert parallel.imported == serial.imported
+    assert parallel.skipped == serial.skipped
+    assert [name.value for name in parallel_book] == [name.value for name in serial_book]
+
+
+@pytest.mark.parametrize("bad_row", [b"Bad,\xff\xfe\n", b'Big,"' + b"1" * 200_000 + b'"\n'])
+def test_import_is_rolled_back_when_file_cannot_be_read(tmp_path: Path, bad_row: bytes) -> None:
+    """
+    Tests that a file that is not valid UTF-8 or not valid CSV partway through
+    fails with the line number and leaves the contact book unchanged.
+    """
+    path = tmp_path / "contacts.csv"
+    rows = b"".join(b"Contact %d,,,\n" % number for number in range(2000))
+    path.write_bytes(b"name,phones,emails,birthday\n" + rows + bad_row)
+    contact_book = ContactBook()
+
+    with pytest.raises(UnreadableImportFileError) as error:
+        import_contacts(contact_book, path, chunk_size=100)
+
+    assert error.value.line == 2002
+    assert len(contact_book) == 0
+
+
+def test_csv_without_name_column_is_rejected(tmp_path: Path) -> None:
+    """
+    Tests that a CSV file whose header has no name column fails on the
+    header instead of skipping every row.
+    """
+    path = tmp_path / "contacts.csv"
+    path.write_text("full name,phones\nJohn,1234567890\n", encoding="utf-8")
+    contact_book = ContactBook()
+
+    with pytest.raises(UnreadableImportFileError) as error:
+        import_contacts(contact_book, path)
+
+    assert error.value.line == 1
+    assert "'name' column" in str(error.value)
+    assert len(contact_book) == 0
@@ -0,0 +1,44 @@
+"""
+Unit tests for the KeyIndex class.
+"""
+import pytest
+
+from src.util.key_index import KeyIndex
+
+
+@pytest.mark.parametrize("size", [3, KeyIndex.threshold + 5])
+def test_index_finds_items_by_key(size: int) -> None:
+    """
+    Tests that items are found by their normalized key, both in a short list
+    that is scanned and in a long list that keeps a set of keys.
+    """
+    items: list[str] = []
+    index: KeyIndex[str] = KeyIndex(str.casefold)
+    for number in range(size):
+        items.append(f"Item{number}")
+        index.added(items, items[-1])
+
+    assert index.index(items, "ITEM2") == 2
+    assert index.contains(items, "item0")
+    assert index.index(items, "missing") is None
+    assert not index.contains(items, "missing")
+
+
+def test_index_follows_removed_and_replaced_items() -> None:
+    """
+    Tests that removed and replaced items are no longer found once the set of
+    keys is kept.
+    """
+    items: list[str] = []
+    index: KeyIndex[str] = KeyIndex(str.casefold)
+    for number in range(KeyIndex.threshold + 2):
+        items.append(f"item{number}")
+        index.added(items, items[-1])
+
+    index.removed(items.pop(0))
+    items[0] = "new"
+    index.replaced("item1", "new")
+
+    assert not index.contains(items, "item0")
+    assert not index.contains(items, "item1")
+    assert index.index(items, "NEW") == 0
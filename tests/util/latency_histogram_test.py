@@ -0,0 +1,60 @@
+"""
+Unit tests for the LatencyHistogram class.
+"""
+import pytest
+
+from src.util.latency_histogram import LatencyHistogram
+
+
+def test_empty_histogram_reports_zeros() -> None:
+    """
+    Tests that a histogram without values reports zeros.
+    """
+    histogram = LatencyHistogram()
+
+    assert histogram.count == 0
+    assert histogram.mean == 0.0
+    assert histogram.percentile(99) == 0
+
+
+def test_small_values_are_exact() -> None:
+    """
+    Tests that values below the linear range are counted exactly.
+    """
+    histogram = LatencyHistogram()
+    for value in range(1, 11):
+        histogram.record(value)
+
+    assert histogram.count == 10
+    assert histogram.min == 1
+    assert histogram.max == 10
+    assert histogram.mean == 5.5
+    assert histogram.percentile(50) == 5
+    assert histogram.percentile(100) == 10
+
+
+@pytest.mark.parametrize("percent", [50, 90, 95, 99, 99.9])
+def test_percentiles_are_within_bucket_precision(percent: float) -> None:
+    """
+    Tests that the percentiles of a wide range of values are accurate to
+    within the relative precision of the buckets.
+    """
+    histogram = LatencyHistogram()
+    values = list(range(1, 100_001, 7))
+    for value in values:
+        histogram.record(value)
+
+    exact = values[max(0, int(len(values) * percent / 100 + 0.999999) - 1)]
+    precision = 2 / (1 << LatencyHistogram.precision_bits)
+    assert exact <= histogram.percentile(percent) <= exact * (1 + precision)
+
+
+def test_negative_values_count_as_zero() -> None:
+    """
+    Tests that a negative latency is recorded as 0.
+    """
+    histogram = LatencyHistogram()
+    histogram.record(-5)
+
+    assert histogram.min == 0
+    assert histogram.max == 0
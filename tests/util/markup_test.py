@@ -0,0 +1,31 @@
+"""
+Unit tests for the escape_markup and strip_markup functions.
+"""
+import pytest
+
+from src.util.markup import escape_markup, strip_markup
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("plain text", "plain text"),
+    ("[red][ERROR][/red]: failed", "[ERROR]: failed"),
+    ("[bold green]add-contact[/bold green]", "add-contact"),
+    ("<[blue]name[/blue]> [[blue]tags[/blue]]", "<name> [tags]"),
+    ("\\[red] is literal", "[red] is literal"),
+    ("\\\\[red]kept backslash", "\\kept backslash"),
+])
+def test_strip_markup(text: str, expected: str) -> None:
+    """
+    Tests that style tags are removed while bracketed text and escaped tags
+    are kept, as rich renders them.
+    """
+    assert strip_markup(text) == expected
+
+
+@pytest.mark.parametrize("text", ["[/x]", "[red]name[/red]", "\\[red]", "[ERROR] a\\", "plain"])
+def test_escaped_text_is_kept_by_strip_markup(text: str) -> None:
+    """
+    Tests that escaped text put into markup comes out of strip_markup as it
+    was.
+    """
+    assert strip_markup(f"[blue]{escape_markup(text)}[/blue]") == text
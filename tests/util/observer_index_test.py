@@ -0,0 +1,47 @@
+"""
+Unit tests for the ObserverIndex base class.
+"""
+from collections import UserList
+
+from src.util.observable import Observable, ObserverIndex
+
+
+class Items(UserList[str], Observable[str]):
+    """An observable list of strings."""
+
+    def __init__(self, *items: str):
+        super().__init__(items)
+        Observable.__init__(self)
+
+    def add(self, item: str) -> None:
+        """Adds an item and notifies the listeners."""
+        self.data.append(item)
+        self._notify(None, item)
+
+
+class ItemIndex(ObserverIndex[tuple[str, Items], str]):
+    """Records the items of the attached owners, which are (name, items) pairs."""
+
+    def __init__(self):
+        self.items: list[tuple[str, str]] = []
+        super().__init__(lambda owner: owner[0], lambda owner: owner[1],
+                         lambda item, owner: self.items.append((owner[0], item)),
+                         lambda item, owner: self.items.remove((owner[0], item)))
+
+
+def test_attached_owner_is_followed_until_detached() -> None:
+    """
+    Tests that the items of an attached owner are indexed, its changes are
+    followed, attaching it again does nothing, and detaching removes them.
+    """
+    owner = ("first", Items("a"))
+    index = ItemIndex()
+
+    index.attach(owner)
+    index.attach(owner)
+    owner[1].add("b")
+    assert index.items == [("first", "a"), ("first", "b")]
+
+    index.detach(owner)
+    owner[1].add("c")
+    assert index.items == []
@@ -0,0 +1,44 @@
+"""
+Unit tests for the capture_output context manager.
+"""
+import sys
+import threading
+
+from src.util.output_capture import capture_output
+
+
+def test_capture_collects_output_of_current_thread() -> None:
+    """
+    Tests that the printed text goes to the buffer and stdout is restored.
+    """
+    stdout = sys.stdout
+
+    with capture_output() as buffer:
+        print("hello")
+
+    assert buffer.getvalue() == "hello\n"
+    assert sys.stdout is stdout
+
+
+def test_threads_capture_their_own_output() -> None:
+    """
+    Tests that threads capturing at the same time do not mix their output.
+    """
+    barrier = threading.Barrier(4, timeout=5)
+    results: dict[int, str] = {}
+
+    def work(number: int) -> None:
+        with capture_output() as buffer:
+            barrier.wait()
+            for _ in range(100):
+                print(number)
+            barrier.wait()
+        results[number] = buffer.getvalue()
+
+    threads = [threading.Thread(target=work, args=(number,)) for number in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == {number: f"{number}\n" * 100 for number in range(4)}
@@ -0,0 +1,105 @@
+"""
+Unit tests for the ReadWriteLock class.
+"""
+import threading
+import time
+from typing import Callable
+
+from src.util.read_write_lock import ReadWriteLock
+
+
+def test_readers_share_the_lock() -> None:
+    """
+    Tests that several readers hold the lock at the same time.
+    """
+    lock = ReadWriteLock()
+    inside = threading.Barrier(3, timeout=5)
+
+    def reader() -> None:
+        with lock.read():
+            inside.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not inside.broken
+
+
+def wait_until(predicate: Callable[[], bool]) -> None:
+    """Waits until the predicate holds, failing after five seconds."""
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_writer_excludes_readers_and_writers() -> None:
+    """
+    Tests that no reader or other writer enters while a writer holds the lock.
+    """
+    lock = ReadWriteLock()
+    events: list[str] = []
+    first_in, release_first = threading.Event(), threading.Event()
+
+    def first_writer() -> None:
+        with lock.write():
+            events.append("first in")
+            first_in.set()
+            release_first.wait(timeout=5)
+            events.append("first out")
+
+    def second_writer() -> None:
+        with lock.write():
+            events.append("second in")
+            events.append("second out")
+
+    def reader() -> None:
+        with lock.read():
+            events.append("reader")
+
+    first = threading.Thread(target=first_writer)
+    first.start()
+    assert first_in.wait(timeout=5)
+    others = [threading.Thread(target=second_writer), threading.Thread(target=reader)]
+    for thread in others:
+        thread.start()
+    wait_until(lambda: lock.waiting_writers == 1 and lock.waiting_readers == 1)
+    release_first.set()
+    for thread in [first, *others]:
+        thread.join(timeout=5)
+
+    assert events[:2] == ["first in", "first out"]
+    assert events.index("second in") + 1 == events.index("second out")
+    assert "reader" in events
+
+
+def test_waiting_writer_goes_before_new_readers() -> None:
+    """
+    Tests that a reader arriving while a writer waits enters after the writer.
+    """
+    lock = ReadWriteLock()
+    events: list[str] = []
+    lock.acquire_read()
+
+    def writer() -> None:
+        with lock.write():
+            events.append("writer")
+
+    def reader() -> None:
+        with lock.read():
+            events.append("reader")
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    wait_until(lambda: lock.waiting_writers == 1)
+    reader_thread = threading.Thread(target=reader)
+    reader_thread.start()
+    wait_until(lambda: lock.waiting_readers == 1)
+    lock.release_read()
+    writer_thread.join(timeout=5)
+    reader_thread.join(timeout=5)
+
+    assert events == ["writer", "reader"]
@@ -0,0 +1,90 @@
+"""
+Unit tests for the TrigramIndex class.
+"""
+
+import pytest
+
+from src.util.trigram_index import TrigramIndex
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    ("john", ["john smith", "johnny depp"]),
+    ("smith", ["john smith"]),
+    ("ny d", ["johnny depp"]),
+    ("jo", ["john smith", "johnny depp"]),
+    ("h", ["john smith", "johnny depp"]),
+    ("alice", []),
+])
+def test_search_returns_keys_containing_pattern(pattern: str, expected: list[str]) -> None:
+    """
+    Tests that search returns every indexed key whose text contains the pattern,
+    for patterns both longer and shorter than a trigram.
+    """
+    index: TrigramIndex[str] = TrigramIndex()
+    index.add("john smith", "john smith")
+    index.add("johnny depp", "johnny depp")
+
+    assert index.search(pattern) == expected
+
+
+def test_search_verifies_candidates() -> None:
+    """
+    Tests that a text containing every trigram of the pattern, but not the
+    pattern itself, is not returned.
+    """
+    index: TrigramIndex[int] = TrigramIndex()
+    index.add(1, "abcxbcd")
+
+    assert index.search("abcd") == []
+
+
+def test_remove_drops_key_from_results() -> None:
+    """
+    Tests that a removed key is no longer returned by the search.
+    """
+    index: TrigramIndex[int] = TrigramIndex()
+    index.add(1, "john")
+    index.add(2, "johnny")
+
+    assert index.remove(1) is True
+    assert index.search("john") == [2]
+    assert 1 not in index
+    assert len(index) == 1
+
+
+def test_remove_unknown_key() -> None:
+    """
+    Tests that removing a key that is not indexed returns False.
+    """
+    index: TrigramIndex[int] = TrigramIndex()
+
+    assert index.remove(1) is False
+
+
+def test_add_existing_key_replaces_text() -> None:
+    """
+    Tests that adding an already indexed key replaces its previous text.
+    """
+    index: TrigramIndex[int] = TrigramIndex()
+    index.add(1, "john")
+    index.add(1, "alice")
+
+    assert index.search("john") == []
+    assert index.search("alice") == [1]
+    assert len(index) == 1
+
+
+def test_iter_search_is_lazy() -> None:
+    """
+    Tests that iter_search yields the first match without verifying the
+    remaining candidates, in the order the keys were indexed.
+    """
+    index: TrigramIndex[str] = TrigramIndex()
+    for number in range(1000):
+        index.add(f"name{number}", f"common name {number}")
+
+    results = index.iter_search("common")
+
+    assert next(results) == "name0"
+    assert next(results) == "name1"
+    assert list(index.iter_search("missing")) == []